@@ -4,6 +4,11 @@ modio is a python wrapper to interact with the mod.io API.
 
 from .client import Client
 from .objects import NewMod, NewModFile, Object, Filter
+from modio.ratelimit import RateLimiter
+from modio.retry import RetryPolicy
+from modio.cache import Cache, MemoryCache, SQLiteCache
+from .transport import Transport, AiohttpTransport, MemoryTransport
+from modio.metrics import Metrics, RequestInfo
 from .enums import *
 from .errors import *
 
@@ -1,13 +1,19 @@
-import aiohttp
 import asyncio
+import copy
+import functools
+import time
 from typing import Union
 
 from .game import Game
 from .mod import Mod
 from .errors import *
 from .objects import *
+from .utils import _rewind, _paginate, _chunk_ids, _value
+from modio.core import BaseClient, MISS
+from modio.metrics import RequestInfo
+from .transport import AiohttpTransport
 
-class Client:
+class Client(BaseClient):
     """Represents the base-level client to make requests to the mod.io API with. Upon
     initializiation the Client will confirm the api key and O Auth 2 token.
 
@@ -31,6 +37,46 @@ class Client:
     version : Optional[str]
         An optional keyword argument to allow you to pick a specific version of the API to query,
         usually you shouldn't need to change this. Default is the latest supported version.
+    ratelimit : Optional[RateLimiter]
+        The rate limiter pacing the requests of this client. Clients using the same API key/access
+        token can share one to draw from the same budget. Default is a new RateLimiter.
+    retry : Optional[RetryPolicy]
+        The policy deciding which requests rejected with a 429 or a transient server error
+        are sent again and how long to wait between attempts. Default is a RetryPolicy with
+        its default settings, pass `RetryPolicy(max_attempts=1)` to disable retrying.
+    cache : Optional[Cache]
+        A cache in which the responses to GET requests are stored, e.g. a :class:`MemoryCache`.
+        Default is None, nothing is cached.
+    transport : Optional[Transport]
+        The transport sending the requests, e.g. a :class:`MemoryTransport`. Default is an
+        :class:`AiohttpTransport`.
+    metrics : Optional[Metrics]
+        Where the counters and latency histograms of the requests are recorded and the hooks
+        called at each of their stages are registered. Clients can share one to aggregate
+        their metrics. Default is a new Metrics.
+    lazy : Optional[bool]
+        Whether the games, mods, users and mod files returned are lazy: they keep their JSON
+        and only build each attribute (nested objects, enums, datetimes...) the first time
+        it is read. Faster when only a few attributes of each result are used, e.g. the ids
+        and names of a page of mods, but they take more memory. Default is False.
+    raw : Optional[bool]
+        Whether the results are returned as the JSON of the API instead of models, e.g. for
+        bulk exports which only need the data. Lists of results are still returned as a
+        Returned with the Pagination of the page. Games and mods being JSON too, see
+        `factory` to keep the methods of some models. Default is False.
+    factory : Optional[Callable[..., Any]]
+        A function called with the model class, the JSON and the keyword arguments the
+        model would be built with (the client...) for each result, the client returns what
+        it returns instead of the model. It can for example build the games and return the
+        JSON of their mods: `lambda model, data, **kwargs: model(**data, **kwargs) if model is
+        Game else data`. The keyset walks of the iter methods and the methods getting
+        results by ids read the ids of what it returns, which must be dicts or have the
+        attributes of the models. Results which are not models, e.g. the tags of a mod, are
+        passed with the function building them and returned in a list instead of a dict.
+        Cannot be used along with `raw`. Default is None.
+    json_loads : Optional[Callable[[bytes], Any]]
+        The function decoding the JSON bodies of the responses from bytes. Default is
+        orjson.loads if orjson is installed, otherwise json.loads.
     loop : Optional[asyncio.EventLoop]
         |async| An optional keyword argument allowing you to pass a loop, if no loop is passed the Client
         will get the current event loop. 
@@ -40,153 +86,188 @@ class Client:
     rate_limit : int
         Number of requests that can be made using the supplied API Key/access token.
     rate_remain : int
-        Number of requests remaining. Once this number hits 0 the requests will become 
-        rejected and the library will sleep until the limit resets then raise 429 TooManyRequests.
+        Number of requests remaining. Once this number hits 0 the requests are queued
+        by the library until the limit resets instead of being rejected with a 429 TooManyRequests.
     rate_retry : int
         Number of seconds until the rate limits are reset for this API Key/access token.
         Is 0 until the rate_remain is 0 and becomes 0 again once the rate limit is reset. 
+    ratelimit : RateLimiter
+        The rate limiter pacing the requests of this client.
+    retry : RetryPolicy
+        The retry policy of this client.
+    retries : int
+        Number of requests which have been sent again after failing.
+    retry_time : float
+        Number of seconds lost to retries, from the start of each failed attempt until the
+        request is sent again.
+    cache : Cache
+        The cache of the GET responses, None if caching is disabled.
+    coalesced : int
+        Number of GET requests which were not sent because an identical one was already
+        in flight, their callers shared its response instead.
+    transport : Transport
+        The transport sending every request. Closed by :func:`close`.
+    metrics : Metrics
+        The metrics of the requests of this client, see :func:`Metrics.snapshot` and
+        :func:`Metrics.prometheus`.
+    lazy : bool
+        Whether the results are built lazily.
+    raw : bool
+        Whether the results are returned as JSON.
+    factory : Callable[..., Any]
+        The function building the results, None if the models are built.
+    json_loads : Callable[[bytes], Any]
+        The function decoding the JSON bodies of the responses.
+
+    Methods of the models whose request is answered with 204 No Content, such as
+    :func:`Mod.delete` or :func:`Comment.delete`, return None.
     """
+    _returned = Returned
+    _pagination = Pagination
 
-    def __init__(self, *, api_key = None, auth = None, lang = "en", version = "v1", test = False, loop = asyncio.get_event_loop()):
-        self.api_key = api_key
-        self.access_token = auth
-        self.lang = lang
-        self.version = version
-        self.rate_limit = None
-        self.rate_remain = None
-        self.rate_retry = 0
-        self.test = test
+    def __init__(self, *, api_key = None, auth = None, lang = "en", version = "v1", test = False, ratelimit = None, retry = None, cache = None, transport = None, metrics = None, lazy = False, raw = False, factory = None, json_loads = None, loop = asyncio.get_event_loop()):
+        super().__init__(api_key=api_key, auth=auth, lang=lang, version=version, test=test, ratelimit=ratelimit, retry=retry, cache=cache, metrics=metrics, lazy=lazy, raw=raw, factory=factory, json_loads=json_loads)
         self.loop = loop
-        self.session = aiohttp.ClientSession(loop=self.loop)
-
-    @property
-    def _base_path(self):
-        if self.test:
-            return f"https://api.test.mod.io/{self.version}"
-        else:
-            return f"https://api.mod.io/{self.version}"
-
-    def __repr__(self):
-        return f"<Client rate_limit={self.rate_limit} rate_retry={self.rate_retry} rate_remain={self.rate_remain}>"
+        self.transport = transport or AiohttpTransport(loop=self.loop)
+        self._refreshes = {}
+        self._flights = {}
 
     async def close(self):
         """This function is used to clean up the client in order to close the application that it uses gracefully.
-        At the moment it is only used to close the client's Session.
+        It cancels the background refreshes of the cache and closes the client's transport.
 
         This function is a coroutine"""
-        await self.session.close()
-    
-    async def _error_check(self, r):
-        """Updates the rate-limit attributes and check validity of the request."""
-        self.rate_limit = r.headers.get("X-RateLimit-Limit", self.rate_limit)
-        self.rate_remain = r.headers.get("X-RateLimit-Remaining", self.rate_remain)
-        self.rate_retry = r.headers.get("X-Ratelimit-RetryAfter", 0)
-
-        if r.status == 204:
-            return r
-
-        request_json = await r.json()
-        if "error" in request_json:
-            code = request_json["error"]["code"]
-            msg = request_json["error"]["message"]
-            if code == 400:
-                raise BadRequest(msg)
-            elif code == 401:
-                raise Unauthorized(msg)
-            elif code == 403:
-                raise Forbidden(msg)
-            elif code == 404:
-                raise NotFound(msg)
-            elif code == 405:
-                raise MethodNotAllowed(msg)
-            elif code == 406:
-                raise NotAcceptable(msg)
-            elif code == 410:
-                raise Gone(msg)
-            elif code == 422:
-                if "errors" in request_json["error"]:
-                    errors = request_json["error"]["errors"]
-                else:
-                    errors = None
-                raise UnprocessableEntity(msg, errors)
-            elif code == 429:
-                raise TooManyRequests(msg, self.rate_retry)
-            else:
-                raise modioException(msg)
-        else:
-            return request_json
-
-    def _define_headers(self, h_type):
-        if h_type == 0:
-            #regular O auth 2 header when submitting data
-            headers = {
-                'Authorization': 'Bearer ' + self.access_token,
-                'Content-Type': 'application/x-www-form-urlencoded',
-                'Accept': 'application/json',
-                'Accept-Language': self.lang
-            }
-        elif h_type == 1:
-            #o auth 2 header for submitting multipart/data, had to remove Content-Type
-            #because it is already added by the requests lib when defining a files parameter
-            headers = {
-                'Authorization': 'Bearer ' + self.access_token,
-                'Accept': 'application/json',
-                'Accept-Language': self.lang
-            }
-        elif h_type == 2:
-            #header to use when making calls using the api key, the key itself is added in
-            #the parameters in the methods below
-            headers = {
-                'Accept': 'application/json',
-                'Accept-Language': self.lang,
-                'Content-Type': 'application/x-www-form-urlencoded'
-            }
-
-        return headers
+        for task in list(self._refreshes.values()):
+            task.cancel()
 
-    async def _get_request(self, url, *, h_type=0, **fields):
-        f = fields.pop("filter", None)
-        f = (f if f else Filter()).__dict__.copy()
-        extra = {**fields, **f}
+        await self.transport.close()
 
-        if not self.access_token:
-            extra["api_key"] = self.api_key
-            h_type = 2
+    @property
+    def session(self):
+        """The aiohttp.ClientSession of the transport, None if the transport does not use
+        one such as a :class:`MemoryTransport`."""
+        return getattr(self.transport, "session", None)
+    
+    async def _request(self, method, url, *, info, h_type=0, cache_key=None, entry=None, **fields):
+        try:
+            result = await self._attempts(method, url, info, h_type, cache_key, entry, fields)
+        except BaseException as e:
+            self.metrics._done(info, e)
+            raise
+
+        self.metrics._done(info)
+        return result
+
+    async def _attempts(self, method, url, info, h_type, cache_key, entry, fields):
+        metrics = self.metrics
+        on_headers = functools.partial(metrics._headers, info)
+        failed_at = None
+        while True:
+            waited = await self.ratelimit.acquire_async()
+            if failed_at is not None:
+                self.retries += 1
+                self.retry_time += time.monotonic() - failed_at
+
+            metrics._send(info, waited)
+            start = time.monotonic()
+            try:
+                r = await self.transport.send(method, self._base_path + url, headers=self._request_headers(h_type, entry), on_headers=on_headers, **fields)
+            except BaseException:
+                #cancelled and interrupted requests must release their reservation too
+                self.ratelimit.update()
+                raise
+
+            if info.status is None:
+                metrics._headers(info, r.status)
+
+            metrics._body(info, len(r.body))
+            self.ratelimit.update(r.headers, r.status)
+            if not self.retry.should_retry(method, r.status, info.attempt):
+                return self._response(url, r.status, r.headers, r.body, info, cache_key, entry)
+
+            #429s are held back by the rate limiter until the limit resets instead of backing off
+            failed_at = start
+            if r.status != 429:
+                await asyncio.sleep(self.retry.delay(info.attempt))
+
+            info.attempt += 1
+            _rewind(fields.get("files"))
+
+    def _revalidate(self, key, url, h_type, extra, entry):
+        if key not in self._refreshes:
+            self._refreshes[key] = asyncio.ensure_future(self._refresh(key, url, h_type, extra, entry), loop=self.loop)
+
+    async def _refresh(self, key, url, h_type, extra, entry):
+        try:
+            await self._request("GET", url, info=RequestInfo("GET", url), h_type=h_type, cache_key=key, entry=entry, params=extra)
+        except Exception:
+            #nobody is waiting for the result, the entry is served until it is refreshed or too stale
+            pass
+        finally:
+            del self._refreshes[key]
+
+    def _invalidate(self, url):
+        #the request may have changed the resource even if it failed
+        if self.cache is not None:
+            self.cache.invalidate(url)
+
+        #requests sent before the write may return outdated data, later ones must not join them
+        self._flights.clear()
 
-        async with self.session.get(self._base_path + url, headers=self._define_headers(h_type), params=extra) as r:
-            return await self._error_check(r)
+    async def _get_request(self, url, *, h_type=0, **fields):
+        info = self._start("GET", url)
+        h_type, extra = self._get_params(h_type, fields)
+        key, entry, result = self._lookup(url, h_type, extra, info)
+        if result is not MISS:
+            self.metrics._done(info)
+            return result
+
+        #identical GETs in flight at the same time share a single request
+        flight = self._flight(url, extra, key)
+        future = self._flights.get(flight)
+        if future is not None:
+            self.coalesced += 1
+            self.metrics._coalesced(info)
+            try:
+                #every caller builds its own models, they must not share the decoded JSON
+                result = copy.deepcopy(await asyncio.shield(future))
+            except BaseException as e:
+                self.metrics._done(info, e)
+                raise
+
+            self.metrics._done(info)
+            return result
+
+        future = asyncio.ensure_future(self._request("GET", url, info=info, h_type=h_type, cache_key=key, entry=entry, params=extra), loop=self.loop)
+        self._flights[flight] = future
+        future.add_done_callback(lambda f: self._land(flight, f))
+        return await asyncio.shield(future)
+
+    def _land(self, flight, future):
+        if self._flights.get(flight) is future:
+            del self._flights[flight]
+
+        if not future.cancelled():
+            #avoid "exception never retrieved" warnings if every caller was cancelled
+            future.exception()
 
     async def _post_request(self, url, *, h_type=0, **fields):
-        files = fields.pop("files", {})
-        data = fields.pop("data", {})
-
-        form = aiohttp.FormData()
-        for key, value in data.items():
-            if value is None:
-                continue
-
-            form.add_field(key, str(value))
-
-        for key, value in files.items():
-            if value is None:
-                continue
-
-            if isinstance(value, tuple):
-                form.add_field(key, value[1], filename=value[0], content_type="multipart/form-data")
-            else:
-                form.add_field(key, value, content_type="multipart/form-data")
-
-
-        async with self.session.post(self._base_path + url, headers=self._define_headers(h_type), data=form) as r:
-            return await self._error_check(r)
+        try:
+            return await self._request("POST", url, info=self._start("POST", url, fields.get("data")), h_type=h_type, **fields)
+        finally:
+            self._invalidate(url)
 
     async def _put_request(self, url, *, h_type=0, **fields):
-        async with self.session.put(self._base_path + url, headers=self._define_headers(h_type), **fields) as r:
-            return await self._error_check(r)
+        try:
+            return await self._request("PUT", url, info=self._start("PUT", url, fields.get("data")), h_type=h_type, **fields)
+        finally:
+            self._invalidate(url)
 
     async def _delete_request(self, url, *, h_type=0, **fields):
-        async with self.session.delete(self._base_path + url, headers=self._define_headers(h_type), **fields) as r:
-            return await self._error_check(r)
+        try:
+            return await self._request("DELETE", url, info=self._start("DELETE", url, fields.get("data")), h_type=h_type, **fields)
+        finally:
+            self._invalidate(url)
 
     async def get_game(self, id):
         """Queries the mod.io API for the given game ID and if found returns it as a 
@@ -211,7 +292,7 @@ class Client:
         
         """
         game_json = await self._get_request(f'/games/{id}')
-        return Game(client=self, **game_json)
+        return self._model(Game, game_json, client=self)
 
     async def get_games(self, *, filter=None):
         """Gets all the games available on mod.io. Takes filtering arguments. Returns a 
@@ -231,7 +312,37 @@ class Client:
             The results and pagination tuple from this request    
         """
         game_json = await self._get_request('/games', filter=filter)
-        return Returned([Game(client=self, **game) for game in game_json["data"]], Pagination(**game_json))
+        return self._models(Game, game_json, client=self)
+
+    def iter_games(self, *, filter=None, keyset=False, concurrency=4):
+        """Iterates over all the games available on mod.io, lazily fetching 
+        the pages. Once the first page has been received up to `concurrency` of the following pages 
+        are requested at once and results are yielded in order. Pages are as large as the API 
+        allows unless the filter sets a limit. |filterable|
+
+        |aiter|
+
+        Parameters
+        -----------
+        filter : Optional[Filter]
+            A instance of Filter to be used for filtering and sorting results, its offset 
+            is used as the starting point.
+        keyset : Optional[bool]
+            Walk the results sorted by id with a cursor on the last id seen instead of an 
+            offset. Every result is returned exactly once even if results are added or removed 
+            during the walk and deep pages are as fast as the first ones. Overrides the sorting 
+            and offset of the filter. Pages are then requested one at a time.
+        concurrency : Optional[int]
+            |async| Maximum number of pages requested at once, at most `concurrency` + 1 pages 
+            are held in memory. Requests still go through the client's rate limiter. Default 
+            is 4, it must be at least 1.
+
+        Yields
+        -------
+        Game
+            The games available on mod.io
+        """
+        return _paginate(self.get_games, filter or Filter(), concurrency, "id" if keyset else None)
 
     async def get_user(self, id):
         """Gets a user with the specified ID.
@@ -255,7 +366,30 @@ class Client:
 
         """
         user_json = await self._get_request(f"/users/{id}")
-        return User(client=self, **user_json)
+        return self._model(User, user_json, client=self)
+
+    async def get_users_by_ids(self, ids):
+        """Gets several users by their IDs. Rather than requesting each user, the IDs 
+        are split into chunks which fit in a single `id-in` filter and the chunks are requested 
+        concurrently, so thousands of users only take tens of requests.
+
+        |coro|
+
+        Parameters
+        -----------
+        ids : Iterable[int]
+            The IDs of the users to get, duplicates are ignored.
+
+        Returns
+        --------
+        Fetched[Dict[int, User], List[int]]
+            The users found keyed by ID and the IDs for which no user was found
+        """
+        ids = list(dict.fromkeys(ids))
+        pages = await asyncio.gather(*[self.get_users(filter=Filter().values_in(id=chunk).limit(len(chunk))) for chunk in _chunk_ids(ids)])
+        results = {_value(user, "id", "id") : user for page in pages for user in page.results}
+
+        return Fetched(results, [id for id in ids if id not in results])
 
     async def get_users(self, *, filter=None):
         """Gets all the users availaible on mod.io. Takes filtering arguments. Returns 
@@ -276,8 +410,38 @@ class Client:
                
         """
         user_json = await self._get_request("/users", filter=filter)
-        return Returned([User(client=self, **user) for user in user_json["data"]], Pagination(**user_json))
+        return self._models(User, user_json, client=self)
     
+    def iter_users(self, *, filter=None, keyset=False, concurrency=4):
+        """Iterates over all the users available on mod.io, lazily fetching 
+        the pages. Once the first page has been received up to `concurrency` of the following pages 
+        are requested at once and results are yielded in order. Pages are as large as the API 
+        allows unless the filter sets a limit. |filterable|
+
+        |aiter|
+
+        Parameters
+        -----------
+        filter : Optional[Filter]
+            A instance of Filter to be used for filtering and sorting results, its offset 
+            is used as the starting point.
+        keyset : Optional[bool]
+            Walk the results sorted by id with a cursor on the last id seen instead of an 
+            offset. Every result is returned exactly once even if results are added or removed 
+            during the walk and deep pages are as fast as the first ones. Overrides the sorting 
+            and offset of the filter. Pages are then requested one at a time.
+        concurrency : Optional[int]
+            |async| Maximum number of pages requested at once, at most `concurrency` + 1 pages 
+            are held in memory. Requests still go through the client's rate limiter. Default 
+            is 4, it must be at least 1.
+
+        Yields
+        -------
+        User
+            The users available on mod.io
+        """
+        return _paginate(self.get_users, filter or Filter(), concurrency, "id" if keyset else None)
+
     async def get_my_user(self):
         """Gets the authenticated user's details (aka the user who created the API key/access token)
 
@@ -295,7 +459,7 @@ class Client:
         
         """
         me_json = await self._get_request("/me")
-        return User(client=self, **me_json)
+        return self._model(User, me_json, client=self)
 
     async def get_my_subs(self, *, filter=None):
         """Gets all the mods the authenticated user is subscribed to.  Takes
@@ -320,7 +484,37 @@ class Client:
             The results and pagination tuple from this request
         """
         mod_json = await self._get_request("/me/subscribed", filter=filter)
-        return Returned([Mod(client=self, **mod) for mod in mod_json["data"]], Pagination(**mod_json))
+        return self._models(Mod, mod_json, client=self)
+
+    def iter_my_subs(self, *, filter=None, keyset=False, concurrency=4):
+        """Iterates over all the mods the authenticated user is subscribed to, lazily fetching 
+        the pages. Once the first page has been received up to `concurrency` of the following pages 
+        are requested at once and results are yielded in order. Pages are as large as the API 
+        allows unless the filter sets a limit. |filterable|
+
+        |aiter|
+
+        Parameters
+        -----------
+        filter : Optional[Filter]
+            A instance of Filter to be used for filtering and sorting results, its offset 
+            is used as the starting point.
+        keyset : Optional[bool]
+            Walk the results sorted by id with a cursor on the last id seen instead of an 
+            offset. Every result is returned exactly once even if results are added or removed 
+            during the walk and deep pages are as fast as the first ones. Overrides the sorting 
+            and offset of the filter. Pages are then requested one at a time.
+        concurrency : Optional[int]
+            |async| Maximum number of pages requested at once, at most `concurrency` + 1 pages 
+            are held in memory. Requests still go through the client's rate limiter. Default 
+            is 4, it must be at least 1.
+
+        Yields
+        -------
+        Mod
+            The mods the user is subscribed to
+        """
+        return _paginate(self.get_my_subs, filter or Filter(), concurrency, "id" if keyset else None)
 
     async def get_my_events(self, *, filter=None):
         """Get events that have been fired specifically for the authenticated user. Takes
@@ -340,7 +534,37 @@ class Client:
             The results and pagination tuple from this request
         """
         events_json = await self._get_request("/me/events", filter=filter)
-        return Returned([Event(**event) for event in events_json["data"]], Pagination(**events_json))
+        return self._models(Event, events_json)
+
+    def iter_my_events(self, *, filter=None, keyset=False, concurrency=4):
+        """Iterates over the events that have been fired specifically for the authenticated user, lazily fetching 
+        the pages. Once the first page has been received up to `concurrency` of the following pages 
+        are requested at once and results are yielded in order. Pages are as large as the API 
+        allows unless the filter sets a limit. |filterable|
+
+        |aiter|
+
+        Parameters
+        -----------
+        filter : Optional[Filter]
+            A instance of Filter to be used for filtering and sorting results, its offset 
+            is used as the starting point.
+        keyset : Optional[bool]
+            Walk the results sorted by id with a cursor on the last id seen instead of an 
+            offset. Every result is returned exactly once even if results are added or removed 
+            during the walk and deep pages are as fast as the first ones. Overrides the sorting 
+            and offset of the filter. Pages are then requested one at a time.
+        concurrency : Optional[int]
+            |async| Maximum number of pages requested at once, at most `concurrency` + 1 pages 
+            are held in memory. Requests still go through the client's rate limiter. Default 
+            is 4, it must be at least 1.
+
+        Yields
+        -------
+        Event
+            The events of the user
+        """
+        return _paginate(self.get_my_events, filter or Filter(), concurrency, "id" if keyset else None)
 
     async def get_my_games(self, filter=None):
         """Get all the games the authenticated user added or is a team member of. Takes
@@ -365,7 +589,37 @@ class Client:
             The results and pagination tuple from this request
         """
         game_json = await self._get_request("/me/games", filter=filter)
-        return Returned([Game(client=self, **game) for game in game_json["data"]], Pagination(**game_json))
+        return self._models(Game, game_json, client=self)
+
+    def iter_my_games(self, *, filter=None, keyset=False, concurrency=4):
+        """Iterates over all the games the authenticated user added or is a team member of, lazily fetching 
+        the pages. Once the first page has been received up to `concurrency` of the following pages 
+        are requested at once and results are yielded in order. Pages are as large as the API 
+        allows unless the filter sets a limit. |filterable|
+
+        |aiter|
+
+        Parameters
+        -----------
+        filter : Optional[Filter]
+            A instance of Filter to be used for filtering and sorting results, its offset 
+            is used as the starting point.
+        keyset : Optional[bool]
+            Walk the results sorted by id with a cursor on the last id seen instead of an 
+            offset. Every result is returned exactly once even if results are added or removed 
+            during the walk and deep pages are as fast as the first ones. Overrides the sorting 
+            and offset of the filter. Pages are then requested one at a time.
+        concurrency : Optional[int]
+            |async| Maximum number of pages requested at once, at most `concurrency` + 1 pages 
+            are held in memory. Requests still go through the client's rate limiter. Default 
+            is 4, it must be at least 1.
+
+        Yields
+        -------
+        Game
+            The games of the user
+        """
+        return _paginate(self.get_my_games, filter or Filter(), concurrency, "id" if keyset else None)
 
     async def get_my_mods(self, *, filter=None):
         """Get all the mods the authenticated user added or is a team member of. Takes
@@ -390,7 +644,37 @@ class Client:
             The results and pagination tuple from this request
         """
         mod_json = await self._get_request("/me/mods", filter=filter)
-        return Returned([Mod(client=self, **mod) for mod in mod_json["data"]], Pagination(**mod_json))
+        return self._models(Mod, mod_json, client=self)
+
+    def iter_my_mods(self, *, filter=None, keyset=False, concurrency=4):
+        """Iterates over all the mods the authenticated user added or is a team member of, lazily fetching 
+        the pages. Once the first page has been received up to `concurrency` of the following pages 
+        are requested at once and results are yielded in order. Pages are as large as the API 
+        allows unless the filter sets a limit. |filterable|
+
+        |aiter|
+
+        Parameters
+        -----------
+        filter : Optional[Filter]
+            A instance of Filter to be used for filtering and sorting results, its offset 
+            is used as the starting point.
+        keyset : Optional[bool]
+            Walk the results sorted by id with a cursor on the last id seen instead of an 
+            offset. Every result is returned exactly once even if results are added or removed 
+            during the walk and deep pages are as fast as the first ones. Overrides the sorting 
+            and offset of the filter. Pages are then requested one at a time.
+        concurrency : Optional[int]
+            |async| Maximum number of pages requested at once, at most `concurrency` + 1 pages 
+            are held in memory. Requests still go through the client's rate limiter. Default 
+            is 4, it must be at least 1.
+
+        Yields
+        -------
+        Mod
+            The mods of the user
+        """
+        return _paginate(self.get_my_mods, filter or Filter(), concurrency, "id" if keyset else None)
 
     async def get_my_modfiles(self, *, filter=None):
         """Get all the mods the authenticated user uploaded. The returned modfile objects cannot be
@@ -416,7 +700,37 @@ class Client:
             The results and pagination tuple from this request
         """
         files_json = await self._get_request("/me/files", filter=filter)
-        return Returned([ModFile(**file, client=self) for file in files_json["data"]], Pagination(**files_json))
+        return self._models(ModFile, files_json, client=self)
+
+    def iter_my_modfiles(self, *, filter=None, keyset=False, concurrency=4):
+        """Iterates over all the modfiles the authenticated user uploaded, lazily fetching 
+        the pages. Once the first page has been received up to `concurrency` of the following pages 
+        are requested at once and results are yielded in order. Pages are as large as the API 
+        allows unless the filter sets a limit. |filterable|
+
+        |aiter|
+
+        Parameters
+        -----------
+        filter : Optional[Filter]
+            A instance of Filter to be used for filtering and sorting results, its offset 
+            is used as the starting point.
+        keyset : Optional[bool]
+            Walk the results sorted by id with a cursor on the last id seen instead of an 
+            offset. Every result is returned exactly once even if results are added or removed 
+            during the walk and deep pages are as fast as the first ones. Overrides the sorting 
+            and offset of the filter. Pages are then requested one at a time.
+        concurrency : Optional[int]
+            |async| Maximum number of pages requested at once, at most `concurrency` + 1 pages 
+            are held in memory. Requests still go through the client's rate limiter. Default 
+            is 4, it must be at least 1.
+
+        Yields
+        -------
+        ModFile
+            The modfiles of the user
+        """
+        return _paginate(self.get_my_modfiles, filter or Filter(), concurrency, "id" if keyset else None)
 
     async def get_my_ratings(self, *, filter=None):
         """Get all the ratings the authentitated user has submitted. Takes filtering arguments. Returns a named
@@ -442,8 +756,33 @@ class Client:
         """
 
         ratings = await self._get_request("/me/ratings", filter=filter)
-        return Returned([Rating(**rating, client=self) for rating in ratings["data"]], Pagination(**ratings))
+        return self._models(Rating, ratings, client=self)
         
+    def iter_my_ratings(self, *, filter=None, concurrency=4):
+        """Iterates over all the ratings the authenticated user has submitted, lazily fetching 
+        the pages. Once the first page has been received up to `concurrency` of the following pages 
+        are requested at once and results are yielded in order. Pages are as large as the API 
+        allows unless the filter sets a limit. |filterable|
+
+        |aiter|
+
+        Parameters
+        -----------
+        filter : Optional[Filter]
+            A instance of Filter to be used for filtering and sorting results, its offset 
+            is used as the starting point.
+        concurrency : Optional[int]
+            |async| Maximum number of pages requested at once, at most `concurrency` + 1 pages 
+            are held in memory. Requests still go through the client's rate limiter. Default 
+            is 4, it must be at least 1.
+
+        Yields
+        -------
+        Rating
+            The ratings of the user
+        """
+        return _paginate(self.get_my_ratings, filter or Filter(), concurrency)
+
     async def email_request(self, email):
         """Posts an email request for an OAuth2 token. A code will be sent to the given email address
         which can then be entered into :func:`email_exchange`.
@@ -458,7 +797,7 @@ class Client:
         """
 
         r = await self._post_request("/oauth/emailrequest", params={'email' : email, 'api_key': self.api_key}, h_type = 2)
-        return Message(**r)
+        return self._model(Message, r)
 
     async def email_exchange(self, code):
         """Exchanges the given 5-digit code for an OAuth2 token.
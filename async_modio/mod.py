@@ -1,9 +1,12 @@
 import time
 
 from .objects import *
+from modio.lazy import lazy
+from modio.schema import model, MOD, _tag, _dependency, _metadata, _grouped
 from .errors import modioException, BadRequest
-from .utils import _convert_date, _clean_and_convert
+from .utils import _clean_and_convert, _paginate
 
+@model(MOD)
 class Mod:
     """Represent a modio mod object.
 
@@ -79,33 +82,10 @@ class Mod:
         subscribers 
 
     """
-    def __init__(self, **attrs):
-        self.id = attrs.pop("id")
-        self.status = Status(attrs.pop("status"))
-        self.visible = Visibility(attrs.pop("visible"))
-        self.game = attrs.pop("game_id")
-        self.date = _convert_date(attrs.pop("date_added"))
-        self.updated = _convert_date(attrs.pop("date_updated"))
-        self.live = _convert_date(attrs.pop("date_live"))
-        self.logo = Image(**attrs.pop("logo"))
-        self.homepage = attrs.pop("homepage_url", None)
-        self.name = attrs.pop("name")
-        self.name_id = attrs.pop("name_id")
-        self.summary = attrs.pop("summary")
-        self.description = attrs.pop("description")
-        self.metadata = attrs.pop("metadata_blob")
-        self.profile = attrs.pop("profile_url")
-        self.media = ModMedia(**attrs.pop("media"))
-        self.maturity = Maturity(attrs.pop("maturity_option"))
-        self.stats = Stats(**attrs.pop("stats"))
-        self.tags = {tag["name"] : tag["date_added"] for tag in attrs.pop("tags", [])}
-        self._client = attrs.pop("client")
-        self._file = attrs.pop("modfile", None)
-        self._kvp_raw = attrs.pop("metadata_kvp")
-        self.file =  ModFile(**self._file, game_id=self.game, client=self._client) if self._file else None 
-        self.submitter = User(client=self._client, **attrs.pop("submitted_by"))
-        self.plaintext = attrs.pop("description_plaintext")
-
+    __slots__ = ("id", "status", "visible", "game", "date", "updated", "live", "logo", "homepage",
+                 "name", "name_id", "summary", "description", "metadata", "profile", "media",
+                 "maturity", "stats", "tags", "_client", "_file", "_kvp_raw", "file", "submitter",
+                 "plaintext")
 
     @property
     def kvp(self):
@@ -142,7 +122,7 @@ class Mod:
             The found modfile
         """
         file_json = await self._client._get_request(f"/games/{self.game}/mods/{self.id}/files/{id}")
-        return ModFile(**file_json, game_id=self.game, client=self._client)
+        return self._client._model(ModFile, file_json, game_id=self.game, client=self._client)
 
     async def get_files(self, *, filter=None):
         """Get all mod files for this mod. Takes filtering arguments. Returns a named tuple
@@ -162,7 +142,37 @@ class Mod:
             The results and pagination tuple from this request
         """
         files_json = await self._client._get_request(f"/games/{self.game}/mods/{self.id}/files", filter=filter)
-        return Returned([ModFile(**file, game_id=self.game, client=self._client) for file in files_json["data"]], Pagination(**files_json))
+        return self._client._models(ModFile, files_json, game_id=self.game, client=self._client)
+
+    def iter_files(self, *, filter=None, keyset=False, concurrency=4):
+        """Iterates over all the mod files of this mod, lazily fetching 
+        the pages. Once the first page has been received up to `concurrency` of the following pages 
+        are requested at once and results are yielded in order. Pages are as large as the API 
+        allows unless the filter sets a limit. |filterable|
+
+        |aiter|
+
+        Parameters
+        -----------
+        filter : Optional[Filter]
+            A instance of Filter to be used for filtering and sorting results, its offset 
+            is used as the starting point.
+        keyset : Optional[bool]
+            Walk the results sorted by id with a cursor on the last id seen instead of an 
+            offset. Every result is returned exactly once even if results are added or removed 
+            during the walk and deep pages are as fast as the first ones. Overrides the sorting 
+            and offset of the filter. Pages are then requested one at a time.
+        concurrency : Optional[int]
+            |async| Maximum number of pages requested at once, at most `concurrency` + 1 pages 
+            are held in memory. Requests still go through the client's rate limiter. Default 
+            is 4, it must be at least 1.
+
+        Yields
+        -------
+        ModFile
+            The files of the mod
+        """
+        return _paginate(self.get_files, filter or Filter(), concurrency, "id" if keyset else None)
 
     async def get_events(self, *, filter=None):
         """Get all events for that mod sorted by latest. Takes filtering arguments. Returns ,
@@ -183,7 +193,37 @@ class Mod:
 
         """
         event_json = await self._client._get_request(f"/games/{self.game}/mods/{self.id}/events", filter=filter)
-        return Returned([Event(**event) for event in event_json["data"]], Pagination(**event_json))
+        return self._client._models(Event, event_json)
+
+    def iter_events(self, *, filter=None, keyset=False, concurrency=4):
+        """Iterates over all the events of this mod, latest first, lazily fetching 
+        the pages. Once the first page has been received up to `concurrency` of the following pages 
+        are requested at once and results are yielded in order. Pages are as large as the API 
+        allows unless the filter sets a limit. |filterable|
+
+        |aiter|
+
+        Parameters
+        -----------
+        filter : Optional[Filter]
+            A instance of Filter to be used for filtering and sorting results, its offset 
+            is used as the starting point.
+        keyset : Optional[bool]
+            Walk the results sorted by id with a cursor on the last id seen instead of an 
+            offset. Every result is returned exactly once even if results are added or removed 
+            during the walk and deep pages are as fast as the first ones. Overrides the sorting 
+            and offset of the filter. Pages are then requested one at a time.
+        concurrency : Optional[int]
+            |async| Maximum number of pages requested at once, at most `concurrency` + 1 pages 
+            are held in memory. Requests still go through the client's rate limiter. Default 
+            is 4, it must be at least 1.
+
+        Yields
+        -------
+        Event
+            The events of the mod
+        """
+        return _paginate(self.get_events, filter or Filter(), concurrency, "id" if keyset else None)
 
     async def get_tags(self, *, filter=None): 
         """Gets all the tags for this mod. Takes filtering arguments. Updates the instance's
@@ -204,8 +244,11 @@ class Mod:
 
         """
         tag_json = await self._client._get_request(f"/games/{self.game}/mods/{self.id}/tags", filter=filter)
-        self.tags = new_tags = {tag["name"] : _convert_date(tag["date_added"]) for tag in tag_json["data"]}
-        return Returned(new_tags, Pagination(**tag_json))
+        tags = self._client._models(_tag, tag_json, collect=dict)
+        if not self._client.raw and self._client.factory is None:
+            self.tags = tags.results
+
+        return tags
 
     async def get_metadata(self):
         """Returns a dict of metakey-metavalue pairs. This will also update the mod's kvp attribute.
@@ -219,7 +262,7 @@ class Mod:
         """
         meta_json = await self._client._get_request(f"/games/{self.game}/mods/{self.id}/metadatakvp")
         self._kvp_raw = meta_json["data"]
-        return Returned(self.kvp, Pagination(**meta_json))
+        return self._client._models(_metadata, meta_json, collect=_grouped)
 
     async def get_dependencies(self, *, filter=None):
         """Returns a dict of dependency_id-date_added pairs. Takes filtering arguments. Returns 
@@ -240,7 +283,7 @@ class Mod:
 
         """
         depen_json = await self._client._get_request(f"/games/{self.game}/mods/{self.id}/dependencies", filter=filter)
-        return Returned({dependecy["mod_id"] : _convert_date(dependecy["date_added"]) for dependecy in depen_json["data"]}, Pagination(**depen_json))
+        return self._client._models(_dependency, depen_json, collect=dict)
 
     async def get_team(self, *, filter=None):
         """Returns a list of TeamMember object representing the Team in charge of the mod. Takes
@@ -261,7 +304,37 @@ class Mod:
 
         """
         team_json = await self._client._get_request(f"/games/{self.game}/mods/{self.id}/team", filter=filter)
-        return Returned([TeamMember(**member, client=self._client, mod=self) for member in team_json["data"]], Pagination(**team_json))
+        return self._client._models(TeamMember, team_json, client=self._client, mod=self)
+
+    def iter_team(self, *, filter=None, keyset=False, concurrency=4):
+        """Iterates over the members of the team in charge of the mod, lazily fetching 
+        the pages. Once the first page has been received up to `concurrency` of the following pages 
+        are requested at once and results are yielded in order. Pages are as large as the API 
+        allows unless the filter sets a limit. |filterable|
+
+        |aiter|
+
+        Parameters
+        -----------
+        filter : Optional[Filter]
+            A instance of Filter to be used for filtering and sorting results, its offset 
+            is used as the starting point.
+        keyset : Optional[bool]
+            Walk the results sorted by id with a cursor on the last id seen instead of an 
+            offset. Every result is returned exactly once even if results are added or removed 
+            during the walk and deep pages are as fast as the first ones. Overrides the sorting 
+            and offset of the filter. Pages are then requested one at a time.
+        concurrency : Optional[int]
+            |async| Maximum number of pages requested at once, at most `concurrency` + 1 pages 
+            are held in memory. Requests still go through the client's rate limiter. Default 
+            is 4, it must be at least 1.
+
+        Yields
+        -------
+        TeamMember
+            The members of the team
+        """
+        return _paginate(self.get_team, filter or Filter(), concurrency, "id" if keyset else None, "team_id")
 
     async def get_comments(self, *, filter=None):
         """Returns a list of all the top level comments for this mod wih comments replying
@@ -282,7 +355,7 @@ class Mod:
             The results and pagination tuple from this request
         """
         comment_json = await self._client._get_request(f"/games/{self.game}/mods/{self.id}/comments", filter=filter)
-        return Returned([Comment(**comment, client=self._client, mod=self) for comment in comment_json["data"]], Pagination(**comment_json))
+        return self._client._models(Comment, comment_json, client=self._client, mod=self)
 
         # comments = []
         # for comment_d in comment_json["data"]:
@@ -298,6 +371,36 @@ class Mod:
         #         comments.append(comment)
 
 
+    def iter_comments(self, *, filter=None, keyset=False, concurrency=4):
+        """Iterates over all the comments of this mod, lazily fetching 
+        the pages. Once the first page has been received up to `concurrency` of the following pages 
+        are requested at once and results are yielded in order. Pages are as large as the API 
+        allows unless the filter sets a limit. |filterable|
+
+        |aiter|
+
+        Parameters
+        -----------
+        filter : Optional[Filter]
+            A instance of Filter to be used for filtering and sorting results, its offset 
+            is used as the starting point.
+        keyset : Optional[bool]
+            Walk the results sorted by id with a cursor on the last id seen instead of an 
+            offset. Every result is returned exactly once even if results are added or removed 
+            during the walk and deep pages are as fast as the first ones. Overrides the sorting 
+            and offset of the filter. Pages are then requested one at a time.
+        concurrency : Optional[int]
+            |async| Maximum number of pages requested at once, at most `concurrency` + 1 pages 
+            are held in memory. Requests still go through the client's rate limiter. Default 
+            is 4, it must be at least 1.
+
+        Yields
+        -------
+        Comment
+            The comments of the mod
+        """
+        return _paginate(self.get_comments, filter or Filter(), concurrency, "id" if keyset else None)
+
     async def get_stats(self):
         """Returns a Stats object, representing a series of stats for the mod.
 
@@ -309,7 +412,10 @@ class Mod:
             The stats summary object for the mod.
         """
         stats_json = await self._client._get_request(f"/games/{self.game}/mods/{self.id}/stats")
-        self.stats = stats = Stats(**stats_json)
+        stats = self._client._model(Stats, stats_json)
+        if isinstance(stats, Stats):
+            self.stats = stats
+
         return stats
 
     async def get_owner(self):
@@ -323,7 +429,7 @@ class Mod:
             User that submitted the resource
         """
         user_json = await self._client._post_request(f"/general/ownership", data={"resource_type" : "mods", "resource_id" : self.id})
-        return User(client=self._client, **user_json)
+        return self._client._model(User, user_json, client=self._client)
 
     async def edit(self, **fields):
         """Used to edit the mod details. Sucessful editing will update the mod instance.
@@ -358,7 +464,7 @@ class Mod:
         """
         fields = _clean_and_convert(fields)
         mod_json = await self._client._put_request(f'/games/{self.game}/mods/{self.id}', data = fields)
-        return self.__init__(client=self._client, **mod_json)
+        return self._client._model(self.__init__, mod_json, client=self._client)
 
     async def delete(self):
         """Delete a mod and set its status to deleted.
@@ -400,7 +506,7 @@ class Mod:
         with open(file_file, "rb") as f:
             file_json = await self._client._post_request(f'/games/{self.game}/mods/{self.id}/files', h_type = 1, data = file_d, files={"filedata" : f})
 
-        return ModFile(**file_json, game_id=self.game, client=self._client)
+        return self._client._model(ModFile, file_json, game_id=self.game, client=self._client)
 
     async def add_media(self, *, logo = None, images = [], youtube = [], sketchfab = []):
         """Upload new media to the mod.
@@ -456,7 +562,7 @@ class Mod:
                 for image in images_d.values():
                     image.close()
 
-        return Message(**media_json)
+        return self._client._model(Message, media_json)
 
     async def delete_media(self, *, images = [], youtube = [], sketchfab = []):
         """Delete media from the mod page. 
@@ -492,7 +598,7 @@ class Mod:
         """
         try:
             mod_json = await self._client._post_request(f'/games/{self.game}/mods/{self.id}/subscribe')
-            return Mod(client=self._client, **mod_json)
+            return self._client._model(Mod, mod_json, client=self._client)
         except BadRequest:
             pass
 
@@ -532,7 +638,7 @@ class Mod:
         for tag in tags:
             self.tags[tag] = int(time.time())
 
-        return Message(**message)
+        return self._client._model(Message, message)
 
     async def delete_tags(self, *tags):
         """Delete tags from the mod, tags are case insensitive and duplicates will be removed. Providing
@@ -622,7 +728,7 @@ class Mod:
             for item in value:
                 self._kvp_raw.append({"metakey" : key, "metavalue" : item})
 
-        return Message(**checked)
+        return self._client._model(Message, checked)
 
     async def delete_metadata(self, **metadata):
         """Deletes metadata from a mod. To do so pass the meta-key as a keyword argument and the
@@ -674,7 +780,7 @@ class Mod:
         """
         dependency = {f"dependencies[{dependencies.index(data)}]" : getattr(data, "id", data) for data in dependencies}
         r = await self._client._post_request(f'/games/{self.game}/mods/{self.id}/dependencies', data=dependency)
-        return Message(**r)
+        return self._client._model(Message, r)
 
     async def delete_dependencies(self, dependencies : list):
         """Delete mod dependecies required by this mod.
@@ -707,7 +813,7 @@ class Mod:
         """
         data = {"email" : email, "level" : level.value, "position" : position}
         msg = await self._client._post_request(f'/games/{self.game}/mods/{self.id}/team', data=data)
-        return Message(**msg)
+        return self._client._model(Message, msg)
 
     async def report(self, name, summary, type = Report(0)):
         """Report a this mod, make sure to read mod.io's ToU to understand what is
@@ -740,4 +846,6 @@ class Mod:
         }
 
         msg = await self._client._post_request('/report', data = fields)
-        return Message(**msg)
+        return self._client._model(Message, msg)
+
+lazy(Mod)
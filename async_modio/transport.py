@@ -0,0 +1,77 @@
+"""The transports of :class:`async_modio.Client`, see :mod:`modio.transport`."""
+
+import abc
+
+import aiohttp
+
+from modio.core import form_fields
+from modio.transport import Response
+from modio import transport
+
+class Transport(abc.ABC):
+    """Base class of the transports of :class:`async_modio.Client`. To plug in another
+    HTTP library subclass it and implement :func:`send` and :func:`close`."""
+    @abc.abstractmethod
+    async def send(self, method, url, *, headers, params = None, data = None, files = None, on_headers = None):
+        """Sends a request and returns its :class:`modio.transport.Response`, see
+        :func:`modio.Transport.send`.
+
+        |coro|"""
+
+    async def close(self):
+        """Releases the resources held by the transport.
+
+        |coro|"""
+        pass
+
+class AiohttpTransport(Transport):
+    """The default transport of :class:`async_modio.Client`, sends the requests through
+    an `aiohttp.ClientSession`.
+
+    Parameters
+    -----------
+    loop : Optional[asyncio.EventLoop]
+        The loop of the session
+
+    Attributes
+    -----------
+    session : aiohttp.ClientSession
+        The session sending the requests
+    """
+    def __init__(self, *, loop = None):
+        self.session = aiohttp.ClientSession(loop=loop)
+
+    def _form(self, data, files):
+        form = aiohttp.FormData()
+        for key, value, filename, content_type in form_fields(data, files):
+            form.add_field(key, value, filename=filename, content_type=content_type)
+
+        return form
+
+    async def send(self, method, url, *, headers, params = None, data = None, files = None, on_headers = None):
+        if method == "POST":
+            data = self._form(data or {}, files or {})
+        elif data is not None:
+            #skip the None values like requests does for the sync client
+            data = {key: value for key, value in data.items() if value is not None}
+
+        async with self.session.request(method, url, headers=headers, params=params, data=data) as r:
+            if on_headers is not None:
+                on_headers(r.status, r.headers)
+
+            return Response(r.status, r.headers, await r.read())
+
+    async def close(self):
+        await self.session.close()
+
+class MemoryTransport(transport.MemoryTransport, Transport):
+    """The :class:`modio.MemoryTransport` for :class:`async_modio.Client`."""
+    async def send(self, method, url, *, headers, params = None, data = None, files = None, on_headers = None):
+        response = self.respond(method, url, params, data)
+        if on_headers is not None:
+            on_headers(response.status, response.headers)
+
+        return response
+
+    async def close(self):
+        pass
@@ -1,29 +1,17 @@
-import inspect
+import asyncio
+import collections
+import copy
 import enum
 import datetime
 
 def concat_docs(cls):
     """Does it look like I'm enjoying this?"""
     attributes = []
-
-    def get_docs(parent):
-        nonlocal attributes
-        if parent.__name__ == 'object':
-            return
-
+    for parent in cls.__mro__[:-1]:
         docs = parent.__doc__.splitlines()
         if "    Attributes" in docs:
             attributes = docs[docs.index("    Attributes") + 2:] + attributes
 
-        source = inspect.getsource(parent.__init__)
-        source = source[source.index('):'):]
-
-        if 'super().__init__' in source:
-            get_docs(parent.__base__)
-        elif '__init__' in source:
-            get_docs(parent.__base__.__base__)            
-
-    get_docs(cls)
     original = cls.__doc__.splitlines()
     if not "    Attributes" in original:
             original.append("    Attributes")
@@ -35,6 +23,9 @@ def concat_docs(cls):
 
     return cls
     
+#models use __slots__, attributes are looked up with getattr rather than in __dict__
+_missing = object()
+
 def find(iterable, **fields):
     """Finds the first item in the :attrs: iterable that has the :attrs: attr equal to :attrs: value. For
     example:
@@ -52,9 +43,8 @@ def find(iterable, **fields):
     """
 
     for e in iterable:
-        if all(key in e.__dict__ for key in fields.keys()):
-            if all(e.__dict__[key] == fields[key] for key in fields.keys()):
-                return e
+        if all(getattr(e, key, _missing) == value for key, value in fields.items()):
+            return e
 
     return None
 
@@ -75,9 +65,8 @@ def get(iterable, **fields):
 
     e_list = list()
     for e in iterable:
-        if all(key in e.__dict__ for key in fields.keys()):
-            if all(e.__dict__[key] == fields[key] for key in fields.keys()):
-                e_list.append(e)
+        if all(getattr(e, key, _missing) == value for key, value in fields.items()):
+            e_list.append(e)
 
     return e_list
 
@@ -176,4 +165,107 @@ def _clean_and_convert(fields):
     return new_fields
 
 def _convert_date(time):
-    return datetime.datetime.utcfromtimestamp(time)
\ No newline at end of file
+    return datetime.datetime.utcfromtimestamp(time)
+
+def _rewind(files):
+    """Seeks the files of a request back to their start so the request can be sent again."""
+    for value in (files or {}).values():
+        if isinstance(value, tuple):
+            value = value[1]
+
+        if hasattr(value, "seek"):
+            value.seek(0)
+
+def _paginate(get, filter, concurrency=1, keyset=None, attr="id"):
+    """Returns an async iterator over every result of the `get` list method in order. Once the
+    first page has told how many results there are, up to `concurrency` of the following pages
+    are requested at once with copies of `filter`. If `keyset` is the name of a column the pages
+    are walked one after the other with a cursor on it instead, see :func:`_paginate_keyset`.
+
+    The concurrency is checked here rather than in the generator so that the `iter_*` methods
+    raise as soon as they are called instead of on the first iteration."""
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1, got {}".format(concurrency))
+
+    return _paginate_offset(get, filter, concurrency, keyset, attr)
+
+async def _paginate_offset(get, filter, concurrency, keyset, attr):
+    def fetch(offset):
+        page = copy.copy(filter)
+        page.offset(offset)
+        return asyncio.ensure_future(get(filter=page))
+
+    filter = copy.copy(filter)
+    if not hasattr(filter, "_limit"):
+        filter.limit(100)
+
+    if keyset:
+        async for result in _paginate_keyset(get, filter, keyset, attr):
+            yield result
+        return
+
+    tasks = collections.deque([fetch(getattr(filter, "_offset", 0))])
+    next_offset = None
+    try:
+        while tasks:
+            results, pagination = await tasks.popleft()
+            if not results:
+                return
+
+            step = pagination.limit or filter._limit
+            if next_offset is None:
+                next_offset = pagination.offset + step
+
+            while len(tasks) < concurrency and next_offset < pagination.total:
+                tasks.append(fetch(next_offset))
+                next_offset += step
+
+            for result in results:
+                yield result
+    finally:
+        for task in tasks:
+            task.cancel()
+
+async def _paginate_keyset(get, filter, column, attr):
+    """Sorts the results by ascending `column` and requests each page with a `column-gt`
+    filter on the value of `attr` of the last result seen. Unlike offsets, the cursor is not
+    shifted by results being added or removed during the walk and the API does not have to
+    skip over the previous pages."""
+    filter.sort(column)
+    filter.offset(0)
+    while True:
+        results, pagination = await get(filter=filter)
+        for result in results:
+            yield result
+
+        if not results or pagination.count < pagination.limit:
+            return
+
+        filter.greater_than(**{column: _value(results[-1], column, attr)})
+
+def _value(result, key, attr):
+    """Returns the value of the JSON `key` of a result, its `attr` attribute unless the
+    client returns the JSON itself."""
+    if isinstance(result, dict):
+        return result[key]
+
+    return getattr(result, attr)
+
+def _chunk_ids(ids, size=100, length=1500):
+    """Splits the unique `ids` into lists small enough for a single `id-in` filter, each
+    list has at most `size` IDs (the maximum limit of a page) and is at most `length`
+    characters long once joined so that the query stays below common URL length limits."""
+    chunk = []
+    chunk_length = 0
+    for id in dict.fromkeys(ids):
+        id_length = len(str(id)) + 1
+        if chunk and (len(chunk) == size or chunk_length + id_length > length):
+            yield chunk
+            chunk = []
+            chunk_length = 0
+
+        chunk.append(id)
+        chunk_length += id_length
+
+    if chunk:
+        yield chunk
@@ -0,0 +1,47 @@
+"""Measures the memory held by the models built from the JSON of the API, in bytes per
+object including the nested objects each one owns (a Mod's User, Stats, ModMedia, Images
+and ModFile...). The JSON itself is built beforehand and not counted.
+
+    python -m benchmarks.bench_memory [objects]
+"""
+
+import gc
+import sys
+import tracemalloc
+
+from modio.mod import Mod
+from modio.game import Game
+from modio.objects import User, Stats, Event, ModFile, Image
+from .catalogue import Catalogue, user_json, image_json, event_json
+
+def _per_object(build, data):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [build(item) for item in data]
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del objects
+    return size / len(data)
+
+def measure(n=1000):
+    """Returns the number of bytes held by each kind of model, keyed by class name."""
+    catalogue = Catalogue(games=1, mods=n, files=1, file_size=(16, 16))
+    mods = catalogue.game_mods(1)
+    games = [{**catalogue.games[1], "id": id} for id in range(1, n + 1)]
+    return {
+        "Mod": _per_object(lambda mod: Mod(client=None, **mod), mods),
+        "Game": _per_object(lambda game: Game(client=None, **game), games),
+        "User": _per_object(lambda user: User(client=None, **user), [user_json(id) for id in range(1, n + 1)]),
+        "Stats": _per_object(lambda stats: Stats(**stats), [mod["stats"] for mod in mods]),
+        "ModFile": _per_object(lambda file: ModFile(**file, game_id=1, client=None), [mod["modfile"] for mod in mods]),
+        "Event": _per_object(lambda event: Event(**event), [event_json(id, id, 1, game_id=1) for id in range(1, n + 1)]),
+        "Image": _per_object(lambda image: Image(**image), [image_json(f"image-{id}") for id in range(1, n + 1)]),
+    }
+
+def main(n=1000):
+    for name, size in measure(n).items():
+        print(f"{name:<8} {size:8.0f} bytes")
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
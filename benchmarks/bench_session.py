@@ -0,0 +1,56 @@
+"""Compares the requests/sec of the sync client when every request opens a new
+connection (the old module-level `requests.get` behaviour) against the pooled
+keep-alive Session the client now owns.
+
+    python -m benchmarks.bench_session [requests]
+"""
+
+import sys
+import time
+
+import requests
+
+import modio
+from modio.transport import Response
+from .server import serve
+
+class UnpooledTransport(modio.Transport):
+    """Sends every request with the module-level requests functions, which open a
+    new connection for each call like the client used to."""
+    def send(self, method, url, *, headers, params=None, data=None, files=None, on_headers=None):
+        r = requests.request(method, url, headers=headers, params=params, data=data, files=files, stream=True)
+        if on_headers is not None:
+            on_headers(r.status_code, r.headers)
+
+        return Response(r.status_code, r.headers, r.content)
+
+class LocalClient(modio.Client):
+    base_url = None
+
+    @property
+    def _base_path(self):
+        return self.base_url
+
+def _rate(func, n):
+    start = time.perf_counter()
+    for _ in range(n):
+        func()
+
+    return n / (time.perf_counter() - start)
+
+def main(n=500):
+    server = serve()
+    LocalClient.base_url = server.base_url
+
+    with LocalClient(api_key="benchmark") as client:
+        pooled = _rate(lambda: client.get_game(1), n)
+
+    with LocalClient(api_key="benchmark", transport=UnpooledTransport()) as client:
+        unpooled = _rate(lambda: client.get_game(1), n)
+
+    server.shutdown()
+    print(f"unpooled: {unpooled:8.1f} req/s")
+    print(f"pooled:   {pooled:8.1f} req/s ({pooled / unpooled:.2f}x)")
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
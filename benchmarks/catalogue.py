@@ -0,0 +1,268 @@
+"""Synthetic mod.io data shaped like the responses of the API. The builders return the JSON
+of a single object, :class:`Catalogue` generates a whole seeded catalogue of games, mods,
+files, users and the rest for :mod:`benchmarks.server` to serve.
+"""
+
+import hashlib
+import random
+
+EPOCH = 1493702614
+
+TAGS = ["Horror", "Sci-fi", "Fantasy", "Realistic", "Cartoon", "Multiplayer", "Singleplayer", "Maps", "Weapons", "Vehicles"]
+
+WORDS = ["Lord", "Rings", "Dark", "Forest", "Iron", "Knight", "Storm", "Castle", "Dragon", "Empire",
+         "Rogue", "Shadow", "Siege", "Frontier", "Legacy", "Overhaul", "Patch", "Remaster", "Extended", "Ultimate"]
+
+def image_json(name):
+    return {
+        "filename": f"{name}.png",
+        "original": f"https://static.mod.io/{name}.png",
+        "thumb_64x64": f"https://static.mod.io/thumb_64x64/{name}.png",
+        "thumb_128x128": f"https://static.mod.io/thumb_128x128/{name}.png",
+        "thumb_256x256": f"https://static.mod.io/thumb_256x256/{name}.png"
+    }
+
+def user_json(id):
+    return {
+        "id": id,
+        "name_id": f"user-{id}",
+        "username": f"User {id}",
+        "date_online": EPOCH + id,
+        "avatar": image_json(f"avatar-{id}"),
+        "timezone": "Europe/London",
+        "language": "en",
+        "profile_url": f"https://mod.io/members/user-{id}"
+    }
+
+def game_json(id, submitter=1, name=None):
+    return {
+        "id": id,
+        "status": 1,
+        "submitted_by": user_json(submitter),
+        "date_added": EPOCH,
+        "date_updated": EPOCH + 5707676,
+        "date_live": EPOCH + 6138789,
+        "presentation_option": 0,
+        "submission_option": 1,
+        "curation_option": 0,
+        "community_options": 3,
+        "revenue_options": 0,
+        "api_access_options": 3,
+        "maturity_options": 0,
+        "ugc_name": "mods",
+        "icon": image_json(f"icon-{id}"),
+        "logo": image_json(f"logo-{id}"),
+        "header": image_json(f"header-{id}"),
+        "name": name or f"Game {id}",
+        "name_id": f"game-{id}",
+        "summary": "A game used to benchmark the mod.io wrapper.",
+        "instructions": "Upload your mods.",
+        "instructions_url": "https://www.rogue-knight-game.com/modding/getting-started",
+        "profile_url": f"https://game-{id}.mod.io",
+        "tag_options": [{"name": "Theme", "type": "checkboxes", "hidden": False, "tags": TAGS[:5]},
+                        {"name": "Type", "type": "dropdown", "hidden": False, "tags": TAGS[5:]}]
+    }
+
+def stats_json(mod_id, downloads=0, subscribers=0, positive=0, negative=0):
+    total = positive + negative
+    return {
+        "mod_id": mod_id,
+        "popularity_rank_position": mod_id,
+        "popularity_rank_total_mods": 0,
+        "downloads_total": downloads,
+        "subscribers_total": subscribers,
+        "ratings_total": total,
+        "ratings_positive": positive,
+        "ratings_negative": negative,
+        "ratings_percentage_positive": round(100 * positive / total) if total else 0,
+        "ratings_weighted_aggregate": round(positive / total, 2) if total else 0,
+        "ratings_display_text": "Positive" if total and positive >= negative else "Unrated",
+        "date_expires": EPOCH + 86400
+    }
+
+def modfile_json(id, mod_id, content, version="1.0", date=EPOCH):
+    return {
+        "id": id,
+        "mod_id": mod_id,
+        "date_added": date,
+        "date_scanned": date,
+        "virus_status": 1,
+        "virus_positive": 0,
+        "virustotal_hash": None,
+        "filesize": len(content),
+        "filehash": {"md5": hashlib.md5(content).hexdigest()},
+        "filename": f"mod-{mod_id}-{id}.zip",
+        "version": version,
+        "changelog": f"Version {version}",
+        "metadata_blob": None,
+        "download": {"binary_url": None, "date_expires": 0}
+    }
+
+def mod_json(id, game_id, name, submitter=1, tags=(), date=EPOCH, stats=None):
+    return {
+        "id": id,
+        "game_id": game_id,
+        "status": 1,
+        "visible": 1,
+        "submitted_by": user_json(submitter),
+        "date_added": date,
+        "date_updated": date + 3600,
+        "date_live": date + 60,
+        "maturity_option": 0,
+        "logo": image_json(f"mod-logo-{id}"),
+        "homepage_url": f"https://mods.example.com/{id}",
+        "name": name,
+        "name_id": name.lower().replace(" ", "-"),
+        "summary": f"{name} is a synthetic mod.",
+        "description": f"<p>{name} is a synthetic mod.</p>",
+        "description_plaintext": f"{name} is a synthetic mod.",
+        "metadata_blob": None,
+        "profile_url": f"https://game-{game_id}.mod.io/{id}",
+        "media": {"youtube": [], "sketchfab": [], "images": []},
+        "modfile": None,
+        "metadata_kvp": [],
+        "tags": [{"name": tag, "date_added": date} for tag in tags],
+        "stats": stats or stats_json(id)
+    }
+
+def event_json(id, mod_id, user_id, type="MODFILE_CHANGED", date=EPOCH, game_id=None):
+    event = {"id": id, "mod_id": mod_id, "user_id": user_id, "date_added": date, "event_type": type}
+    if game_id is not None:
+        event["game_id"] = game_id
+
+    return event
+
+def comment_json(id, mod_id, user_id, content, reply_id=0, date=EPOCH):
+    return {
+        "id": id,
+        "mod_id": mod_id,
+        "user": user_json(user_id),
+        "date_added": date,
+        "reply_id": reply_id,
+        "thread_position": "01",
+        "karma": 0,
+        "karma_guest": 0,
+        "content": content
+    }
+
+def team_json(id, user_id, level=8, position="Creator", date=EPOCH):
+    return {"id": id, "user": user_json(user_id), "level": level, "date_added": date, "position": position}
+
+def page_json(data, offset=0, limit=100, total=None):
+    """Returns a page of a collection in the envelope of the API's list endpoints"""
+    return {
+        "data": data,
+        "result_count": len(data),
+        "result_offset": offset,
+        "result_limit": limit,
+        "result_total": len(data) if total is None else total
+    }
+
+def file_content(file_id, size):
+    """Returns the deterministic content of a synthetic file"""
+    line = f"synthetic mod file {file_id}\n".encode()
+    return (line * (size // len(line) + 1))[:size]
+
+class Catalogue:
+    """A seeded, mutable catalogue of synthetic mod.io data. Two catalogues built with the
+    same arguments are identical.
+
+    Parameters
+    -----------
+    seed : Optional[int]
+        Seed of the random generator. Default is 0.
+    games : Optional[int]
+        Number of games. Default is 2.
+    mods : Optional[int]
+        Number of mods of each game. Default is 100.
+    files : Optional[int]
+        Number of files of each mod. Default is 2.
+    users : Optional[int]
+        Number of users, user 1 is the owner of the access token. Default is 50.
+    file_size : Optional[Tuple[int, int]]
+        Range of the size of the files in bytes. Default is 1KB to 16KB.
+
+    Attributes
+    -----------
+    games : Dict[int, dict]
+        The games keyed by ID
+    mods : Dict[int, dict]
+        The mods of every game keyed by ID
+    files : Dict[int, Dict[int, dict]]
+        The files of each mod keyed by mod ID then file ID
+    contents : Dict[int, bytes]
+        The content of each file keyed by file ID
+    users : Dict[int, dict]
+        The users keyed by ID
+    events, comments, team, metadata, dependencies : Dict[int, list]
+        The children of each mod keyed by mod ID
+    subscriptions : Set[int]
+        The IDs of the mods user 1 is subscribed to
+    ratings : Dict[int, int]
+        The ratings user 1 gave, keyed by mod ID
+    """
+    def __init__(self, *, seed = 0, games = 2, mods = 100, files = 2, users = 50, file_size = (1024, 16 * 1024)):
+        rng = random.Random(seed)
+        self.users = {id: user_json(id) for id in range(1, users + 1)}
+        self.games = {id: game_json(id, rng.randint(1, users)) for id in range(1, games + 1)}
+        self.mods = {}
+        self._by_game = {id: [] for id in self.games}
+        self.files = {}
+        self.contents = {}
+        self.events = {}
+        self.comments = {}
+        self.team = {}
+        self.metadata = {}
+        self.dependencies = {}
+        self.subscriptions = set()
+        self.ratings = {}
+        self._ids = {"file": 0, "event": 0, "comment": 0, "team": 0, "mod": 0}
+
+        for game_id in self.games:
+            for _ in range(mods):
+                self._generate_mod(rng, game_id, users, files, file_size)
+
+    def next_id(self, kind):
+        """Returns a new ID for an object of a kind (mod, file, event, comment, team)"""
+        self._ids[kind] += 1
+        return self._ids[kind]
+
+    def _generate_mod(self, rng, game_id, users, files, file_size):
+        id = self.next_id("mod")
+        date = EPOCH + rng.randint(0, 10 ** 8)
+        name = " ".join(rng.sample(WORDS, rng.randint(2, 3))) + f" {id}"
+        submitter = rng.randint(1, users)
+        positive, negative = rng.randint(0, 500), rng.randint(0, 100)
+        stats = stats_json(id, rng.randint(0, 10 ** 6), rng.randint(0, 10 ** 5), positive, negative)
+        mod = mod_json(id, game_id, name, submitter, rng.sample(TAGS, rng.randint(0, 3)), date, stats)
+        self.add_mod(mod)
+
+        self.files[id] = {}
+        for index in range(files):
+            file_id = self.next_id("file")
+            content = file_content(file_id, rng.randint(*file_size))
+            self.contents[file_id] = content
+            self.files[id][file_id] = modfile_json(file_id, id, content, f"1.{index}", date + index)
+
+        if self.files[id]:
+            mod["modfile"] = self.files[id][max(self.files[id])]
+
+        self.events[id] = [event_json(self.next_id("event"), id, submitter, "MOD_AVAILABLE", date, game_id)]
+        self.events[id] += [event_json(self.next_id("event"), id, submitter, "MODFILE_CHANGED", file["date_added"], game_id) for file in self.files[id].values()]
+        self.comments[id] = [comment_json(self.next_id("comment"), id, rng.randint(1, users), "Nice mod!", 0, date + 60)]
+        self.team[id] = [team_json(self.next_id("team"), submitter, 8, "Creator", date)]
+        self.metadata[id] = [{"metakey": "version", "metavalue": "1"}]
+        self.dependencies[id] = []
+        if id > 1 and rng.random() < 0.2:
+            self.dependencies[id].append({"mod_id": rng.randint(1, id - 1), "date_added": date})
+
+    def add_mod(self, mod):
+        """Adds a mod without any file or children"""
+        self.mods[mod["id"]] = mod
+        self._by_game[mod["game_id"]].append(mod)
+        for children in (self.files, self.events, self.comments, self.team, self.metadata, self.dependencies):
+            children.setdefault(mod["id"], {} if children is self.files else [])
+
+    def game_mods(self, game_id):
+        """Returns the mods of a game"""
+        return self._by_game[game_id]
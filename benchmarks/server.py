@@ -0,0 +1,853 @@
+"""A local stand-in for the mod.io API built on aiohttp, used to run the clients offline
+and to load test them. It implements the endpoints used by the wrapper on top of a
+seeded synthetic :class:`benchmarks.catalogue.Catalogue`, with pagination, filtering,
+sorting, rate limit headers, 429 responses once the budget is spent, file uploads and
+download urls which expire.
+
+Run it on its own with `python -m benchmarks.server [port] [mods per game]` or start it
+from a benchmark or a test with :func:`serve`. The base url of the API is the server's
+url followed by /v1, any api key is accepted and any access token logs in as user 1.
+"""
+
+import asyncio
+import collections
+import hashlib
+import hmac
+import math
+import random
+import sys
+import threading
+import time
+
+from aiohttp import web
+
+from .catalogue import (Catalogue, user_json, mod_json, modfile_json, stats_json,
+                        event_json, team_json, page_json, EPOCH)
+
+_operators = ["-not-lk", "-not-in", "-bitwise-and", "-lk", "-in", "-not", "-max", "-min", "-st", "-gt"]
+
+_reserved = {"api_key", "_limit", "_offset", "_sort", "_q"}
+
+def _value(item, field):
+    """Returns the value of a field of an object as it is compared by the filters"""
+    value = item.get(field)
+    if isinstance(value, dict):
+        return value.get("id", value.get("name"))
+    if isinstance(value, list):
+        return [x.get("name", x.get("id")) if isinstance(x, dict) else x for x in value]
+
+    return value
+
+def _coerce(value, like):
+    if isinstance(like, bool):
+        return value.lower() in ("1", "true")
+    if isinstance(like, int):
+        return int(value)
+    if isinstance(like, float):
+        return float(value)
+
+    return value
+
+def _like(value, pattern):
+    pattern = pattern.lower()
+    value = str(value).lower()
+    if pattern.startswith("*") and pattern.endswith("*"):
+        return pattern.strip("*") in value
+    if pattern.startswith("*"):
+        return value.endswith(pattern[1:])
+    if pattern.endswith("*"):
+        return value.startswith(pattern[:-1])
+
+    return value == pattern
+
+def _matches(item, key, raw):
+    for operator in _operators:
+        if key.endswith(operator):
+            field, operator = key[:-len(operator)], operator
+            break
+    else:
+        field, operator = key, ""
+
+    if field not in item:
+        return True
+
+    value = _value(item, field)
+    values = value if isinstance(value, list) else [value]
+    if operator in ("-in", "-not-in"):
+        wanted = [_coerce(x, values[0]) if values and values[0] is not None else x for x in raw.split(",")]
+        found = any(x in wanted for x in values)
+        return found if operator == "-in" else not found
+    if operator in ("-lk", "-not-lk"):
+        found = any(_like(x, raw) for x in values)
+        return found if operator == "-lk" else not found
+    if value is None:
+        return operator == "-not"
+
+    if isinstance(value, list):
+        found = raw in values
+        return found if operator != "-not" else not found
+
+    raw = _coerce(raw, value)
+    if operator == "":
+        return value == raw
+    if operator == "-not":
+        return value != raw
+    if operator in ("-max", "-st"):
+        return value <= raw if operator == "-max" else value < raw
+    if operator in ("-min", "-gt"):
+        return value >= raw if operator == "-min" else value > raw
+    if operator == "-bitwise-and":
+        return bool(value & raw)
+
+    return True
+
+def _array(form, name):
+    """Returns the values of a form array, e.g. tags[0], tags[1]..."""
+    items = [(key, value) for key, value in form.items() if key.startswith(f"{name}[")]
+    items.sort(key=lambda item: int(item[0][len(name) + 1:-1] or 0))
+    return [value for _, value in items]
+
+Upload = collections.namedtuple("Upload", "filename content")
+
+def _multipart(body, boundary):
+    """Parses a multipart form. Done by hand because aiohttp refuses the parts the async
+    client sends with a multipart/form-data content type, which the API accepts."""
+    form = {}
+    for part in body.split(b"--" + boundary)[1:-1]:
+        head, _, content = part[2:-2].partition(b"\r\n\r\n")
+        disposition = next(line for line in head.decode().split("\r\n") if line.lower().startswith("content-disposition"))
+        params = dict(item.strip().split("=", 1) for item in disposition.split(";")[1:])
+        name = params["name"].strip('"')
+        if "filename" in params:
+            form[name] = Upload(params["filename"].strip('"'), content)
+        else:
+            form[name] = content.decode()
+
+    return form
+
+def _error(status, message, **headers):
+    return web.json_response({"error": {"code": status, "message": message}}, status=status, headers=headers)
+
+def _message(message, status=201):
+    return web.json_response({"code": status, "message": message}, status=status)
+
+def _missing(name):
+    return _error(404, f"The requested {name} could not be found.")
+
+class StandIn:
+    """The stand-in API, serving and modifying a :class:`Catalogue`.
+
+    Parameters
+    -----------
+    catalogue : Optional[Catalogue]
+        The data served. Default is a Catalogue with its default size.
+    rate_limit : Optional[int]
+        Number of requests each api key/access token can make per `rate_window`, once
+        they are spent requests are answered with a 429. Default is 60 like the API.
+    rate_window : Optional[float]
+        Length in seconds of a rate limit window. Default is 60.
+    url_ttl : Optional[float]
+        Number of seconds download urls are valid for. Default is 300.
+    latency : Optional[float]
+        Number of seconds added to every response. Default is 0.
+    failure_rate : Optional[float]
+        Fraction of the requests answered with a 503. Default is 0.
+    seed : Optional[int]
+        Seed of the random failures. Default is 0.
+
+    Attributes
+    -----------
+    requests : int
+        Number of requests received
+    limited : int
+        Number of requests answered with a 429
+    """
+    def __init__(self, catalogue = None, *, rate_limit = 60, rate_window = 60, url_ttl = 300, latency = 0, failure_rate = 0, seed = 0):
+        self.catalogue = catalogue or Catalogue()
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.url_ttl = url_ttl
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.requests = 0
+        self.limited = 0
+        self._rng = random.Random(seed)
+        self._windows = {}
+        self._secret = str(seed).encode()
+        self.app = self._make_app()
+
+    def _make_app(self):
+        app = web.Application(middlewares=[self._middleware], client_max_size=1024 ** 3)
+        game = "/v1/games/{game:\\d+}"
+        mod = game + "/mods/{mod:\\d+}"
+        app.add_routes([
+            web.get("/v1/games", self.get_games),
+            web.get(game, self.get_game),
+            web.put(game, self.edit_game),
+            web.get(game + "/tags", self.get_tag_options),
+            web.post(game + "/tags", self.add_tag_options),
+            web.delete(game + "/tags", self.delete_tag_options),
+            web.post(game + "/media", self.add_media),
+            web.get(game + "/mods", self.get_mods),
+            web.post(game + "/mods", self.add_mod),
+            web.get(game + "/mods/events", self.get_game_events),
+            web.get(game + "/mods/stats", self.get_game_stats),
+            web.get(mod, self.get_mod),
+            web.put(mod, self.edit_mod),
+            web.delete(mod, self.delete_mod),
+            web.get(mod + "/files", self.get_files),
+            web.post(mod + "/files", self.add_file),
+            web.get(mod + "/files/{file:\\d+}", self.get_file),
+            web.put(mod + "/files/{file:\\d+}", self.edit_file),
+            web.delete(mod + "/files/{file:\\d+}", self.delete_file),
+            web.get(mod + "/events", self.get_mod_events),
+            web.get(mod + "/stats", self.get_mod_stats),
+            web.get(mod + "/tags", self.get_tags),
+            web.post(mod + "/tags", self.add_tags),
+            web.delete(mod + "/tags", self.delete_tags),
+            web.get(mod + "/metadatakvp", self.get_metadata),
+            web.post(mod + "/metadatakvp", self.add_metadata),
+            web.delete(mod + "/metadatakvp", self.delete_metadata),
+            web.get(mod + "/dependencies", self.get_dependencies),
+            web.post(mod + "/dependencies", self.add_dependencies),
+            web.delete(mod + "/dependencies", self.delete_dependencies),
+            web.post(mod + "/subscribe", self.subscribe),
+            web.delete(mod + "/subscribe", self.unsubscribe),
+            web.post(mod + "/ratings", self.add_rating),
+            web.post(mod + "/media", self.add_media),
+            web.delete(mod + "/media", self.delete_media),
+            web.get(mod + "/comments", self.get_comments),
+            web.get(mod + "/comments/{comment:\\d+}", self.get_comment),
+            web.delete(mod + "/comments/{comment:\\d+}", self.delete_comment),
+            web.get(mod + "/team", self.get_team),
+            web.post(mod + "/team", self.add_team_member),
+            web.put(mod + "/team/{member:\\d+}", self.edit_team_member),
+            web.delete(mod + "/team/{member:\\d+}", self.delete_team_member),
+            web.get("/v1/users", self.get_users),
+            web.get("/v1/users/{user:\\d+}", self.get_user),
+            web.get("/v1/me", self.get_me),
+            web.get("/v1/me/subscribed", self.get_my_subs),
+            web.get("/v1/me/events", self.get_my_events),
+            web.get("/v1/me/games", self.get_my_games),
+            web.get("/v1/me/mods", self.get_my_mods),
+            web.get("/v1/me/files", self.get_my_files),
+            web.get("/v1/me/ratings", self.get_my_ratings),
+            web.post("/v1/report", self.report),
+            web.post("/v1/general/ownership", self.get_owner),
+            web.post("/v1/oauth/emailrequest", self.email_request),
+            web.post("/v1/oauth/emailexchange", self.email_exchange),
+            web.post("/v1/external/steamauth", self.email_exchange),
+            web.get("/download/{file:\\d+}", self.download),
+        ])
+        return app
+
+    @web.middleware
+    async def _middleware(self, request, handler):
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        if request.path.startswith("/download/"):
+            return await handler(request)
+
+        token = request.headers.get("Authorization", "")[len("Bearer "):]
+        identity = token or request.query.get("api_key")
+        if not identity:
+            return _error(401, "Missing api key or access token.")
+
+        if request.path.startswith("/v1/me") and not token:
+            return _error(401, "This endpoint requires an access token.")
+
+        now = time.monotonic()
+        reset_at, remaining = self._windows.get(identity, (0, 0))
+        if reset_at <= now:
+            reset_at, remaining = now + self.rate_window, self.rate_limit
+
+        headers = {"X-RateLimit-Limit": str(self.rate_limit)}
+        if remaining <= 0:
+            self.limited += 1
+            headers["X-RateLimit-Remaining"] = "0"
+            headers["X-Ratelimit-RetryAfter"] = str(math.ceil(reset_at - now))
+            return _error(429, "You have made too many requests.", **headers)
+
+        self._windows[identity] = (reset_at, remaining - 1)
+        headers["X-RateLimit-Remaining"] = str(remaining - 1)
+        if self.failure_rate and self._rng.random() < self.failure_rate:
+            return _error(503, "Service unavailable.", **headers)
+
+        try:
+            response = await handler(request)
+        except web.HTTPNotFound:
+            response = _error(404, "The requested resource could not be found.")
+        except web.HTTPMethodNotAllowed:
+            response = _error(405, "The method is not allowed.")
+
+        response.headers.update(headers)
+        return response
+
+    def _page(self, request, items):
+        """Filters, sorts and paginates a collection"""
+        query = request.query
+        for key, value in query.items():
+            if key not in _reserved:
+                items = [item for item in items if _matches(item, key, value)]
+
+        if "_q" in query:
+            words = query["_q"].lower().split()
+            items = [item for item in items if any(word in str(item.get("name", "")).lower() for word in words)]
+
+        sort = query.get("_sort")
+        if sort:
+            field = sort.lstrip("-")
+            items = sorted(items, key=lambda item: (_value(item, field) is None, _value(item, field)), reverse=sort.startswith("-"))
+
+        offset = int(query.get("_offset", 0))
+        limit = min(int(query.get("_limit", 100)), 100)
+        page = items[offset:offset + limit]
+        return web.json_response(page_json(page, offset, limit, len(items)))
+
+    def _download(self, request, file):
+        expires = int(time.time() + self.url_ttl)
+        signature = self._sign(file["id"], expires)
+        url = f"{request.url.origin()}/download/{file['id']}?expires={expires}&signature={signature}"
+        return {**file, "download": {"binary_url": url, "date_expires": expires}}
+
+    def _sign(self, file_id, expires):
+        return hmac.new(self._secret, f"{file_id}:{expires}".encode(), hashlib.sha256).hexdigest()[:32]
+
+    def _render_mod(self, request, mod):
+        if mod.get("modfile"):
+            return {**mod, "modfile": self._download(request, mod["modfile"])}
+
+        return mod
+
+    def _game(self, request):
+        return self.catalogue.games.get(int(request.match_info["game"]))
+
+    def _mod(self, request):
+        mod = self.catalogue.mods.get(int(request.match_info["mod"]))
+        if mod is not None and mod["game_id"] == int(request.match_info["game"]):
+            return mod
+
+    async def _form(self, request):
+        form = dict(request.query)
+        if request.content_type == "multipart/form-data":
+            boundary = request.headers["Content-Type"].split("boundary=", 1)[1].split(";")[0].strip('"').encode()
+            form.update(_multipart(await request.read(), boundary))
+        elif request.can_read_body:
+            form.update(await request.post())
+
+        return form
+
+    #games
+
+    async def get_games(self, request):
+        return self._page(request, list(self.catalogue.games.values()))
+
+    async def get_game(self, request):
+        game = self._game(request)
+        return web.json_response(game) if game else _missing("game")
+
+    async def edit_game(self, request):
+        game = self._game(request)
+        if not game:
+            return _missing("game")
+
+        form = await self._form(request)
+        game.update({key: _coerce(value, game[key]) for key, value in form.items() if key in game and not isinstance(game[key], (dict, list))})
+        return web.json_response(game)
+
+    async def get_tag_options(self, request):
+        game = self._game(request)
+        return self._page(request, game["tag_options"]) if game else _missing("game")
+
+    async def add_tag_options(self, request):
+        game = self._game(request)
+        if not game:
+            return _missing("game")
+
+        form = await self._form(request)
+        option = next((option for option in game["tag_options"] if option["name"] == form.get("name")), None)
+        if option is None:
+            option = {"name": form.get("name"), "tags": []}
+            game["tag_options"].append(option)
+
+        option.update(type=form.get("type", "dropdown"), hidden=form.get("hidden") == "true")
+        option["tags"] += [tag for tag in _array(form, "tags") if tag not in option["tags"]]
+        return _message("You have successfully added tags to the specified game.")
+
+    async def delete_tag_options(self, request):
+        game = self._game(request)
+        if not game:
+            return _missing("game")
+
+        form = await self._form(request)
+        tags = [tag for tag in _array(form, "tags") if tag]
+        for option in list(game["tag_options"]):
+            if option["name"] == form.get("name"):
+                if tags:
+                    option["tags"] = [tag for tag in option["tags"] if tag not in tags]
+                else:
+                    game["tag_options"].remove(option)
+
+        return web.Response(status=204)
+
+    async def add_media(self, request):
+        await self._form(request)
+        return _message("You have successfully added new media.")
+
+    async def delete_media(self, request):
+        await self._form(request)
+        return web.Response(status=204)
+
+    #mods
+
+    async def get_mods(self, request):
+        game = self._game(request)
+        if not game:
+            return _missing("game")
+
+        return self._page(request, [self._render_mod(request, mod) for mod in self.catalogue.game_mods(game["id"])])
+
+    async def add_mod(self, request):
+        game = self._game(request)
+        if not game:
+            return _missing("game")
+
+        form = await self._form(request)
+        if "logo" not in form or "name" not in form or "summary" not in form:
+            return _error(422, "Validation Failed. Please see below to fix invalid input.")
+
+        catalogue = self.catalogue
+        id = catalogue.next_id("mod")
+        mod = mod_json(id, game["id"], form["name"], 1, _array(form, "tags"), int(time.time()))
+        mod["summary"] = form["summary"]
+        for key in ("description", "homepage_url", "metadata_blob", "name_id"):
+            if key in form:
+                mod[key] = form[key]
+
+        catalogue.add_mod(mod)
+        return web.json_response(mod, status=201)
+
+    async def get_mod(self, request):
+        mod = self._mod(request)
+        return web.json_response(self._render_mod(request, mod)) if mod else _missing("mod")
+
+    async def edit_mod(self, request):
+        mod = self._mod(request)
+        if not mod:
+            return _missing("mod")
+
+        form = await self._form(request)
+        mod.update({key: _coerce(value, mod[key]) if mod[key] is not None else value for key, value in form.items() if key in mod and not isinstance(mod[key], (dict, list))})
+        mod["date_updated"] = int(time.time())
+        return web.json_response(self._render_mod(request, mod))
+
+    async def delete_mod(self, request):
+        mod = self._mod(request)
+        if not mod:
+            return _missing("mod")
+
+        mod["status"] = 3
+        return web.Response(status=204)
+
+    async def get_game_events(self, request):
+        game = self._game(request)
+        if not game:
+            return _missing("game")
+
+        events = [event for mod in self.catalogue.game_mods(game["id"]) for event in self.catalogue.events[mod["id"]]]
+        return self._page(request, events)
+
+    async def get_game_stats(self, request):
+        game = self._game(request)
+        if not game:
+            return _missing("game")
+
+        return self._page(request, [mod["stats"] for mod in self.catalogue.game_mods(game["id"])])
+
+    async def get_mod_events(self, request):
+        mod = self._mod(request)
+        return self._page(request, self.catalogue.events[mod["id"]]) if mod else _missing("mod")
+
+    async def get_mod_stats(self, request):
+        mod = self._mod(request)
+        return web.json_response(mod["stats"]) if mod else _missing("mod")
+
+    #files
+
+    async def get_files(self, request):
+        mod = self._mod(request)
+        if not mod:
+            return _missing("mod")
+
+        return self._page(request, [self._download(request, file) for file in self.catalogue.files[mod["id"]].values()])
+
+    async def add_file(self, request):
+        mod = self._mod(request)
+        if not mod:
+            return _missing("mod")
+
+        form = await self._form(request)
+        upload = form.get("filedata")
+        if not isinstance(upload, Upload):
+            return _error(422, "Validation Failed. The filedata field is required.")
+
+        content = upload.content
+        file_id = self.catalogue.next_id("file")
+        file = modfile_json(file_id, mod["id"], content, form.get("version", "1.0"), int(time.time()))
+        if form.get("filehash") and form["filehash"] != file["filehash"]["md5"]:
+            return _error(422, "Validation Failed. The filehash does not match the uploaded file.")
+
+        file["filename"] = upload.filename or file["filename"]
+        file["changelog"] = form.get("changelog")
+        file["metadata_blob"] = form.get("metadata_blob")
+        self.catalogue.contents[file_id] = content
+        self.catalogue.files[mod["id"]][file_id] = file
+        if form.get("active", "true").lower() in ("1", "true"):
+            mod["modfile"] = file
+
+        self.catalogue.events[mod["id"]].append(event_json(self.catalogue.next_id("event"), mod["id"], 1, "MODFILE_CHANGED", int(time.time()), mod["game_id"]))
+        return web.json_response(self._download(request, file), status=201)
+
+    def _file(self, request):
+        mod = self._mod(request)
+        if mod:
+            return mod, self.catalogue.files[mod["id"]].get(int(request.match_info["file"]))
+
+        return None, None
+
+    async def get_file(self, request):
+        _, file = self._file(request)
+        return web.json_response(self._download(request, file)) if file else _missing("file")
+
+    async def edit_file(self, request):
+        mod, file = self._file(request)
+        if not file:
+            return _missing("file")
+
+        form = await self._form(request)
+        for key in ("version", "changelog", "metadata_blob"):
+            if key in form:
+                file[key] = form[key]
+
+        if form.get("active", "").lower() in ("1", "true"):
+            mod["modfile"] = file
+
+        return web.json_response(self._download(request, file))
+
+    async def delete_file(self, request):
+        mod, file = self._file(request)
+        if not file:
+            return _missing("file")
+
+        del self.catalogue.files[mod["id"]][file["id"]]
+        if mod["modfile"] and mod["modfile"]["id"] == file["id"]:
+            mod["modfile"] = None
+
+        return web.Response(status=204)
+
+    async def download(self, request):
+        file_id = int(request.match_info["file"])
+        try:
+            expires = int(request.query["expires"])
+            signature = request.query["signature"]
+        except (KeyError, ValueError):
+            return _error(403, "The download url is invalid.")
+
+        if not hmac.compare_digest(signature, self._sign(file_id, expires)):
+            return _error(403, "The download url is invalid.")
+
+        if expires < time.time():
+            return _error(410, "The download url has expired.")
+
+        content = self.catalogue.contents.get(file_id)
+        if content is None:
+            return _missing("file")
+
+        return web.Response(body=content, content_type="application/zip")
+
+    #tags, metadata and dependencies
+
+    async def get_tags(self, request):
+        mod = self._mod(request)
+        return self._page(request, mod["tags"]) if mod else _missing("mod")
+
+    async def add_tags(self, request):
+        mod = self._mod(request)
+        if not mod:
+            return _missing("mod")
+
+        form = await self._form(request)
+        names = {tag["name"] for tag in mod["tags"]}
+        mod["tags"] += [{"name": tag, "date_added": int(time.time())} for tag in _array(form, "tags") if tag not in names]
+        return _message("You have successfully added tags to the specified mod.")
+
+    async def delete_tags(self, request):
+        mod = self._mod(request)
+        if not mod:
+            return _missing("mod")
+
+        form = await self._form(request)
+        tags = {tag.lower() for tag in _array(form, "tags") if tag}
+        mod["tags"] = [tag for tag in mod["tags"] if tags and tag["name"].lower() not in tags]
+        return web.Response(status=204)
+
+    async def get_metadata(self, request):
+        mod = self._mod(request)
+        return self._page(request, self.catalogue.metadata[mod["id"]]) if mod else _missing("mod")
+
+    async def add_metadata(self, request):
+        mod = self._mod(request)
+        if not mod:
+            return _missing("mod")
+
+        form = await self._form(request)
+        for pair in _array(form, "metadata"):
+            key, *values = pair.split(":")
+            self.catalogue.metadata[mod["id"]] += [{"metakey": key, "metavalue": value} for value in values]
+
+        mod["metadata_kvp"] = self.catalogue.metadata[mod["id"]]
+        return _message("You have successfully added new key-value metadata to the specified mod.")
+
+    async def delete_metadata(self, request):
+        mod = self._mod(request)
+        if not mod:
+            return _missing("mod")
+
+        form = await self._form(request)
+        kvp = self.catalogue.metadata[mod["id"]]
+        for pair in _array(form, "metadata"):
+            key, *values = pair.split(":")
+            kvp[:] = [x for x in kvp if x["metakey"] != key or (values and x["metavalue"] not in values)]
+
+        return web.Response(status=204)
+
+    async def get_dependencies(self, request):
+        mod = self._mod(request)
+        return self._page(request, self.catalogue.dependencies[mod["id"]]) if mod else _missing("mod")
+
+    async def add_dependencies(self, request):
+        mod = self._mod(request)
+        if not mod:
+            return _missing("mod")
+
+        form = await self._form(request)
+        dependencies = self.catalogue.dependencies[mod["id"]]
+        known = {dependency["mod_id"] for dependency in dependencies}
+        dependencies += [{"mod_id": int(id), "date_added": int(time.time())} for id in _array(form, "dependencies") if int(id) not in known]
+        return _message("You have successfully added mod dependencies to the specified mod.")
+
+    async def delete_dependencies(self, request):
+        mod = self._mod(request)
+        if not mod:
+            return _missing("mod")
+
+        form = await self._form(request)
+        ids = {int(id) for id in _array(form, "dependencies")}
+        self.catalogue.dependencies[mod["id"]] = [x for x in self.catalogue.dependencies[mod["id"]] if x["mod_id"] not in ids]
+        return web.Response(status=204)
+
+    #subscriptions and ratings
+
+    async def subscribe(self, request):
+        mod = self._mod(request)
+        if not mod:
+            return _missing("mod")
+
+        if mod["id"] in self.catalogue.subscriptions:
+            return _error(400, "You are already subscribed to the specified mod.")
+
+        self.catalogue.subscriptions.add(mod["id"])
+        mod["stats"]["subscribers_total"] += 1
+        return web.json_response(self._render_mod(request, mod), status=201)
+
+    async def unsubscribe(self, request):
+        mod = self._mod(request)
+        if not mod:
+            return _missing("mod")
+
+        if mod["id"] not in self.catalogue.subscriptions:
+            return _error(400, "You are not subscribed to the specified mod.")
+
+        self.catalogue.subscriptions.discard(mod["id"])
+        mod["stats"]["subscribers_total"] -= 1
+        return web.Response(status=204)
+
+    async def add_rating(self, request):
+        mod = self._mod(request)
+        if not mod:
+            return _missing("mod")
+
+        form = await self._form(request)
+        rating = int(form.get("rating", 0))
+        if self.catalogue.ratings.get(mod["id"], 0) == rating:
+            return _error(400, "You have already rated this mod.")
+
+        previous = self.catalogue.ratings.get(mod["id"], 0)
+        self.catalogue.ratings[mod["id"]] = rating
+        stats = mod["stats"]
+        positive = stats["ratings_positive"] + (rating == 1) - (previous == 1)
+        negative = stats["ratings_negative"] + (rating == -1) - (previous == -1)
+        mod["stats"] = stats_json(mod["id"], stats["downloads_total"], stats["subscribers_total"], positive, negative)
+        return _message("You have successfully submitted a rating for the specified mod.")
+
+    #comments and team
+
+    async def get_comments(self, request):
+        mod = self._mod(request)
+        return self._page(request, self.catalogue.comments[mod["id"]]) if mod else _missing("mod")
+
+    def _comment(self, request):
+        mod = self._mod(request)
+        id = int(request.match_info["comment"])
+        return mod and next((comment for comment in self.catalogue.comments[mod["id"]] if comment["id"] == id), None)
+
+    async def get_comment(self, request):
+        comment = self._comment(request)
+        return web.json_response(comment) if comment else _missing("comment")
+
+    async def delete_comment(self, request):
+        comment = self._comment(request)
+        if not comment:
+            return _missing("comment")
+
+        self.catalogue.comments[comment["mod_id"]].remove(comment)
+        return web.Response(status=204)
+
+    async def get_team(self, request):
+        mod = self._mod(request)
+        return self._page(request, self.catalogue.team[mod["id"]]) if mod else _missing("mod")
+
+    async def add_team_member(self, request):
+        mod = self._mod(request)
+        if not mod:
+            return _missing("mod")
+
+        form = await self._form(request)
+        user_id = len(self.catalogue.users) + 1
+        self.catalogue.users[user_id] = user_json(user_id)
+        self.catalogue.team[mod["id"]].append(team_json(self.catalogue.next_id("team"), user_id, int(form.get("level", 1)), form.get("position", "Member")))
+        return _message("You have successfully invited the user to the team.")
+
+    def _member(self, request):
+        mod = self._mod(request)
+        id = int(request.match_info["member"])
+        return mod, mod and next((member for member in self.catalogue.team[mod["id"]] if member["id"] == id), None)
+
+    async def edit_team_member(self, request):
+        mod, member = self._member(request)
+        if not member:
+            return _missing("team member")
+
+        form = await self._form(request)
+        member["level"] = int(form.get("level", member["level"]))
+        member["position"] = form.get("position", member["position"])
+        return _message("You have successfully updated the specified team member.")
+
+    async def delete_team_member(self, request):
+        mod, member = self._member(request)
+        if not member:
+            return _missing("team member")
+
+        self.catalogue.team[mod["id"]].remove(member)
+        return web.Response(status=204)
+
+    #users
+
+    async def get_users(self, request):
+        return self._page(request, list(self.catalogue.users.values()))
+
+    async def get_user(self, request):
+        user = self.catalogue.users.get(int(request.match_info["user"]))
+        return web.json_response(user) if user else _missing("user")
+
+    async def get_me(self, request):
+        return web.json_response(self.catalogue.users[1])
+
+    async def get_my_subs(self, request):
+        return self._page(request, [self._render_mod(request, self.catalogue.mods[id]) for id in sorted(self.catalogue.subscriptions)])
+
+    async def get_my_events(self, request):
+        return self._page(request, [event_json(0, id, 1, "USER_SUBSCRIBE", EPOCH) for id in sorted(self.catalogue.subscriptions)])
+
+    async def get_my_games(self, request):
+        return self._page(request, [game for game in self.catalogue.games.values() if game["submitted_by"]["id"] == 1])
+
+    async def get_my_mods(self, request):
+        return self._page(request, [mod for mod in self.catalogue.mods.values() if mod["submitted_by"]["id"] == 1])
+
+    async def get_my_files(self, request):
+        return self._page(request, [self._download(request, file) for mod in self.catalogue.mods.values() if mod["submitted_by"]["id"] == 1 for file in self.catalogue.files[mod["id"]].values()])
+
+    async def get_my_ratings(self, request):
+        ratings = [{"game_id": self.catalogue.mods[id]["game_id"], "mod_id": id, "rating": rating, "date_added": EPOCH} for id, rating in sorted(self.catalogue.ratings.items())]
+        return self._page(request, ratings)
+
+    #misc
+
+    async def report(self, request):
+        await self._form(request)
+        return _message("You have successfully submitted a report and it will be reviewed by the mod.io team as soon as possible.")
+
+    async def get_owner(self, request):
+        form = await self._form(request)
+        type, id = form.get("resource_type"), int(form.get("resource_id", 0))
+        if type == "games" and id in self.catalogue.games:
+            return web.json_response(self.catalogue.games[id]["submitted_by"])
+        if type == "mods" and id in self.catalogue.mods:
+            return web.json_response(self.catalogue.mods[id]["submitted_by"])
+        if type == "files":
+            for mod_id, files in self.catalogue.files.items():
+                if id in files:
+                    return web.json_response(self.catalogue.mods[mod_id]["submitted_by"])
+
+        return _missing("resource")
+
+    async def email_request(self, request):
+        return _message("Enter the 5-digit security code sent to your email address.", 200)
+
+    async def email_exchange(self, request):
+        return web.json_response({"code": 200, "access_token": "stand-in-token"})
+
+class Server:
+    """A :class:`StandIn` running in a background thread, returned by :func:`serve`.
+
+    Attributes
+    -----------
+    standin : StandIn
+        The stand-in answering the requests
+    base_url : str
+        Base url of the API, to use as the `_base_path` of the clients
+    """
+    def __init__(self, standin, host, port):
+        self.standin = standin
+        self._loop = asyncio.new_event_loop()
+        self._runner = web.AppRunner(standin.app, access_log=None)
+        self._loop.run_until_complete(self._runner.setup())
+        site = web.TCPSite(self._runner, host, port)
+        self._loop.run_until_complete(site.start())
+        port = self._runner.addresses[0][1]
+        self.base_url = f"http://{host}:{port}/v1"
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+
+    def shutdown(self):
+        """Stops the server."""
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+def serve(host="127.0.0.1", port=0, *, catalogue=None, **options):
+    """Starts a :class:`StandIn` in a daemon thread and returns its :class:`Server`,
+    the base url of the API is available as `server.base_url`. The options are those
+    of :class:`StandIn`, by default the rate limit is high enough to never be reached."""
+    options.setdefault("rate_limit", 10 ** 9)
+    return Server(StandIn(catalogue, **options), host, port)
+
+if __name__ == '__main__':
+    args = [int(x) for x in sys.argv[1:]]
+    server = serve(port=args[0] if args else 8000, catalogue=Catalogue(mods=args[1] if len(args) > 1 else 100), rate_limit=60)
+    print(f"Serving on {server.base_url}")
+    threading.Event().wait()
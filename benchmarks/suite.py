@@ -0,0 +1,380 @@
+"""The benchmark suite of the wrapper's hot paths: building objects from the JSON of the API,
+building filters, walking a whole catalogue with both clients, hashing uploads and sending
+requests to the local stand-in of :mod:`benchmarks.server`.
+
+Results are written as JSON so runs of different commits can be compared, a comparison
+exits with 1 when a benchmark got slower than the threshold allows.
+
+    python -m benchmarks.suite [-o results.json] [-k name] [--quick]
+    python -m benchmarks.suite --compare baseline.json [-o results.json] [--threshold 0.1]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import modio
+import async_modio
+from modio.mod import Mod
+from modio.game import Game
+from modio.objects import User, Stats
+from modio import jsonlib
+from modio.lazy import _variants
+from .catalogue import Catalogue, user_json, page_json
+from .server import serve
+
+BENCHMARKS = {}
+
+def benchmark(name, unit="calls"):
+    """Registers a benchmark. The function receives the :class:`Environment` and returns
+    the callable to time along with the number of `unit` processed by each call."""
+    def decorator(func):
+        BENCHMARKS[name] = (func, unit)
+        return func
+
+    return decorator
+
+class Environment:
+    """The data and servers shared by the benchmarks, built when first needed."""
+    def __init__(self, mods=1000, file_size=16 * 1024 ** 2):
+        self.mods = mods
+        self.file_size = file_size
+        self.catalogue = Catalogue(games=1, mods=mods, files=1)
+        self._server = None
+        self._loop = None
+        self._closers = []
+        self._tmp = tempfile.TemporaryDirectory()
+
+    @property
+    def server(self):
+        if self._server is None:
+            self._server = serve(catalogue=self.catalogue)
+            self._closers.append(self._server.shutdown)
+
+        return self._server
+
+    @property
+    def loop(self):
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._closers.append(self._loop.close)
+
+        return self._loop
+
+    def client(self, **options):
+        client = type("Client", (modio.Client,), {"_base_path": self.server.base_url})(api_key="benchmark", **options)
+        self._closers.append(client.close)
+        return client
+
+    def async_client(self, **options):
+        cls = type("Client", (async_modio.Client,), {"_base_path": self.server.base_url})
+        client = cls(api_key="benchmark", loop=self.loop, **options)
+        self._closers.append(lambda: self.loop.run_until_complete(client.close()))
+        return client
+
+    def fixtures(self):
+        """The catalogue as fixtures of a :class:`modio.MemoryTransport`"""
+        return {
+            "GET /games": list(self.catalogue.games.values()),
+            "GET /games/{id}": self.catalogue.games[1],
+            "GET /games/{id}/mods": self.catalogue.game_mods(1),
+        }
+
+    def file(self):
+        path = os.path.join(self._tmp.name, "upload.zip")
+        if not os.path.exists(path):
+            with open(path, "wb") as f:
+                f.write(os.urandom(self.file_size))
+
+        return path
+
+    def close(self):
+        #the last resources created depend on the first ones, e.g. clients on the server
+        for close in reversed(self._closers):
+            close()
+
+        self._tmp.cleanup()
+
+#objects
+
+@benchmark("objects.mod", "objects")
+def bench_mod(env):
+    mods = env.catalogue.game_mods(1)[:100]
+    return lambda: [Mod(client=None, **mod) for mod in mods], len(mods)
+
+@benchmark("objects.mod.lazy", "objects")
+def bench_mod_lazy(env):
+    #building lazy mods and reading the attributes a listing typically shows
+    mods = env.catalogue.game_mods(1)[:100]
+    lazy = _variants[Mod]
+    def build():
+        return [(mod.id, mod.name) for mod in [lazy(client=None, **mod) for mod in mods]]
+
+    return build, len(mods)
+
+@benchmark("objects.game", "objects")
+def bench_game(env):
+    game = env.catalogue.games[1]
+    return lambda: [Game(client=None, **game) for _ in range(100)], 100
+
+@benchmark("objects.user", "objects")
+def bench_user(env):
+    users = [user_json(id) for id in range(1, 101)]
+    return lambda: [User(client=None, **user) for user in users], len(users)
+
+@benchmark("objects.stats", "objects")
+def bench_stats(env):
+    stats = [mod["stats"] for mod in env.catalogue.game_mods(1)[:100]]
+    return lambda: [Stats(**stat) for stat in stats], len(stats)
+
+#filters
+
+@benchmark("filter.build", "filters")
+def bench_filter(env):
+    def build():
+        return (modio.Filter().text("Dragon Knight").equals(game_id=1, visible=1).not_equals(status=3)
+                .values_in(tags=["Maps", "Weapons"]).like(name="*Dragon*").min(date_added=0)
+                .max(date_added=2 ** 31).sort("downloads_total", reverse=True).limit(50).offset(100))
+
+    return build, 1
+
+#pagination
+
+def _walk(game):
+    return sum(1 for _ in game.iter_mods())
+
+async def _walk_async(game):
+    count = 0
+    async for _ in game.iter_mods():
+        count += 1
+
+    return count
+
+@benchmark("paginate.sync.memory", "mods")
+def bench_paginate_memory(env):
+    client = modio.Client(api_key="benchmark", transport=modio.MemoryTransport(env.fixtures()))
+    game = client.get_game(1)
+    return lambda: _walk(game), env.mods
+
+@benchmark("paginate.sync.memory.lazy", "mods")
+def bench_paginate_memory_lazy(env):
+    client = modio.Client(api_key="benchmark", lazy=True, transport=modio.MemoryTransport(env.fixtures()))
+    game = client.get_game(1)
+    return lambda: _walk(game), env.mods
+
+@benchmark("paginate.sync.memory.raw", "mods")
+def bench_paginate_memory_raw(env):
+    #the game is needed to walk its mods, only the mods are returned as JSON
+    factory = lambda model, data, **kwargs: model(**data, **kwargs) if model is Game else data
+    client = modio.Client(api_key="benchmark", factory=factory, transport=modio.MemoryTransport(env.fixtures()))
+    game = client.get_game(1)
+    return lambda: _walk(game), env.mods
+
+@benchmark("paginate.async.memory", "mods")
+def bench_paginate_async_memory(env):
+    client = async_modio.Client(api_key="benchmark", transport=async_modio.MemoryTransport(env.fixtures()), loop=env.loop)
+    game = env.loop.run_until_complete(client.get_game(1))
+    return lambda: env.loop.run_until_complete(_walk_async(game)), env.mods
+
+@benchmark("paginate.sync.server", "mods")
+def bench_paginate_server(env):
+    game = env.client().get_game(1)
+    return lambda: _walk(game), env.mods
+
+@benchmark("paginate.async.server", "mods")
+def bench_paginate_async_server(env):
+    client = env.async_client()
+    game = env.loop.run_until_complete(client.get_game(1))
+    return lambda: env.loop.run_until_complete(_walk_async(game)), env.mods
+
+#uploads
+
+@benchmark("upload.hash", "bytes")
+def bench_file_hash(env):
+    path = env.file()
+    new = modio.NewModFile(version="1.0", changelog="")
+    return lambda: new._file_hash(path), env.file_size
+
+#requests
+
+@benchmark("request.sync", "requests")
+def bench_request(env):
+    client = env.client()
+    return lambda: client.get_game(1), 1
+
+@benchmark("request.sync.cached", "requests")
+def bench_request_cached(env):
+    client = env.client(cache=modio.MemoryCache())
+    return lambda: client.get_game(1), 1
+
+@benchmark("request.async", "requests")
+def bench_request_async(env):
+    client = env.async_client()
+    game = env.loop.run_until_complete(client.get_game(1))
+
+    async def run():
+        #distinct mods, identical requests in flight would be merged into one
+        await asyncio.gather(*[game.get_mod(id) for id in range(1, 11)])
+
+    return lambda: env.loop.run_until_complete(run()), 10
+
+#decoding
+
+def _page(env):
+    """The body of a /games/{id}/mods page of 100 mods."""
+    mods = env.catalogue.game_mods(1)[:100]
+    return json.dumps(page_json(mods, 0, 100, env.mods)).encode()
+
+@benchmark("decode.json", "bytes")
+def bench_decode_json(env):
+    body = _page(env)
+    return lambda: json.loads(body), len(body)
+
+if jsonlib.orjson is not None:
+    @benchmark("decode.orjson", "bytes")
+    def bench_decode_orjson(env):
+        body = _page(env)
+        return lambda: jsonlib.orjson.loads(body), len(body)
+
+@benchmark("request.sync.mods", "mods")
+def bench_request_mods(env):
+    #the default backend, orjson if it is installed
+    game = env.client().get_game(1)
+    return lambda: game.get_mods(filter=modio.Filter().limit(100)), 100
+
+@benchmark("request.sync.mods.json", "mods")
+def bench_request_mods_json(env):
+    game = env.client(json_loads=json.loads).get_game(1)
+    return lambda: game.get_mods(filter=modio.Filter().limit(100)), 100
+
+def measure(func, *, min_time=0.2, repeat=5):
+    """Times a callable and returns the statistics of the time of one call in seconds. The
+    number of calls of each sample is raised until a sample lasts at least `min_time`."""
+    func()
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+
+        loops *= 10 if elapsed < min_time / 10 else 2
+
+    samples = [elapsed / loops]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+
+        samples.append((time.perf_counter() - start) / loops)
+
+    return {
+        "loops": loops,
+        "repeat": repeat,
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "mean": statistics.mean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+    }
+
+def _commit():
+    try:
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=root, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run(names=None, *, mods=1000, min_time=0.2, repeat=5, log=sys.stderr):
+    """Runs the benchmarks whose name contains one of `names`, all of them by default, and
+    returns the results in the format written by the command line."""
+    env = Environment(mods=mods)
+    results = {}
+    try:
+        for name, (func, unit) in BENCHMARKS.items():
+            if names and not any(part in name for part in names):
+                continue
+
+            call, count = func(env)
+            result = measure(call, min_time=min_time, repeat=repeat)
+            result.update(unit=unit, per_call=count, throughput=count / result["median"])
+            results[name] = result
+            print(f"{name:<26} {result['median'] * 1000:10.3f} ms {result['throughput']:14.1f} {unit}/s", file=log)
+    finally:
+        env.close()
+
+    return {
+        "meta": {
+            "commit": _commit(),
+            "date": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "mods": mods,
+            "json": jsonlib.BACKEND,
+        },
+        "results": results,
+    }
+
+def compare(baseline, current, *, threshold=0.1, log=sys.stderr):
+    """Compares the median times of two runs and returns the names of the benchmarks
+    which are more than `threshold` slower than in the baseline."""
+    regressions = []
+    for name, result in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+
+        ratio = result["median"] / before["median"]
+        if ratio > 1 + threshold:
+            regressions.append(name)
+            flag = "SLOWER"
+        elif ratio < 1 - threshold:
+            flag = "faster"
+        else:
+            flag = ""
+
+        print(f"{name:<26} {before['median'] * 1000:10.3f} ms -> {result['median'] * 1000:10.3f} ms {ratio:6.2f}x {flag}", file=log)
+
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite", description="Benchmarks the hot paths of the wrapper.")
+    parser.add_argument("-o", "--output", help="file the JSON results are written to, stdout by default")
+    parser.add_argument("-k", dest="names", action="append", help="only run the benchmarks whose name contains this, can be repeated")
+    parser.add_argument("--compare", metavar="BASELINE", help="JSON results of a previous run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1, help="slowdown tolerated by --compare, default is 0.1 (10%%)")
+    parser.add_argument("--mods", type=int, default=1000, help="size of the catalogue walked by the pagination benchmarks")
+    parser.add_argument("--quick", action="store_true", help="shorter and noisier samples")
+    args = parser.parse_args(argv)
+
+    results = run(args.names, mods=args.mods, min_time=0.05 if args.quick else 0.2, repeat=3 if args.quick else 5)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+        regressions = compare(baseline, results, threshold=args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s): {', '.join(regressions)}", file=sys.stderr)
+            return 1
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
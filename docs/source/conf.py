@@ -191,7 +191,9 @@ rst_prolog = """
 .. |corourl| replace:: *coroutine*
 .. _corourl: https://docs.python.org/3/library/asyncio-task.html#coroutine
 .. |async| replace:: Exclusive to the |async-version| of the wrapper
+.. |sync| replace:: Exclusive to the sync version of the wrapper, use ``asyncio.gather`` in the |async-version|
 .. |async-version| replace:: :ref:`async version <async-version>`
+.. |aiter| replace:: In the |async-version| of the wrapper, this function returns an asynchronous iterator to be used with ``async for``.
 .. |filterable| replace:: This method takes :ref:`filtering arguments <filter>`
 """
 
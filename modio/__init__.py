@@ -4,6 +4,11 @@ modio is a python wrapper to interact with the mod.io API.
 
 from .client import Client
 from .objects import NewMod, NewModFile, Object, Filter
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .cache import Cache, MemoryCache, SQLiteCache
+from .transport import Transport, RequestsTransport, MemoryTransport
+from .metrics import Metrics, RequestInfo
 from .enums import *
 from .errors import *
 
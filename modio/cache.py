@@ -0,0 +1,443 @@
+import abc
+import collections
+import contextlib
+import functools
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from urllib.parse import urlencode
+
+CacheEntry = collections.namedtuple("CacheEntry", "body expires etag last_modified", defaults=(None, None))
+
+_ids = re.compile(r"/\d+(?=/|$)")
+_mod = re.compile(r"^(/games/\d+)/mods/\d+(?=/|$)")
+
+def _template(path):
+    """Returns the endpoint template of a path, e.g. /games/{id}/mods for /games/5/mods"""
+    return _ids.sub("/{id}", path)
+
+def _path(key):
+    """Returns the path of the request identified by a key"""
+    return key.split(" ", 1)[-1].split("?", 1)[0]
+
+def _busy(error):
+    """Whether an SQLite error is caused by another connection holding the lock"""
+    return "locked" in str(error) or "busy" in str(error)
+
+def _try(conn, statement, params):
+    """Runs a statement of the SQLite cache that may be skipped if the database is busy"""
+    try:
+        conn.execute(statement, params)
+    except sqlite3.OperationalError as e:
+        if not _busy(e):
+            raise
+
+@functools.lru_cache(maxsize=64)
+def _fingerprint(credentials):
+    """Returns a digest identifying an access token or API key without storing it in the cache."""
+    return hashlib.sha256(credentials.encode()).hexdigest()[:16]
+
+def _ancestors(path):
+    """Returns the paths containing a path, e.g. /games/5/mods and /games/5 for /games/5/mods/2"""
+    parts = path.rstrip("/").split("/")
+    return ["/".join(parts[:i]) for i in range(len(parts) - 1, 1, -1)]
+
+def _scope(path):
+    """Returns the paths whose whole subtree is outdated by a write to a path and the paths
+    outdated on their own, see :func:`Cache.invalidate`."""
+    path = path.rstrip("/")
+    trees = [path]
+    paths = _ancestors(path)
+    mod = _mod.match(path)
+    if mod is not None:
+        #ratings, subscriptions, files... of a mod change its stats and events, which are
+        #also listed for the whole game
+        game = mod.group(1)
+        trees.append(mod.group(0))
+        paths += [game + "/mods/stats", game + "/mods/events"]
+
+    return trees, paths
+
+class Cache(abc.ABC):
+    """Base class of the GET response caches which can be passed to :class:`modio.Client`
+    and :class:`async_modio.Client`. The cache stores the raw body of successful responses
+    so that each hit is decoded into new model objects without any network I/O. Responses of
+    the /me endpoints, which depend on the access token, are never cached. Entries are keyed
+    by a fingerprint of the access token or API key of the request, so a cache shared by
+    clients with different credentials never serves the responses of one to another.
+
+    Entries are kept after they expire if the response had an ETag or Last-Modified header,
+    the next request then revalidates them with If-None-Match/If-Modified-Since and a 304
+    Not Modified response refreshes the stored body instead of downloading it again.
+
+    With `stale_ttl` an expired entry keeps being returned right away for that many seconds
+    while it is refreshed in the background (in a thread for :class:`modio.Client`, in a
+    task for :class:`async_modio.Client`), so no caller waits on the refresh. With
+    `negative_ttl` NotFound and Gone responses are cached too and raised again on a hit.
+
+    Every POST, PUT and DELETE request made by the client invalidates the entries it could
+    have made outdated, see :func:`invalidate`, so long TTLs do not serve stale data after
+    a write made through the same cache.
+
+    Caches are thread-safe, a single instance can be shared by clients used from several threads.
+    To write your own storage subclass it and implement :func:`get`, :func:`set`, :func:`delete`,
+    :func:`invalidate` and :func:`clear`.
+
+    Parameters
+    -----------
+    ttl : Optional[float]
+        Number of seconds a response is used without asking the API, 0 disables caching of
+        responses without validators and always revalidates the others. Default is 60.
+    ttls : Optional[Dict[str, float]]
+        Per endpoint TTLs overriding `ttl`, keyed by endpoint template with IDs replaced
+        by {id}. E.g. `{"/games/{id}": 3600, "/games/{id}/mods": 30}`
+    stale_ttl : Optional[float]
+        Number of seconds after its expiry an entry is still served while being refreshed.
+        Default is 0, expired entries are refreshed before being returned.
+    negative_ttl : Optional[float]
+        Number of seconds NotFound and Gone responses are cached. Default is 0, they are
+        not cached.
+
+    Attributes
+    -----------
+    hits : int
+        Number of requests answered from the cache
+    misses : int
+        Number of requests which were not in the cache or had expired
+    revalidated : int
+        Number of expired entries the API answered with 304 Not Modified
+    stale : int
+        Number of requests answered with an expired entry while it was refreshed
+    """
+    def __init__(self, *, ttl = 60, ttls = None, stale_ttl = 0, negative_ttl = 0):
+        self.ttl = ttl
+        self.ttls = ttls or {}
+        self.stale_ttl = stale_ttl
+        self.negative_ttl = negative_ttl
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.stale = 0
+        self._lock = threading.RLock()
+
+    def _count(self, name):
+        """Increments one of the counters, a cache can be shared by several threads."""
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def ttl_for(self, path):
+        """Returns the number of seconds responses of the given path are kept for."""
+        return self.ttls.get(_template(path), self.ttl)
+
+    @staticmethod
+    def key(method, path, params, lang, credentials = None):
+        """Returns the key identifying a request. Params are sorted so that two
+        filters with the same arguments give the same key. If the access token or API
+        key of the request is given as `credentials` its fingerprint is part of the key
+        in place of the `api_key` parameter."""
+        items = params.items()
+        owner = ""
+        if credentials is not None:
+            items = [(key, value) for key, value in items if key != "api_key"]
+            owner = "@" + _fingerprint(credentials)
+
+        query = urlencode(sorted((str(key), str(value)) for key, value in items))
+        return f"{method} {path}?{query}#{lang}{owner}"
+
+    def _usable(self, entry, now):
+        """Whether an entry can still be returned by :func:`get`."""
+        return entry.expires + self.stale_ttl > now or bool(entry.etag or entry.last_modified)
+
+    @abc.abstractmethod
+    def get(self, key):
+        """Returns the CacheEntry stored for the key or None. Expired entries are only returned
+        if they are within `stale_ttl` or can be revalidated."""
+
+    @abc.abstractmethod
+    def set(self, key, entry):
+        """Stores a CacheEntry for the key."""
+
+    @abc.abstractmethod
+    def delete(self, key):
+        """Removes the entry stored for the key if there is one."""
+
+    @abc.abstractmethod
+    def invalidate(self, path):
+        """Removes the entries of the requests to a path which was modified: those of the path
+        itself and of the paths below it, as well as those of the paths above it which list or
+        embed it. E.g. editing /games/5/mods/2 removes /games/5/mods/2, /games/5/mods/2/files,
+        /games/5/mods, /games/5 and /games but keeps /games/5/mods/3.
+
+        A write to any path of a mod also removes every entry of the mod and the stats and
+        events of the mods of its game. E.g. rating /games/5/mods/2 through
+        /games/5/mods/2/ratings removes /games/5/mods/2/stats, /games/5/mods/2/events,
+        /games/5/mods/stats and /games/5/mods/events.
+
+        Returns the number of entries removed."""
+
+    @abc.abstractmethod
+    def clear(self):
+        """Removes every entry from the cache."""
+
+class MemoryCache(Cache):
+    """An in-memory :class:`Cache` which evicts the least recently used entries
+    once it holds more than `max_entries` entries or `max_bytes` bytes of bodies.
+
+    Parameters
+    -----------
+    max_entries : Optional[int]
+        Maximum number of responses stored. Default is 1024.
+    max_bytes : Optional[int]
+        Maximum total size of the stored bodies in bytes. Default is 16MB.
+    ttl : Optional[float]
+        See :class:`Cache`
+    ttls : Optional[Dict[str, float]]
+        See :class:`Cache`
+
+    Attributes
+    -----------
+    size : int
+        Total size of the stored bodies in bytes
+    """
+    def __init__(self, *, max_entries = 1024, max_bytes = 16 * 1024 * 1024, **kwargs):
+        super().__init__(**kwargs)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"<MemoryCache entries={len(self)} size={self.size} hits={self.hits} misses={self.misses} stale={self.stale}>"
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            if not self._usable(entry, time.time()):
+                self._remove(key)
+                return None
+
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, entry):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            if len(entry.body) > self.max_bytes:
+                return
+
+            self._entries[key] = entry
+            self.size += len(entry.body)
+            while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key):
+        self.size -= len(self._entries.pop(key).body)
+
+    def delete(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def invalidate(self, path):
+        with self._lock:
+            trees, paths = _scope(path)
+            paths = set(paths).union(trees)
+            prefixes = tuple(tree + "/" for tree in trees)
+            keys = [key for key in self._entries if _path(key) in paths or _path(key).startswith(prefixes)]
+            for key in keys:
+                self._remove(key)
+
+            return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+class SQLiteCache(Cache):
+    """A :class:`Cache` stored in an SQLite database file which can be shared by several
+    processes on the same machine, a response fetched by one of them is then served to
+    the others and a restarted process starts with a warm cache.
+
+    The database is opened in WAL mode so that readers never block the writer. Each thread
+    uses its own connection. Once the database holds more than `max_entries` entries or
+    `max_bytes` bytes of bodies, the least recently used entries are evicted.
+
+    The async client calls the cache on the event loop, so storing a response and recording
+    when an entry was last read are best-effort: if another connection holds the lock for
+    longer than `store_timeout` they are skipped, the response is then simply not cached or
+    the entry is evicted a little earlier. Only invalidations and deletions, which must not
+    be skipped, wait up to `timeout`.
+
+    Parameters
+    -----------
+    path : str
+        Path of the database file, created if it does not exist.
+    max_entries : Optional[int]
+        Maximum number of responses stored. Default is 65536.
+    max_bytes : Optional[int]
+        Maximum total size of the stored bodies in bytes. Default is 256MB.
+    timeout : Optional[float]
+        Number of seconds invalidations and deletions wait for another connection to release
+        its lock on the database. Default is 5.
+    store_timeout : Optional[float]
+        Number of seconds the best-effort writes wait for the lock before being skipped.
+        Default is 0.05.
+    ttl : Optional[float]
+        See :class:`Cache`
+    ttls : Optional[Dict[str, float]]
+        See :class:`Cache`
+    """
+    def __init__(self, path, *, max_entries = 65536, max_bytes = 256 * 1024 * 1024, timeout = 5.0, store_timeout = 0.05, **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.store_timeout = store_timeout
+        self._local = threading.local()
+        self._connections = []
+
+        with self._waiting() as conn:
+            self._create(conn)
+
+    def _create(self, conn):
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, path TEXT NOT NULL, body BLOB NOT NULL, size INTEGER NOT NULL, "
+            "expires REAL NOT NULL, etag TEXT, last_modified TEXT, accessed REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS entries_path ON entries (path)")
+        conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+        #running totals so that checking the bounds does not scan the table
+        conn.execute("CREATE TABLE IF NOT EXISTS totals (id INTEGER PRIMARY KEY CHECK (id = 0), count INTEGER NOT NULL, size INTEGER NOT NULL)")
+        conn.execute("INSERT OR IGNORE INTO totals VALUES (0, 0, 0)")
+        conn.execute(
+            "CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries BEGIN "
+            "UPDATE totals SET count = count + 1, size = size + NEW.size; END"
+        )
+        conn.execute(
+            "CREATE TRIGGER IF NOT EXISTS entries_update AFTER UPDATE OF size ON entries BEGIN "
+            "UPDATE totals SET size = size + NEW.size - OLD.size; END"
+        )
+        conn.execute(
+            "CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries BEGIN "
+            "UPDATE totals SET count = count - 1, size = size - OLD.size; END"
+        )
+
+    def __len__(self):
+        return self._connection().execute("SELECT count FROM totals").fetchone()[0]
+
+    def __repr__(self):
+        return f"<SQLiteCache path={self.path} hits={self.hits} misses={self.misses}>"
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self.store_timeout, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+
+        return conn
+
+    @contextlib.contextmanager
+    def _waiting(self):
+        """Lets the statements run in the block wait up to `timeout` for the lock, the
+        connections otherwise only wait `store_timeout`."""
+        conn = self._connection()
+        conn.execute(f"PRAGMA busy_timeout = {int(self.timeout * 1000)}")
+        try:
+            yield conn
+        finally:
+            conn.execute(f"PRAGMA busy_timeout = {int(self.store_timeout * 1000)}")
+
+    @property
+    def size(self):
+        """Total size of the stored bodies in bytes"""
+        return self._connection().execute("SELECT size FROM totals").fetchone()[0]
+
+    def get(self, key):
+        conn = self._connection()
+        row = conn.execute("SELECT body, expires, etag, last_modified FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+
+        now = time.time()
+        entry = CacheEntry(bytes(row[0]), *row[1:])
+        if not self._usable(entry, now):
+            #an unusable entry is never returned, removing it can wait for a later lookup
+            _try(conn, "DELETE FROM entries WHERE key = ? AND expires = ?", (key, entry.expires))
+            return None
+
+        _try(conn, "UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+        return entry
+
+    def set(self, key, entry):
+        conn = self._connection()
+        size = len(entry.body)
+        if size > self.max_bytes:
+            _try(conn, "DELETE FROM entries WHERE key = ?", (key,))
+            return
+
+        try:
+            with conn:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute(
+                    "INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?) ON CONFLICT (key) DO UPDATE SET "
+                    "body = excluded.body, size = excluded.size, expires = excluded.expires, etag = excluded.etag, "
+                    "last_modified = excluded.last_modified, accessed = excluded.accessed",
+                    (key, _path(key), entry.body, size, entry.expires, entry.etag, entry.last_modified, time.time())
+                )
+                self._evict(conn)
+        except sqlite3.OperationalError as e:
+            if not _busy(e):
+                raise
+
+    def _evict(self, conn):
+        count, size = conn.execute("SELECT count, size FROM totals").fetchone()
+        while count > self.max_entries or size > self.max_bytes:
+            excess = max(count - self.max_entries, 1)
+            conn.execute("DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY accessed LIMIT ?)", (excess,))
+            count, size = conn.execute("SELECT count, size FROM totals").fetchone()
+
+    def delete(self, key):
+        with self._waiting() as conn:
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def invalidate(self, path):
+        trees, paths = _scope(path)
+        #"0" sorts right after "/", the range covers every path below a tree
+        ranges = " OR ".join("(path > ? AND path < ?)" for tree in trees)
+        paths += trees
+        with self._waiting() as conn:
+            cursor = conn.execute(
+                f"DELETE FROM entries WHERE {ranges} OR path IN ({', '.join('?' * len(paths))})",
+                (*(bound for tree in trees for bound in (tree + "/", tree + "0")), *paths)
+            )
+        return cursor.rowcount
+
+    def clear(self):
+        with self._waiting() as conn:
+            conn.execute("DELETE FROM entries")
+
+    def close(self):
+        """Closes the connections to the database of every thread."""
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+
+            self._connections.clear()
+        self._local = threading.local()
@@ -1,13 +1,20 @@
-import requests
-import json
+import copy
+import functools
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Union
 
 from .game import Game
 from .mod import Mod
 from .errors import *
 from .objects import *
+from .utils import _rewind, _paginate, _chunk_ids, _value
+from .core import BaseClient, MISS
+from .metrics import RequestInfo
+from .transport import RequestsTransport
 
-class Client:
+class Client(BaseClient):
     """Represents the base-level client to make requests to the mod.io API with. Upon
     initializiation the Client will confirm the api key and O Auth 2 token.
 
@@ -31,6 +38,55 @@ class Client:
     version : Optional[str]
         An optional keyword argument to allow you to pick a specific version of the API to query,
         usually you shouldn't need to change this. Default is the latest supported version.
+    pool_size : Optional[int]
+        Maximum number of keep-alive connections the client's Session will hold open to the 
+        mod.io API. Raise this if the client is shared by many threads. Default is 10.
+    session_per_thread : Optional[bool]
+        Whether each thread using the client gets its own Session and connection pool
+        instead of sharing the client's. Default is False.
+    transport : Optional[Transport]
+        The transport sending the requests, e.g. a :class:`MemoryTransport`. Default is a
+        :class:`RequestsTransport` built with `pool_size` and `session_per_thread`.
+    workers : Optional[int]
+        Maximum number of calls run at the same time by :func:`submit` and :func:`batch`.
+        Default is 10.
+    ratelimit : Optional[RateLimiter]
+        The rate limiter pacing the requests of this client. Clients using the same API key/access
+        token can share one to draw from the same budget. Default is a new RateLimiter.
+    retry : Optional[RetryPolicy]
+        The policy deciding which requests rejected with a 429 or a transient server error
+        are sent again and how long to wait between attempts. Default is a RetryPolicy with
+        its default settings, pass `RetryPolicy(max_attempts=1)` to disable retrying.
+    cache : Optional[Cache]
+        A cache in which the responses to GET requests are stored, e.g. a :class:`MemoryCache`.
+        Default is None, nothing is cached.
+    metrics : Optional[Metrics]
+        Where the counters and latency histograms of the requests are recorded and the hooks
+        called at each of their stages are registered. Clients can share one to aggregate
+        their metrics. Default is a new Metrics.
+    lazy : Optional[bool]
+        Whether the games, mods, users and mod files returned are lazy: they keep their JSON
+        and only build each attribute (nested objects, enums, datetimes...) the first time
+        it is read. Faster when only a few attributes of each result are used, e.g. the ids
+        and names of a page of mods, but they take more memory. Default is False.
+    raw : Optional[bool]
+        Whether the results are returned as the JSON of the API instead of models, e.g. for
+        bulk exports which only need the data. Lists of results are still returned as a
+        Returned with the Pagination of the page. Games and mods being JSON too, see
+        `factory` to keep the methods of some models. Default is False.
+    factory : Optional[Callable[..., Any]]
+        A function called with the model class, the JSON and the keyword arguments the
+        model would be built with (the client...) for each result, the client returns what
+        it returns instead of the model. It can for example build the games and return the
+        JSON of their mods: `lambda model, data, **kwargs: model(**data, **kwargs) if model is
+        Game else data`. The keyset walks of the iter methods and the methods getting
+        results by ids read the ids of what it returns, which must be dicts or have the
+        attributes of the models. Results which are not models, e.g. the tags of a mod, are
+        passed with the function building them and returned in a list instead of a dict.
+        Cannot be used along with `raw`. Default is None.
+    json_loads : Optional[Callable[[bytes], Any]]
+        The function decoding the JSON bodies of the responses from bytes. Default is
+        orjson.loads if orjson is installed, otherwise json.loads.
     loop : Optional[asyncio.EventLoop]
         |async| An optional keyword argument allowing you to pass a loop, if no loop is passed the Client
         will get the current event loop. 
@@ -40,22 +96,62 @@ class Client:
     rate_limit : int
         Number of requests that can be made using the supplied API Key/access token.
     rate_remain : int
-        Number of requests remaining. Once this number hits 0 the requests will become 
-        rejected and the library will sleep until the limit resets then raise 429 TooManyRequests.
+        Number of requests remaining. Once this number hits 0 the requests are queued
+        by the library until the limit resets instead of being rejected with a 429 TooManyRequests.
     rate_retry : int
         Number of seconds until the rate limits are reset for this API Key/access token.
         Is 0 until the rate_remain is 0 and becomes 0 again once the rate limit is reset. 
+    ratelimit : RateLimiter
+        The rate limiter pacing the requests of this client.
+    retry : RetryPolicy
+        The retry policy of this client.
+    retries : int
+        Number of requests which have been sent again after failing.
+    retry_time : float
+        Number of seconds lost to retries, from the start of each failed attempt until the
+        request is sent again.
+    cache : Cache
+        The cache of the GET responses, None if caching is disabled.
+    coalesced : int
+        Number of GET requests which were not sent because an identical one was already
+        in flight in another thread, their callers shared its response instead.
+    transport : Transport
+        The transport sending every request. Closed by :func:`close`.
+    metrics : Metrics
+        The metrics of the requests of this client, see :func:`Metrics.snapshot` and
+        :func:`Metrics.prometheus`.
+    lazy : bool
+        Whether the results are built lazily.
+    raw : bool
+        Whether the results are returned as JSON.
+    factory : Callable[..., Any]
+        The function building the results, None if the models are built.
+    json_loads : Callable[[bytes], Any]
+        The function decoding the JSON bodies of the responses.
+
+    Methods of the models whose request is answered with 204 No Content, such as
+    :func:`Mod.delete` or :func:`Comment.delete`, return None.
+
+    The Client can be used as a context manager, in which case :func:`close` is called
+    on exit.
+
+    The Client is thread-safe, a single instance can be shared by all the threads of a
+    program (e.g. the workers of a ThreadPoolExecutor). The rate limit state, the counters
+    and the cache are locked, and identical GET requests made at the same time by different
+    threads are merged into a single request whose response is shared.
     """
 
-    def __init__(self, *, api_key = None, auth = None, lang = "en", version = "v1", test = False):
-        self.api_key = api_key
-        self.access_token = auth
-        self.lang = lang
-        self.version = version
-        self.rate_limit = None
-        self.rate_remain = None
-        self.rate_retry = 0
-        self.test = test
+    def __init__(self, *, api_key = None, auth = None, lang = "en", version = "v1", test = False, pool_size = 10, session_per_thread = False, transport = None, workers = 10, ratelimit = None, retry = None, cache = None, metrics = None, lazy = False, raw = False, factory = None, json_loads = None):
+        super().__init__(api_key=api_key, auth=auth, lang=lang, version=version, test=test, ratelimit=ratelimit, retry=retry, cache=cache, metrics=metrics, lazy=lazy, raw=raw, factory=factory, json_loads=json_loads)
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._flights = {}
+
+        self.transport = transport or RequestsTransport(pool_size=pool_size, session_per_thread=session_per_thread)
+        self.workers = workers
+        self._executor = None
+        self._pending = set()
+        self._worker = threading.local()
         
         #check o auth 2 token
         if self.access_token:
@@ -68,113 +164,255 @@ class Client:
             self.get_games()
 
     def close(self):
-        """|async| This function is used to clean up the client in order to close the application that it uses gracefully.
-        At the moment it is only used to close the client's Session.
+        """This function is used to clean up the client in order to close the application that it uses gracefully.
+        It waits for the calls made with :func:`submit` to finish, cancels the ones which have not
+        started and closes the client's transport to release its pooled connections."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            pending, self._pending = self._pending, set()
 
-        |coro|"""
-        pass
+        if executor is not None:
+            #shutdown only learnt to cancel the queued calls itself in Python 3.9
+            for future in list(pending):
+                future.cancel()
 
-    @property
-    def _base_path(self):
-        if self.test:
-            return f"https://api.test.mod.io/{self.version}"
-        else:
-            return f"https://api.mod.io/{self.version}"
+            executor.shutdown(wait=True)
 
-    def __repr__(self):
-        return f"<Client rate_limit={self.rate_limit} rate_retry={self.rate_retry} rate_remain={self.rate_remain}>"
-    
-    def _error_check(self, r):
-        """Updates the rate-limit attributes and check validity of the request."""
-        self.rate_limit = r.headers.get("X-RateLimit-Limit", self.rate_limit)
-        self.rate_remain = r.headers.get("X-RateLimit-Remaining", self.rate_remain)
-        self.rate_retry = r.headers.get("X-Ratelimit-RetryAfter", 0)
-
-        if r.status_code == 204:
-            return r
-
-        request_json = r.json()
-        if "error" in request_json:
-            code = request_json["error"]["code"]
-            msg = request_json["error"]["message"]
-            if code == 400:
-                raise BadRequest(msg)
-            elif code == 401:
-                raise Unauthorized(msg)
-            elif code == 403:
-                raise Forbidden(msg)
-            elif code == 404:
-                raise NotFound(msg)
-            elif code == 405:
-                raise MethodNotAllowed(msg)
-            elif code == 406:
-                raise NotAcceptable(msg)
-            elif code == 410:
-                raise Gone(msg)
-            elif code == 422:
-                if "errors" in request_json["error"]:
-                    errors = request_json["error"]["errors"]
-                else:
-                    errors = None
-                raise UnprocessableEntity(msg, errors)
-            elif code == 429:
-                raise TooManyRequests(msg, self.rate_retry)
-            else:
-                raise modioException(msg)
-        else:
-            return request_json
-
-    def _define_headers(self, h_type):
-        if h_type == 0:
-            #regular O auth 2 header when submitting data
-            headers = {
-                'Authorization': 'Bearer ' + self.access_token,
-                'Content-Type': 'application/x-www-form-urlencoded',
-                'Accept': 'application/json',
-                'Accept-Language': self.lang
-            }
-        elif h_type == 1:
-            #o auth 2 header for submitting multipart/data, had to remove Content-Type
-            #because it is already added by the requests lib when defining a files parameter
-            headers = {
-                'Authorization': 'Bearer ' + self.access_token,
-                'Accept': 'application/json',
-                'Accept-Language': self.lang
-            }
-        elif h_type == 2:
-            #header to use when making calls using the api key, the key itself is added in
-            #the parameters in the methods below
-            headers = {
-                'Accept': 'application/json',
-                'Accept-Language': self.lang,
-                'Content-Type': 'application/x-www-form-urlencoded'
-            }
-
-        return headers
+        self.transport.close()
 
-    def _get_request(self, url, *, h_type=0, **fields):
-        f = fields.pop("filter", None)
-        f = (f if f else Filter()).__dict__.copy()
-        extra = {**fields, **f}
+    def _start_worker(self):
+        self._worker.active = True
+
+    def submit(self, fn, *args, **kwargs):
+        """Schedules a call on the client's pool of worker threads and returns a Future
+        for its result, so that several requests can be in flight at the same time. Requests
+        are still paced by the client's :class:`RateLimiter`. Calls submitted from inside
+        a worker are run right away to avoid waiting on the pool they are holding.
+
+        |sync|
+
+        Example
+        --------
+        .. code-block:: python
+
+            futures = [client.submit(game.get_mod, id) for id in (1, 2, 3)]
+            mods = [future.result() for future in futures]
+
+        Parameters
+        -----------
+        fn : Callable
+            The function to call, e.g. a method of the client or of one of its models
+        args
+            Positional arguments of the call
+        kwargs
+            Keyword arguments of the call
+
+        Returns
+        --------
+        concurrent.futures.Future
+            The future result of the call
+        """
+        if getattr(self._worker, "active", False):
+            future = Future()
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except Exception as e:
+                future.set_exception(e)
 
-        if not self.access_token:
-            extra["api_key"] = self.api_key
-            h_type = 2
+            return future
 
-        r  = requests.get(self._base_path + url, headers=self._define_headers(h_type), params=extra)
-        return self._error_check(r)
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="modio", initializer=self._start_worker)
+
+            future = self._executor.submit(fn, *args, **kwargs)
+            self._pending.add(future)
+            future.add_done_callback(self._pending.discard)
+            return future
+
+    def batch(self, calls, *, return_exceptions=False):
+        """Runs several calls concurrently on the client's pool of worker threads, see
+        :func:`submit`, and returns their results in the same order.
+
+        |sync|
+
+        Example
+        --------
+        .. code-block:: python
+
+            stats, files = client.batch([mod.get_stats, (mod.get_files, )])
+            mods = client.batch([(game.get_mod, id) for id in ids])
+
+        Parameters
+        -----------
+        calls : Iterable[Union[Callable, Tuple]]
+            The calls to make, either functions taking no argument or tuples of a function
+            followed by its positional arguments.
+        return_exceptions : Optional[bool]
+            If True the exception raised by a call is returned in place of its result,
+            otherwise the first exception is raised and the calls which have not started yet
+            are cancelled. Default is False.
+
+        Returns
+        --------
+        List
+            The results of the calls
+        """
+        futures = [self.submit(*call) if isinstance(call, tuple) else self.submit(call) for call in calls]
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                if not return_exceptions:
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+
+                results.append(e)
+
+        return results
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _request(self, method, url, *, info, h_type=0, cache_key=None, entry=None, **fields):
+        try:
+            result = self._attempts(method, url, info, h_type, cache_key, entry, fields)
+        except BaseException as e:
+            self.metrics._done(info, e)
+            raise
+
+        self.metrics._done(info)
+        return result
+
+    def _attempts(self, method, url, info, h_type, cache_key, entry, fields):
+        metrics = self.metrics
+        on_headers = functools.partial(metrics._headers, info)
+        failed_at = None
+        while True:
+            waited = self.ratelimit.acquire()
+            if failed_at is not None:
+                with self._lock:
+                    self.retries += 1
+                    self.retry_time += time.monotonic() - failed_at
+
+            metrics._send(info, waited)
+            start = time.monotonic()
+            try:
+                r = self.transport.send(method, self._base_path + url, headers=self._request_headers(h_type, entry), on_headers=on_headers, **fields)
+            except BaseException:
+                #cancelled and interrupted requests must release their reservation too
+                self.ratelimit.update()
+                raise
+
+            if info.status is None:
+                metrics._headers(info, r.status)
+
+            metrics._body(info, len(r.body))
+            self.ratelimit.update(r.headers, r.status)
+            if not self.retry.should_retry(method, r.status, info.attempt):
+                return self._response(url, r.status, r.headers, r.body, info, cache_key, entry)
+
+            #429s are held back by the rate limiter until the limit resets instead of backing off
+            failed_at = start
+            if r.status != 429:
+                time.sleep(self.retry.delay(info.attempt))
+
+            info.attempt += 1
+            _rewind(fields.get("files"))
+
+    def _revalidate(self, key, url, h_type, extra, entry):
+        with self._lock:
+            if key in self._refreshing:
+                return
+
+            self._refreshing.add(key)
+
+        threading.Thread(target=self._refresh, args=(key, url, h_type, extra, entry), daemon=True).start()
+
+    def _refresh(self, key, url, h_type, extra, entry):
+        try:
+            self._request("GET", url, info=RequestInfo("GET", url), h_type=h_type, cache_key=key, entry=entry, params=extra)
+        except Exception:
+            #nobody is waiting for the result, the entry is served until it is refreshed or too stale
+            pass
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _invalidate(self, url):
+        #the request may have changed the resource even if it failed
+        if self.cache is not None:
+            self.cache.invalidate(url)
+
+        #requests sent before the write may return outdated data, later ones must not join them
+        with self._lock:
+            self._flights.clear()
+
+    def _get_request(self, url, *, h_type=0, **fields):
+        info = self._start("GET", url)
+        h_type, extra = self._get_params(h_type, fields)
+        key, entry, result = self._lookup(url, h_type, extra, info)
+        if result is not MISS:
+            self.metrics._done(info)
+            return result
+
+        #identical GETs made at the same time by different threads share a single request
+        flight = self._flight(url, extra, key)
+        with self._lock:
+            future = self._flights.get(flight)
+            leader = future is None
+            if leader:
+                future = self._flights[flight] = Future()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            self.metrics._coalesced(info)
+            try:
+                #every caller builds its own models, they must not share the decoded JSON
+                result = copy.deepcopy(future.result())
+            except BaseException as e:
+                self.metrics._done(info, e)
+                raise
+
+            self.metrics._done(info)
+            return result
+
+        try:
+            result = self._request("GET", url, info=info, h_type=h_type, cache_key=key, entry=entry, params=extra)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                if self._flights.get(flight) is future:
+                    del self._flights[flight]
+
+        future.set_result(result)
+        return result
 
     def _post_request(self, url, *, h_type=0, **fields):
-        r = requests.post(self._base_path + url, headers=self._define_headers(h_type), **fields)
-        return self._error_check(r)
+        try:
+            return self._request("POST", url, info=self._start("POST", url, fields.get("data")), h_type=h_type, **fields)
+        finally:
+            self._invalidate(url)
 
     def _put_request(self, url, *, h_type=0, **fields):
-        r = requests.put(self._base_path + url, headers=self._define_headers(h_type), **fields)
-        return self._error_check(r)
+        try:
+            return self._request("PUT", url, info=self._start("PUT", url, fields.get("data")), h_type=h_type, **fields)
+        finally:
+            self._invalidate(url)
 
     def _delete_request(self, url, *, h_type=0, **fields):
-        r = requests.delete(self._base_path + url, headers=self._define_headers(h_type), **fields)
-        return self._error_check(r)
+        try:
+            return self._request("DELETE", url, info=self._start("DELETE", url, fields.get("data")), h_type=h_type, **fields)
+        finally:
+            self._invalidate(url)
 
     def get_game(self, id):
         """Queries the mod.io API for the given game ID and if found returns it as a 
@@ -199,7 +437,7 @@ class Client:
         
         """
         game_json = self._get_request(f'/games/{id}')
-        return Game(client=self, **game_json)
+        return self._model(Game, game_json, client=self)
 
     def get_games(self, *, filter=None):
         """Gets all the games available on mod.io. Returns a 
@@ -219,7 +457,32 @@ class Client:
             The results and pagination tuple from this request    
         """
         game_json = self._get_request('/games', filter=filter)
-        return Returned([Game(client=self, **game) for game in game_json["data"]], Pagination(**game_json))
+        return self._models(Game, game_json, client=self)
+
+    def iter_games(self, *, filter=None, keyset=False):
+        """Iterates over all the games available on mod.io, lazily fetching one page at a 
+        time so that only the current page is kept in memory. Pages are as large as the API 
+        allows unless the filter sets a limit. |filterable|
+
+        |aiter|
+
+        Parameters
+        -----------
+        filter : Optional[Filter]
+            A instance of Filter to be used for filtering and sorting results, its offset 
+            is used as the starting point.
+        keyset : Optional[bool]
+            Walk the results sorted by id with a cursor on the last id seen instead of an 
+            offset. Every result is returned exactly once even if results are added or removed 
+            during the walk and deep pages are as fast as the first ones. Overrides the sorting 
+            and offset of the filter.
+
+        Yields
+        -------
+        Game
+            The games available on mod.io
+        """
+        return _paginate(self.get_games, filter or Filter(), "id" if keyset else None)
 
     def get_user(self, id):
         """Gets a user with the specified ID.
@@ -243,7 +506,30 @@ class Client:
 
         """
         user_json = self._get_request(f"/users/{id}")
-        return User(client=self, **user_json)
+        return self._model(User, user_json, client=self)
+
+    def get_users_by_ids(self, ids):
+        """Gets several users by their IDs. Rather than requesting each user, the IDs 
+        are split into chunks which fit in a single `id-in` filter and the chunks are requested 
+        concurrently, so thousands of users only take tens of requests.
+
+        |coro|
+
+        Parameters
+        -----------
+        ids : Iterable[int]
+            The IDs of the users to get, duplicates are ignored.
+
+        Returns
+        --------
+        Fetched[Dict[int, User], List[int]]
+            The users found keyed by ID and the IDs for which no user was found
+        """
+        ids = list(dict.fromkeys(ids))
+        pages = self.batch([(lambda chunk=chunk: self.get_users(filter=Filter().values_in(id=chunk).limit(len(chunk)))) for chunk in _chunk_ids(ids)])
+        results = {_value(user, "id", "id") : user for page in pages for user in page.results}
+
+        return Fetched(results, [id for id in ids if id not in results])
 
     def get_users(self, *, filter=None):
         """Gets all the users availaible on mod.io. Returns 
@@ -264,8 +550,33 @@ class Client:
                
         """
         user_json = self._get_request("/users", filter=filter)
-        return Returned([User(client=self, **user) for user in user_json["data"]], Pagination(**user_json))
+        return self._models(User, user_json, client=self)
     
+    def iter_users(self, *, filter=None, keyset=False):
+        """Iterates over all the users available on mod.io, lazily fetching one page at a 
+        time so that only the current page is kept in memory. Pages are as large as the API 
+        allows unless the filter sets a limit. |filterable|
+
+        |aiter|
+
+        Parameters
+        -----------
+        filter : Optional[Filter]
+            A instance of Filter to be used for filtering and sorting results, its offset 
+            is used as the starting point.
+        keyset : Optional[bool]
+            Walk the results sorted by id with a cursor on the last id seen instead of an 
+            offset. Every result is returned exactly once even if results are added or removed 
+            during the walk and deep pages are as fast as the first ones. Overrides the sorting 
+            and offset of the filter.
+
+        Yields
+        -------
+        User
+            The users available on mod.io
+        """
+        return _paginate(self.get_users, filter or Filter(), "id" if keyset else None)
+
     def get_my_user(self):
         """Gets the authenticated user's details (aka the user who created the API key/access token)
 
@@ -283,7 +594,7 @@ class Client:
         
         """
         me_json = self._get_request("/me")
-        return User(client=self, **me_json)
+        return self._model(User, me_json, client=self)
 
     def get_my_subs(self, *, filter=None):
         """Gets all the mods the authenticated user is subscribed to. |filterable|
@@ -307,7 +618,32 @@ class Client:
             The results and pagination tuple from this request
         """
         mod_json = self._get_request("/me/subscribed", filter=filter)
-        return Returned([Mod(client=self, **mod) for mod in mod_json["data"]], Pagination(**mod_json))
+        return self._models(Mod, mod_json, client=self)
+
+    def iter_my_subs(self, *, filter=None, keyset=False):
+        """Iterates over all the mods the authenticated user is subscribed to, lazily fetching one page at a 
+        time so that only the current page is kept in memory. Pages are as large as the API 
+        allows unless the filter sets a limit. |filterable|
+
+        |aiter|
+
+        Parameters
+        -----------
+        filter : Optional[Filter]
+            A instance of Filter to be used for filtering and sorting results, its offset 
+            is used as the starting point.
+        keyset : Optional[bool]
+            Walk the results sorted by id with a cursor on the last id seen instead of an 
+            offset. Every result is returned exactly once even if results are added or removed 
+            during the walk and deep pages are as fast as the first ones. Overrides the sorting 
+            and offset of the filter.
+
+        Yields
+        -------
+        Mod
+            The mods the user is subscribed to
+        """
+        return _paginate(self.get_my_subs, filter or Filter(), "id" if keyset else None)
 
     def get_my_events(self, *, filter=None):
         """Get events that have been fired specifically for the authenticated user. |filterable|
@@ -326,7 +662,32 @@ class Client:
             The results and pagination tuple from this request
         """
         events_json = self._get_request("/me/events", filter=filter)
-        return Returned([Event(**event) for event in events_json["data"]], Pagination(**events_json))
+        return self._models(Event, events_json)
+
+    def iter_my_events(self, *, filter=None, keyset=False):
+        """Iterates over the events that have been fired specifically for the authenticated user, lazily fetching one page at a 
+        time so that only the current page is kept in memory. Pages are as large as the API 
+        allows unless the filter sets a limit. |filterable|
+
+        |aiter|
+
+        Parameters
+        -----------
+        filter : Optional[Filter]
+            A instance of Filter to be used for filtering and sorting results, its offset 
+            is used as the starting point.
+        keyset : Optional[bool]
+            Walk the results sorted by id with a cursor on the last id seen instead of an 
+            offset. Every result is returned exactly once even if results are added or removed 
+            during the walk and deep pages are as fast as the first ones. Overrides the sorting 
+            and offset of the filter.
+
+        Yields
+        -------
+        Event
+            The events of the user
+        """
+        return _paginate(self.get_my_events, filter or Filter(), "id" if keyset else None)
 
     def get_my_games(self, filter=None):
         """Get all the games the authenticated user added or is a team member of. |filterable|
@@ -350,7 +711,32 @@ class Client:
             The results and pagination tuple from this request
         """
         game_json = self._get_request("/me/games", filter=filter)
-        return Returned([Game(client=self, **game) for game in game_json["data"]], Pagination(**game_json))
+        return self._models(Game, game_json, client=self)
+
+    def iter_my_games(self, *, filter=None, keyset=False):
+        """Iterates over all the games the authenticated user added or is a team member of, lazily fetching one page at a 
+        time so that only the current page is kept in memory. Pages are as large as the API 
+        allows unless the filter sets a limit. |filterable|
+
+        |aiter|
+
+        Parameters
+        -----------
+        filter : Optional[Filter]
+            A instance of Filter to be used for filtering and sorting results, its offset 
+            is used as the starting point.
+        keyset : Optional[bool]
+            Walk the results sorted by id with a cursor on the last id seen instead of an 
+            offset. Every result is returned exactly once even if results are added or removed 
+            during the walk and deep pages are as fast as the first ones. Overrides the sorting 
+            and offset of the filter.
+
+        Yields
+        -------
+        Game
+            The games of the user
+        """
+        return _paginate(self.get_my_games, filter or Filter(), "id" if keyset else None)
 
     def get_my_mods(self, *, filter=None):
         """Get all the mods the authenticated user added or is a team member of. |filterable|
@@ -374,7 +760,32 @@ class Client:
             The results and pagination tuple from this request
         """
         mod_json = self._get_request("/me/mods", filter=filter)
-        return Returned([Mod(client=self, **mod) for mod in mod_json["data"]], Pagination(**mod_json))
+        return self._models(Mod, mod_json, client=self)
+
+    def iter_my_mods(self, *, filter=None, keyset=False):
+        """Iterates over all the mods the authenticated user added or is a team member of, lazily fetching one page at a 
+        time so that only the current page is kept in memory. Pages are as large as the API 
+        allows unless the filter sets a limit. |filterable|
+
+        |aiter|
+
+        Parameters
+        -----------
+        filter : Optional[Filter]
+            A instance of Filter to be used for filtering and sorting results, its offset 
+            is used as the starting point.
+        keyset : Optional[bool]
+            Walk the results sorted by id with a cursor on the last id seen instead of an 
+            offset. Every result is returned exactly once even if results are added or removed 
+            during the walk and deep pages are as fast as the first ones. Overrides the sorting 
+            and offset of the filter.
+
+        Yields
+        -------
+        Mod
+            The mods of the user
+        """
+        return _paginate(self.get_my_mods, filter or Filter(), "id" if keyset else None)
 
     def get_my_modfiles(self, *, filter=None):
         """Get all the mods the authenticated user uploaded. The returned modfile objects cannot be
@@ -400,7 +811,32 @@ class Client:
             The results and pagination tuple from this request
         """
         files_json = self._get_request("/me/files", filter=filter)
-        return Returned([ModFile(**file, client=self) for file in files_json["data"]], Pagination(**files_json))
+        return self._models(ModFile, files_json, client=self)
+
+    def iter_my_modfiles(self, *, filter=None, keyset=False):
+        """Iterates over all the modfiles the authenticated user uploaded, lazily fetching one page at a 
+        time so that only the current page is kept in memory. Pages are as large as the API 
+        allows unless the filter sets a limit. |filterable|
+
+        |aiter|
+
+        Parameters
+        -----------
+        filter : Optional[Filter]
+            A instance of Filter to be used for filtering and sorting results, its offset 
+            is used as the starting point.
+        keyset : Optional[bool]
+            Walk the results sorted by id with a cursor on the last id seen instead of an 
+            offset. Every result is returned exactly once even if results are added or removed 
+            during the walk and deep pages are as fast as the first ones. Overrides the sorting 
+            and offset of the filter.
+
+        Yields
+        -------
+        ModFile
+            The modfiles of the user
+        """
+        return _paginate(self.get_my_modfiles, filter or Filter(), "id" if keyset else None)
 
     def get_my_ratings(self, *, filter=None):
         """Get all the ratings the authentitated user has submitted. Returns a named
@@ -426,8 +862,28 @@ class Client:
         """
 
         ratings = self._get_request("/me/ratings", filter=filter)
-        return Returned([Rating(**rating, client=self) for rating in ratings["data"]], Pagination(**ratings))
+        return self._models(Rating, ratings, client=self)
         
+    def iter_my_ratings(self, *, filter=None):
+        """Iterates over all the ratings the authenticated user has submitted, lazily fetching one page at a 
+        time so that only the current page is kept in memory. Pages are as large as the API 
+        allows unless the filter sets a limit. |filterable|
+
+        |aiter|
+
+        Parameters
+        -----------
+        filter : Optional[Filter]
+            A instance of Filter to be used for filtering and sorting results, its offset 
+            is used as the starting point.
+
+        Yields
+        -------
+        Rating
+            The ratings of the user
+        """
+        return _paginate(self.get_my_ratings, filter or Filter())
+
     def email_request(self, email):
         """Posts an email request for an OAuth2 token. A code will be sent to the given email address
         which can then be entered into :func:`email_exchange`. 
@@ -442,7 +898,7 @@ class Client:
         """
 
         r = self._post_request("/oauth/emailrequest", params={'email' : email, 'api_key': self.api_key}, h_type = 2)
-        return Message(**r)
+        return self._model(Message, r)
 
     def email_exchange(self, code):
         """Exchanges the given 5-digit code for an OAuth2 token.
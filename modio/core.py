@@ -0,0 +1,323 @@
+"""The parts of the clients which do not depend on how requests are sent: building the
+headers and parameters of a request, looking it up in the cache and turning a response
+into JSON or into the matching exception. :class:`modio.Client` and :class:`async_modio.Client`
+both subclass :class:`BaseClient` and only implement the sending of requests, so anything
+done here applies to both of them.
+"""
+
+import abc
+import time
+import urllib.parse
+
+from .errors import *
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .cache import Cache, CacheEntry
+from .metrics import Metrics, RequestInfo, _current
+from .lazy import _variants
+from . import jsonlib
+from .objects import Returned, Pagination
+
+MISS = object()
+
+_errors = {
+    400: BadRequest,
+    401: Unauthorized,
+    403: Forbidden,
+    404: NotFound,
+    405: MethodNotAllowed,
+    406: NotAcceptable,
+    410: Gone,
+}
+
+def _is_json(headers, body):
+    """Whether a body is to be decoded as JSON, bodies without a Content-Type are assumed to be."""
+    if not body:
+        return False
+
+    content_type = headers.get("Content-Type")
+    return content_type is None or "json" in content_type
+
+def form_fields(data, files):
+    """Returns the fields of a multipart form as (name, value, filename, content type) tuples,
+    skipping the None values. Files can be given as file objects or (filename, file) tuples."""
+    fields = [(key, str(value), None, None) for key, value in data.items() if value is not None]
+    for key, value in files.items():
+        if value is None:
+            continue
+
+        if isinstance(value, tuple):
+            fields.append((key, value[1], value[0], "multipart/form-data"))
+        else:
+            fields.append((key, value, None, "multipart/form-data"))
+
+    return fields
+
+class BaseClient(abc.ABC):
+    """State and sans-IO logic shared by the sync and async clients, see :class:`modio.Client`
+    for the parameters and attributes."""
+    #the classes lists of results are returned in, each package has its own
+    _returned = Returned
+    _pagination = Pagination
+
+    def __init__(self, *, api_key = None, auth = None, lang = "en", version = "v1", test = False, ratelimit = None, retry = None, cache = None, metrics = None, lazy = False, raw = False, factory = None, json_loads = None):
+        if raw and factory is not None:
+            raise ValueError("A client cannot be both raw and have a factory")
+
+        self.api_key = api_key
+        self.access_token = auth
+        self.lang = lang
+        self.version = version
+        self.ratelimit = ratelimit or RateLimiter()
+        self.retry = retry or RetryPolicy()
+        self.retries = 0
+        self.retry_time = 0.0
+        self.cache = cache
+        self.metrics = metrics or Metrics()
+        self.lazy = lazy
+        self.raw = raw
+        self.factory = factory
+        self.json_loads = json_loads or jsonlib.loads
+        self.test = test
+        self.coalesced = 0
+        self._headers = {}
+
+    @property
+    def _base_path(self):
+        if self.test:
+            return f"https://api.test.mod.io/{self.version}"
+        else:
+            return f"https://api.mod.io/{self.version}"
+
+    @property
+    def rate_limit(self):
+        return self.ratelimit.limit
+
+    @property
+    def rate_remain(self):
+        return self.ratelimit.remaining
+
+    @property
+    def rate_retry(self):
+        return self.ratelimit.retry
+
+    def __repr__(self):
+        return f"<Client rate_limit={self.rate_limit} rate_retry={self.rate_retry} rate_remain={self.rate_remain}>"
+
+    def _json_check(self, request_json):
+        """Raises the error returned by the API if the decoded response is one, otherwise returns it."""
+        if "error" not in request_json:
+            return request_json
+
+        code = request_json["error"]["code"]
+        msg = request_json["error"]["message"]
+        if code in _errors:
+            raise _errors[code](msg)
+        elif code == 422:
+            raise UnprocessableEntity(msg, request_json["error"].get("errors"))
+        elif code == 429:
+            raise TooManyRequests(msg, self.rate_retry)
+        else:
+            raise modioException(msg)
+
+    def _define_headers(self, h_type):
+        #the headers only change with the token and language, they are built once for each
+        key = (h_type, self.access_token, self.lang)
+        headers = self._headers.get(key)
+        if headers is not None:
+            return headers
+
+        if h_type == 0:
+            #regular O auth 2 header when submitting data
+            headers = {
+                'Authorization': 'Bearer ' + self.access_token,
+                'Content-Type': 'application/x-www-form-urlencoded',
+                'Accept': 'application/json',
+                'Accept-Language': self.lang
+            }
+        elif h_type == 1:
+            #o auth 2 header for submitting multipart/data, had to remove Content-Type
+            #because it is already added by the http lib when defining a files parameter
+            headers = {
+                'Authorization': 'Bearer ' + self.access_token,
+                'Accept': 'application/json',
+                'Accept-Language': self.lang
+            }
+        elif h_type == 2:
+            #header to use when making calls using the api key, the key itself is added in
+            #the parameters in the methods below
+            headers = {
+                'Accept': 'application/json',
+                'Accept-Language': self.lang,
+                'Content-Type': 'application/x-www-form-urlencoded'
+            }
+
+        self._headers[key] = headers
+        return headers
+
+    def _request_headers(self, h_type, entry):
+        """Returns the headers of a request, with the validators of a cache entry if any."""
+        headers = self._define_headers(h_type)
+        if entry is None or not (entry.etag or entry.last_modified):
+            return headers
+
+        headers = headers.copy()
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+
+        return headers
+
+    def _get_params(self, h_type, fields):
+        """Returns the header type and the query parameters of a GET request."""
+        f = fields.pop("filter", None)
+        extra = {**fields, **f.__dict__} if f else fields
+
+        if not self.access_token:
+            extra["api_key"] = self.api_key
+            h_type = 2
+
+        return h_type, extra
+
+    def _start(self, method, url, data = None):
+        """Returns the :class:`RequestInfo` of a new request and makes it the one whose models are
+        built next in the current context."""
+        info = RequestInfo(method, url)
+        if data:
+            info.bytes_sent = len(urllib.parse.urlencode({key: value for key, value in data.items() if value is not None}))
+
+        _current.set(info)
+        return info
+
+    def _flight(self, url, extra, key):
+        """Returns the key identifying identical GET requests in flight."""
+        return key or Cache.key("GET", url, extra, self.lang, self.access_token or self.api_key)
+
+    def _lookup(self, url, h_type, extra, info):
+        """Looks a GET request up in the cache. Returns its cache key, the entry found and the
+        decoded response if the entry can be used as it is or MISS if the request must be sent.
+        Stale entries are returned as they are and handed to `_revalidate`."""
+        if self.cache is None or url.startswith("/me"):
+            return None, None, MISS
+
+        key = self.cache.key("GET", url, extra, self.lang, self.access_token or self.api_key)
+        entry = self.cache.get(key)
+        now = time.time()
+        if entry is not None and entry.expires > now:
+            self.cache._count("hits")
+            self.metrics._cached(info, "hit")
+            return key, entry, self._json_check(self.json_loads(entry.body))
+
+        if entry is not None and entry.expires + self.cache.stale_ttl > now:
+            #serve the expired entry right away and refresh it in the background
+            self.cache._count("stale")
+            self.metrics._cached(info, "stale")
+            self._revalidate(key, url, h_type, extra, entry)
+            return key, entry, self._json_check(self.json_loads(entry.body))
+
+        self.cache._count("misses")
+        self.metrics._cached(info, "miss")
+        return key, entry, MISS
+
+    @abc.abstractmethod
+    def _revalidate(self, key, url, h_type, extra, entry):
+        """Refreshes a stale cache entry in the background."""
+
+    def _response(self, url, status, headers, body, info, cache_key=None, entry=None):
+        """Turns the final response to a request into its result: the decoded JSON, None if
+        it has no content or its content is not JSON, or the matching exception. `body` is
+        the raw content of the response."""
+        if status == 304 and entry is not None:
+            #the cached body is still valid, only its expiry is refreshed
+            self.cache._count("revalidated")
+            self._cache(cache_key, url, entry.body, headers.get("ETag", entry.etag), headers.get("Last-Modified", entry.last_modified))
+            return self.json_loads(entry.body)
+
+        if status == 204 or not _is_json(headers, body):
+            if status >= 400:
+                raise _errors.get(status, modioException)(f"{status}: {body[:200].decode(errors='replace')}")
+
+            return None
+
+        start = time.perf_counter()
+        decoded = self.json_loads(body)
+        self.metrics._decoded(info, time.perf_counter() - start)
+        try:
+            result = self._json_check(decoded)
+        except (NotFound, Gone):
+            if cache_key is not None:
+                self._cache_missing(cache_key, body)
+            raise
+
+        if cache_key is not None and status == 200:
+            self._cache(cache_key, url, body, headers.get("ETag"), headers.get("Last-Modified"))
+
+        return result
+
+    def _build(self, build, data, kwargs):
+        if isinstance(build, type):
+            if self.raw:
+                return data
+            if self.factory is not None:
+                return self.factory(build, data, **kwargs)
+            if self.lazy:
+                build = _variants.get(build, build)
+
+        #models rebuilt in place are passed as their __init__ and always built
+        return build(**data, **kwargs)
+
+    def _model(self, build, data, **kwargs):
+        """Builds a model from the decoded response to the request made last in the current
+        context, timing it for the metrics. Raw clients return the JSON as is, clients with
+        a factory return what it makes of the JSON and lazy clients build the lazy variant
+        of the model, if it has one."""
+        info = _current.get()
+        if info is None:
+            return self._build(build, data, kwargs)
+
+        start = time.perf_counter()
+        model = self._build(build, data, kwargs)
+        _current.set(None)
+        self.metrics._built(info, time.perf_counter() - start)
+        return model
+
+    def _models(self, build, data, *, collect=None, **kwargs):
+        """Builds the models of a page of results like :func:`_model`, returns them in a
+        Returned with the pagination of the page. Endpoints whose results are not models
+        pass the function building each result and `collect`, called with the list of
+        built results, e.g. `dict` for pairs. Raw clients and factories return lists."""
+        info = _current.get()
+        start = time.perf_counter()
+        if self.raw:
+            results = data["data"]
+        elif self.factory is not None:
+            factory = self.factory
+            results = [factory(build, item, **kwargs) for item in data["data"]]
+        else:
+            if self.lazy:
+                build = _variants.get(build, build)
+
+            results = [build(**item, **kwargs) for item in data["data"]]
+            if collect is not None:
+                results = collect(results)
+
+        models = self._returned(results, self._pagination(**data))
+        if info is not None:
+            _current.set(None)
+            self.metrics._built(info, time.perf_counter() - start)
+
+        return models
+
+    def _cache(self, key, url, body, etag, last_modified):
+        ttl = self.cache.ttl_for(url)
+        if ttl > 0 or etag or last_modified:
+            self.cache.set(key, CacheEntry(body, time.time() + ttl, etag, last_modified))
+
+    def _cache_missing(self, key, body):
+        if self.cache.negative_ttl > 0:
+            self.cache.set(key, CacheEntry(body, time.time() + self.cache.negative_ttl))
+        else:
+            #a stale copy of the deleted resource must not be served anymore
+            self.cache.delete(key)
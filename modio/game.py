@@ -1,11 +1,14 @@
 from .mod import Mod
 from .objects import *
+from .lazy import lazy
+from .schema import model, GAME
 from .errors import modioException
-from .utils import _convert_date, _clean_and_convert, find
+from .utils import _clean_and_convert, find, _paginate, _chunk_ids, _value
 from .enums import Submission
 
 import json
 
+@model(GAME)
 class Game:
     """Represents an instance of a Game. Do not create manually.
     
@@ -66,34 +69,11 @@ class Game:
         List of tags from which mods can pick
 
     """
-    def __init__(self, **attrs):
-        self.id = attrs.pop("id")
-        self.status = Status(attrs.pop("status"))
-        self.date = _convert_date(attrs.pop("date_added"))
-        self.updated = _convert_date(attrs.pop("date_updated"))
-        self.live = _convert_date(attrs.pop("date_live"))
-        self.presentation = Presentation(attrs.pop("presentation_option"))
-        self.submission = Submission(attrs.pop("submission_option"))
-        self.curation = Curation(attrs.pop("curation_option"))
-        self.community = Community(attrs.pop("community_options"))
-        self.revenue = Revenue(attrs.pop("revenue_options"))
-        self.api = APIAccess(attrs.pop("api_access_options", ))
-        self.ugc = attrs.pop("ugc_name")
-        self.icon = Image(**attrs.pop("icon", None))
-        self.logo = Image(**attrs.pop("logo", None))
-        self.header = Image(**attrs.pop("header", None))
-        self.homepage = attrs.pop("homepage", None)
-        self.name = attrs.pop("name")
-        self.name_id = attrs.pop("name_id")
-        self.summary = attrs.pop("summary")
-        self.instructions = attrs.pop("instructions", None)
-        self.instructions_url = attrs.pop("instructions_url", None)
-        self.profile = attrs.pop("profile_url")
-        self.tag_options = [TagOption(**tag) for tag in attrs.pop("tag_options", [])]
-        self.maturity_options = MaturityOptions(attrs.pop("maturity_options"))
-        self._client = attrs.pop("client")
-        self.submitter = User(client=self._client, **attrs.pop("submitted_by"))
-        
+    __slots__ = ("id", "status", "date", "updated", "live", "presentation", "submission",
+                 "curation", "community", "revenue", "api", "ugc", "icon", "logo", "header",
+                 "homepage", "name", "name_id", "summary", "instructions", "instructions_url",
+                 "profile", "tag_options", "maturity_options", "_client", "submitter")
+
     def __repr__(self):
         return f'<Game id={self.id} name={self.name}>'
 
@@ -128,7 +108,30 @@ class Game:
         
         """
         mod_json = self._client._get_request(f"/games/{self.id}/mods/{id}")
-        return Mod(client=self._client, **mod_json)
+        return self._client._model(Mod, mod_json, client=self._client)
+
+    def get_mods_by_ids(self, ids):
+        """Gets several mods of this game by their IDs. Rather than requesting each mod, the IDs 
+        are split into chunks which fit in a single `id-in` filter and the chunks are requested 
+        concurrently, so thousands of mods only take tens of requests.
+
+        |coro|
+
+        Parameters
+        -----------
+        ids : Iterable[int]
+            The IDs of the mods to get, duplicates are ignored.
+
+        Returns
+        --------
+        Fetched[Dict[int, Mod], List[int]]
+            The mods found keyed by ID and the IDs for which no mod was found
+        """
+        ids = list(dict.fromkeys(ids))
+        pages = self._client.batch([(lambda chunk=chunk: self.get_mods(filter=Filter().values_in(id=chunk).limit(len(chunk)))) for chunk in _chunk_ids(ids)])
+        results = {_value(mod, "id", "id") : mod for page in pages for mod in page.results}
+
+        return Fetched(results, [id for id in ids if id not in results])
 
     def get_mods(self, *, filter=None):
         """Gets all the mods available for the game. Returns a 
@@ -149,7 +152,32 @@ class Game:
                
         """
         mod_json = self._client._get_request(f"/games/{self.id}/mods", filter=filter)
-        return Returned([Mod(client=self._client, **mod) for mod in mod_json["data"]], Pagination(**mod_json))
+        return self._client._models(Mod, mod_json, client=self._client)
+
+    def iter_mods(self, *, filter=None, keyset=False):
+        """Iterates over all the mods available for the game, lazily fetching one page at a 
+        time so that only the current page is kept in memory. Pages are as large as the API 
+        allows unless the filter sets a limit. |filterable|
+
+        |aiter|
+
+        Parameters
+        -----------
+        filter : Optional[Filter]
+            A instance of Filter to be used for filtering and sorting results, its offset 
+            is used as the starting point.
+        keyset : Optional[bool]
+            Walk the results sorted by id with a cursor on the last id seen instead of an 
+            offset. Every result is returned exactly once even if results are added or removed 
+            during the walk and deep pages are as fast as the first ones. Overrides the sorting 
+            and offset of the filter.
+
+        Yields
+        -------
+        Mod
+            The mods of the game
+        """
+        return _paginate(self.get_mods, filter or Filter(), "id" if keyset else None)
 
     def get_mod_events(self, *, filter=None):
         """Gets all the mod events available for this game sorted by latest event first. |filterable|
@@ -170,7 +198,32 @@ class Game:
         """
         event_json = self._client._get_request(f"/games/{self.id}/mods/events", filter=filter)
 
-        return Returned([Event(**event) for event in event_json["data"]], Pagination(**event_json))
+        return self._client._models(Event, event_json)
+
+    def iter_mod_events(self, *, filter=None, keyset=False):
+        """Iterates over all the mod events available for this game, latest event first, lazily fetching one page at a 
+        time so that only the current page is kept in memory. Pages are as large as the API 
+        allows unless the filter sets a limit. |filterable|
+
+        |aiter|
+
+        Parameters
+        -----------
+        filter : Optional[Filter]
+            A instance of Filter to be used for filtering and sorting results, its offset 
+            is used as the starting point.
+        keyset : Optional[bool]
+            Walk the results sorted by id with a cursor on the last id seen instead of an 
+            offset. Every result is returned exactly once even if results are added or removed 
+            during the walk and deep pages are as fast as the first ones. Overrides the sorting 
+            and offset of the filter.
+
+        Yields
+        -------
+        Event
+            The mod events of the game
+        """
+        return _paginate(self.get_mod_events, filter or Filter(), "id" if keyset else None)
 
     def get_tag_options(self, *, filter=None):
         """Gets all the game tags available for this game. Updates the tag_option attribute. |filterable|
@@ -190,8 +243,31 @@ class Game:
                
         """
         tag_json = self._client._get_request(f"/games/{self.id}/tags", filter=filter)
-        self.tag_options = tags = [TagOption(**tag_option) for tag_option in tag_json["data"]]
-        return Returned(tags, Pagination(**tag_json))
+        tags = self._client._models(TagOption, tag_json)
+        if not self._client.raw and self._client.factory is None:
+            self.tag_options = tags.results
+
+        return tags
+
+    def iter_tag_options(self, *, filter=None):
+        """Iterates over all the game tags available for this game, lazily fetching one page at a 
+        time so that only the current page is kept in memory. Pages are as large as the API 
+        allows unless the filter sets a limit. Updates the tag_options attribute with each page. |filterable|
+
+        |aiter|
+
+        Parameters
+        -----------
+        filter : Optional[Filter]
+            A instance of Filter to be used for filtering and sorting results, its offset 
+            is used as the starting point.
+
+        Yields
+        -------
+        TagOption
+            The tag options of the game
+        """
+        return _paginate(self.get_tag_options, filter or Filter())
 
     def get_stats(self, *, filter=None):
         """Gets the stat objects for all the mods of this game. |filterable|
@@ -210,7 +286,32 @@ class Game:
             The results and pagination tuple from this request
         """
         stats_json = self._client._get_request(f"/games/{self.id}/mods/stats", filter=filter)
-        return Returned([Stats(**stats) for stats in stats_json["data"]], Pagination(**stats_json))
+        return self._client._models(Stats, stats_json)
+
+    def iter_stats(self, *, filter=None, keyset=False):
+        """Iterates over the stat objects of all the mods of this game, lazily fetching one page at a 
+        time so that only the current page is kept in memory. Pages are as large as the API 
+        allows unless the filter sets a limit. |filterable|
+
+        |aiter|
+
+        Parameters
+        -----------
+        filter : Optional[Filter]
+            A instance of Filter to be used for filtering and sorting results, its offset 
+            is used as the starting point.
+        keyset : Optional[bool]
+            Walk the results sorted by mod_id with a cursor on the last mod_id seen instead of an 
+            offset. Every result is returned exactly once even if results are added or removed 
+            during the walk and deep pages are as fast as the first ones. Overrides the sorting 
+            and offset of the filter.
+
+        Yields
+        -------
+        Stats
+            The stats of the mods of the game
+        """
+        return _paginate(self.get_stats, filter or Filter(), "mod_id" if keyset else None)
 
     def get_owner(self):
         """Returns the original submitter of the resource.
@@ -223,7 +324,7 @@ class Game:
             User that submitted the resource
         """
         user_json = self._client._post_request(f"/general/ownership", data={"resource_type" : "games", "resource_id" : self.id})
-        return User(client=self._client, **user_json)
+        return self._client._model(User, user_json, client=self._client)
 
     def edit(self, **fields):
         """Used to edit the game details. For editing the icon, logo or header use :func:`add_media`.
@@ -264,7 +365,7 @@ class Game:
 
         fields = _clean_and_convert(fields)
         game_json = self._client._put_request(f'/games/{self.id}', data = fields)
-        self.__init__(client=self._client, **game_json)
+        self._client._model(self.__init__, game_json, client=self._client)
 
     def add_mod(self, mod):
         """Add a mod to this game.
@@ -299,7 +400,7 @@ class Game:
         with open(mod_d.pop("logo"), "rb") as f:
             mod_json = self._client._post_request(f'/games/{self.id}/mods', h_type = 1, data = mod_d, files={"logo": f})
 
-        return Mod(client=self._client, **mod_json)
+        return self._client._model(Mod, mod_json, client=self._client)
 
     def add_media(self, *, logo = None, icon = None, header = None):
         """Upload new media to to the game. This function can take between 1 to 3 arguments
@@ -345,7 +446,7 @@ class Game:
             for image in media.values():
                 image.close()
         
-        return Message(**message)
+        return self._client._model(Message, message)
 
     def add_tag_options(self, name, *, tags = [], hidden = False, type = 'dropdown'):
         """Add tags which mods can apply to their profiles. If the tag names already exists,
@@ -379,7 +480,7 @@ class Game:
             tag_option.hidden = hidden
             tag_option.tags.extend(tags)
 
-        return Message(**message)
+        return self._client._model(Message, message)
 
     def delete_tag_options(self, name, *, tags = []):
         """Delete one or more tags from a tag option.
@@ -444,5 +545,6 @@ class Game:
         }
 
         msg = self._client._post_request('/report', data = fields)
-        return Message(**msg)
+        return self._client._model(Message, msg)
 
+lazy(Game)
@@ -0,0 +1,19 @@
+"""The JSON backend the clients decode response bodies with by default. Bodies are decoded
+straight from the bytes received, without being turned into a str first. orjson is used
+when it is installed, otherwise the standard library's json module.
+
+    pip install orjson
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+#name of the backend in use, "orjson" or "json"
+BACKEND = "json" if orjson is None else "orjson"
+
+#decodes a JSON document from bytes, json.loads detects their encoding itself
+loads = json.loads if orjson is None else orjson.loads
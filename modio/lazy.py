@@ -0,0 +1,50 @@
+"""Lazy variants of the models, built instead of the models by the clients created with
+`lazy=True`. A lazy model only keeps the JSON it was built from and builds each attribute
+(nested objects, enums, datetimes...) the first time it is read, so listing endpoints only
+pay for the attributes which are used. Lazy models are instances of the models they are
+a variant of and behave the same, apart from missing keys only raising once the attribute
+is read. They hold the JSON on top of the attributes read so far, which takes more memory.
+"""
+
+from .schema import _builders
+
+#model class -> its lazy variant
+_variants = {}
+
+class _Field:
+    """An attribute of a lazy model, built from its JSON on first access and then cached
+    in the instance's __dict__ which takes precedence over the field afterwards."""
+    __slots__ = ("name", "build")
+
+    def __init__(self, name, build):
+        self.name = name
+        self.build = build
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+
+        value = obj.__dict__[self.name] = self.build(obj._raw, obj)
+        return value
+
+def lazy(cls):
+    """Creates and registers the lazy variant of a model class, a subclass built with the
+    same arguments whose attributes are built by the expressions compiled from the specs
+    of the fields of the model, see :mod:`modio.schema`.
+
+    Returns
+    --------
+    type
+        The lazy variant
+    """
+    def __init__(self, **attrs):
+        #models can be rebuilt in place after an edit, the attributes read so far are outdated
+        self.__dict__.clear()
+        self._raw = attrs
+
+    namespace = {"__init__": __init__, "__module__": cls.__module__, "__doc__": cls.__doc__}
+    for name, build in _builders(cls).items():
+        namespace[name] = _Field(name, build)
+
+    variant = _variants[cls] = type(f"Lazy{cls.__name__}", (cls,), namespace)
+    return variant
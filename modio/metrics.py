@@ -0,0 +1,361 @@
+"""Instrumentation of the requests made by the clients. Every client records counters and
+latency histograms per endpoint template, e.g. /games/{id}/mods, in its :class:`Metrics`
+and calls the hooks registered on it at each stage of a request, so the time spent on
+the network, decoding the JSON and building the models can be told apart.
+"""
+
+import bisect
+import contextvars
+import threading
+import time
+
+from .cache import _template
+
+STAGES = ("send", "headers", "body", "model")
+
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+#the request whose result is being built, set by the client in the context of the caller
+_current = contextvars.ContextVar("modio_request", default=None)
+
+class RequestInfo:
+    """A request as seen by the hooks of :class:`Metrics`, it is filled in as the request
+    goes through its stages. Requests answered from the cache or merged with an identical
+    request in flight only go through the model stage.
+
+    Attributes
+    -----------
+    method : str
+        The HTTP method
+    url : str
+        The path of the request, e.g. /games/1/mods
+    endpoint : str
+        The endpoint template of the path, e.g. /games/{id}/mods
+    start : float
+        `time.perf_counter()` when the client received the request
+    attempt : int
+        The attempt being sent, starts at 1 and grows with each retry
+    status : int
+        Status of the last response, None until its headers are received
+    bytes_sent : int
+        Size of the urlencoded form sent, uploaded files are not counted
+    bytes_received : int
+        Size of the bodies received, including those of the retried attempts
+    waited : float
+        Number of seconds spent waiting for the rate limit
+    cache : str
+        "hit", "stale", "miss" or None if the request is not cached
+    coalesced : bool
+        Whether the request shared the response of an identical request in flight
+    timings : Dict[str, float]
+        Number of seconds between `start` and the end of each stage reached, along
+        with "decode", the end of the decoding of the JSON
+    """
+    def __init__(self, method, url):
+        self.method = method
+        self.url = url
+        self.endpoint = _template(url)
+        self.start = time.perf_counter()
+        self.attempt = 1
+        self.status = None
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.waited = 0.0
+        self.cache = None
+        self.coalesced = False
+        self.timings = {}
+
+    def __repr__(self):
+        return f"<RequestInfo method={self.method} endpoint={self.endpoint} status={self.status}>"
+
+    def _mark(self, stage):
+        self.timings[stage] = time.perf_counter() - self.start
+
+class Histogram:
+    """A histogram with fixed buckets in the style of Prometheus.
+
+    Attributes
+    -----------
+    buckets : Tuple[float]
+        Upper bounds of the buckets
+    counts : List[int]
+        Number of observations in each bucket, the last one holding those above
+        every bound. Counts are not cumulative.
+    count : int
+        Number of observations
+    sum : float
+        Sum of the observations
+    """
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self):
+        """Returns the histogram as a dict with cumulative counts keyed by upper bound."""
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            cumulative += count
+            buckets[bound] = cumulative
+
+        return {"buckets": buckets, "count": self.count, "sum": self.sum}
+
+_counters = {
+    "requests": "Requests made through the client, including those answered from the cache",
+    "sent": "Requests sent to the API, including retries",
+    "errors": "Requests which raised an exception",
+    "retries": "Attempts retried after a failure",
+    "cache_hits": "Requests answered from the cache",
+    "cache_stale": "Requests answered with a stale cache entry being refreshed",
+    "cache_misses": "Requests looked up in the cache and sent",
+    "coalesced": "Requests which shared the response of an identical request in flight",
+    "ratelimit_waits": "Requests which waited for the rate limit",
+    "ratelimit_wait_seconds": "Seconds spent waiting for the rate limit",
+    "bytes_sent": "Bytes of urlencoded forms sent",
+    "bytes_received": "Bytes of response bodies received",
+}
+
+_histograms = {
+    "latency": "Seconds between sending a request and receiving the headers of its response",
+    "duration": "Seconds between making a request and receiving its response, including waits and retries",
+    "decode": "Seconds spent decoding JSON responses",
+    "build": "Seconds spent building the models of a response",
+}
+
+class Endpoint:
+    """The counters and histograms of an endpoint template, see :func:`Metrics.snapshot`."""
+    def __init__(self, buckets):
+        for name in _counters:
+            setattr(self, name, 0)
+
+        self.statuses = {}
+        self.histograms = {name: Histogram(buckets) for name in _histograms}
+
+    def snapshot(self):
+        snapshot = {name: getattr(self, name) for name in _counters}
+        snapshot["statuses"] = dict(self.statuses)
+        snapshot["histograms"] = {name: histogram.snapshot() for name, histogram in self.histograms.items()}
+        return snapshot
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _number(value):
+    if value == float("inf"):
+        return "+Inf"
+
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class Metrics:
+    """Counters and latency histograms of the requests made by the clients, kept per endpoint
+    template, and hooks called at each stage of a request. Every client has one, a single
+    instance can be passed to several clients to aggregate them. Thread safe.
+
+    The stages are:
+
+    - send: before each attempt is sent, once the rate limit allows it
+    - headers: once the status and headers of the response are received
+    - body: once the body of the response is received
+    - model: once the models have been built from the response, also reached by the
+      requests answered from the cache
+
+    Parameters
+    -----------
+    buckets : Optional[Iterable[float]]
+        Upper bounds in seconds of the buckets of the histograms. Default ranges from
+        1ms to 10s.
+
+    Attributes
+    -----------
+    endpoints : Dict[str, Endpoint]
+        The metrics of each endpoint template
+    """
+    def __init__(self, *, buckets=BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.endpoints = {}
+        self._hooks = {stage: [] for stage in STAGES}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"<Metrics endpoints={len(self.endpoints)}>"
+
+    def add_hook(self, func, stages=STAGES):
+        """Registers a function called with the stage and the :class:`RequestInfo` of each
+        request reaching one of `stages`, all of them by default. Hooks run synchronously
+        in the request path and should be fast, exceptions they raise are propagated.
+
+        Parameters
+        -----------
+        func : Callable[[str, RequestInfo], None]
+            The hook
+        stages : Optional[Iterable[str]]
+            The stages the hook is called for
+        """
+        stages = [stages] if isinstance(stages, str) else list(stages)
+        for stage in stages:
+            if stage not in self._hooks:
+                raise ValueError(f"Unknown stage {stage}, must be one of {', '.join(STAGES)}")
+
+        with self._lock:
+            for stage in stages:
+                self._hooks[stage] = self._hooks[stage] + [func]
+
+    def remove_hook(self, func):
+        """Unregisters a hook from every stage."""
+        with self._lock:
+            for stage, hooks in self._hooks.items():
+                self._hooks[stage] = [hook for hook in hooks if hook is not func]
+
+    def reset(self):
+        """Clears the counters and histograms, hooks are kept."""
+        with self._lock:
+            self.endpoints = {}
+
+    def _endpoint(self, name):
+        #must be called with the lock held
+        endpoint = self.endpoints.get(name)
+        if endpoint is None:
+            endpoint = self.endpoints[name] = Endpoint(self.buckets)
+
+        return endpoint
+
+    def _fire(self, stage, info):
+        for hook in self._hooks[stage]:
+            hook(stage, info)
+
+    def _send(self, info, waited):
+        with self._lock:
+            endpoint = self._endpoint(info.endpoint)
+            endpoint.sent += 1
+            if info.attempt > 1:
+                endpoint.retries += 1
+            if waited:
+                endpoint.ratelimit_waits += 1
+                endpoint.ratelimit_wait_seconds += waited
+
+        info.waited += waited
+        info.status = None
+        info._mark("send")
+        self._fire("send", info)
+
+    def _headers(self, info, status, headers=None):
+        info.status = status
+        info._mark("headers")
+        with self._lock:
+            endpoint = self._endpoint(info.endpoint)
+            endpoint.statuses[status] = endpoint.statuses.get(status, 0) + 1
+            endpoint.histograms["latency"].observe(info.timings["headers"] - info.timings["send"])
+
+        self._fire("headers", info)
+
+    def _body(self, info, size):
+        info.bytes_received += size
+        info._mark("body")
+        with self._lock:
+            self._endpoint(info.endpoint).bytes_received += size
+
+        self._fire("body", info)
+
+    def _decoded(self, info, seconds):
+        info._mark("decode")
+        with self._lock:
+            self._endpoint(info.endpoint).histograms["decode"].observe(seconds)
+
+    def _cached(self, info, result):
+        """Records the outcome of a cache lookup, "hit", "stale" or "miss"."""
+        info.cache = result
+        with self._lock:
+            endpoint = self._endpoint(info.endpoint)
+            if result == "hit":
+                endpoint.cache_hits += 1
+            elif result == "stale":
+                endpoint.cache_stale += 1
+            else:
+                endpoint.cache_misses += 1
+
+    def _coalesced(self, info):
+        info.coalesced = True
+        with self._lock:
+            self._endpoint(info.endpoint).coalesced += 1
+
+    def _done(self, info, error=None):
+        """Records the end of a request, successful or not."""
+        with self._lock:
+            endpoint = self._endpoint(info.endpoint)
+            endpoint.requests += 1
+            endpoint.bytes_sent += info.bytes_sent
+            if error is not None:
+                endpoint.errors += 1
+            if "body" in info.timings:
+                endpoint.histograms["duration"].observe(info.timings["body"])
+
+    def _built(self, info, seconds):
+        info._mark("model")
+        with self._lock:
+            self._endpoint(info.endpoint).histograms["build"].observe(seconds)
+
+        self._fire("model", info)
+
+    def snapshot(self):
+        """Returns a copy of the metrics as plain dicts keyed by endpoint template. Each
+        endpoint has the counters requests, sent, errors, retries, cache_hits, cache_stale,
+        cache_misses, coalesced, ratelimit_waits, ratelimit_wait_seconds, bytes_sent and
+        bytes_received, the number of responses by status in statuses and the latency,
+        duration, decode and build histograms in histograms.
+
+        Returns
+        --------
+        Dict[str, dict]
+            The metrics of each endpoint template
+        """
+        with self._lock:
+            return {name: endpoint.snapshot() for name, endpoint in self.endpoints.items()}
+
+    def prometheus(self, prefix="modio"):
+        """Returns the metrics in the Prometheus text exposition format, with the endpoint
+        template as the `endpoint` label.
+
+        Parameters
+        -----------
+        prefix : Optional[str]
+            Prefix of the metric names. Default is modio
+
+        Returns
+        --------
+        str
+            The metrics
+        """
+        snapshot = self.snapshot()
+        lines = []
+        for name, help in _counters.items():
+            metric = f"{prefix}_{name}_total"
+            lines += [f"# HELP {metric} {help}", f"# TYPE {metric} counter"]
+            for endpoint, values in snapshot.items():
+                lines.append(f'{metric}{{endpoint="{_label(endpoint)}"}} {_number(values[name])}')
+
+        metric = f"{prefix}_responses_total"
+        lines += [f"# HELP {metric} Responses received by status", f"# TYPE {metric} counter"]
+        for endpoint, values in snapshot.items():
+            for status, count in sorted(values["statuses"].items()):
+                lines.append(f'{metric}{{endpoint="{_label(endpoint)}",status="{status}"}} {count}')
+
+        for name, help in _histograms.items():
+            metric = f"{prefix}_request_{name}_seconds"
+            lines += [f"# HELP {metric} {help}", f"# TYPE {metric} histogram"]
+            for endpoint, values in snapshot.items():
+                histogram = values["histograms"][name]
+                label = f'endpoint="{_label(endpoint)}"'
+                for bound, count in histogram["buckets"].items():
+                    lines.append(f'{metric}_bucket{{{label},le="{_number(bound)}"}} {count}')
+
+                lines.append(f"{metric}_sum{{{label}}} {_number(histogram['sum'])}")
+                lines.append(f"{metric}_count{{{label}}} {histogram['count']}")
+
+        return "\n".join(lines) + "\n"
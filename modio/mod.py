@@ -1,9 +1,12 @@
 import time
 
 from .objects import *
+from .lazy import lazy
+from .schema import model, MOD, _tag, _dependency, _metadata, _grouped
 from .errors import modioException, BadRequest
-from .utils import _convert_date, _clean_and_convert
+from .utils import _clean_and_convert, _paginate
 
+@model(MOD)
 class Mod:
     """Represent a modio mod object.
     
@@ -78,33 +81,10 @@ class Mod:
         description field converted into plaintext.
 
     """
-    def __init__(self, **attrs):
-        self.id = attrs.pop("id")
-        self.status = Status(attrs.pop("status"))
-        self.visible = Visibility(attrs.pop("visible"))
-        self.game = attrs.pop("game_id")
-        self.date = _convert_date(attrs.pop("date_added"))
-        self.updated = _convert_date(attrs.pop("date_updated"))
-        self.live = _convert_date(attrs.pop("date_live"))
-        self.logo = Image(**attrs.pop("logo"))
-        self.homepage = attrs.pop("homepage_url", None)
-        self.name = attrs.pop("name")
-        self.name_id = attrs.pop("name_id")
-        self.summary = attrs.pop("summary")
-        self.description = attrs.pop("description")
-        self.metadata = attrs.pop("metadata_blob")
-        self.profile = attrs.pop("profile_url")
-        self.media = ModMedia(**attrs.pop("media"))
-        self.maturity = Maturity(attrs.pop("maturity_option"))
-        self.stats = Stats(**attrs.pop("stats"))
-        self.tags = {tag["name"] : tag["date_added"] for tag in attrs.pop("tags", [])}
-        self._client = attrs.pop("client")
-        self._file = attrs.pop("modfile", None)
-        self._kvp_raw = attrs.pop("metadata_kvp")
-        self.file =  ModFile(**self._file, game_id=self.game, client=self._client) if self._file else None 
-        self.submitter = User(client=self._client, **attrs.pop("submitted_by"))
-        self.plaintext = attrs.pop("description_plaintext")
-
+    __slots__ = ("id", "status", "visible", "game", "date", "updated", "live", "logo", "homepage",
+                 "name", "name_id", "summary", "description", "metadata", "profile", "media",
+                 "maturity", "stats", "tags", "_client", "_file", "_kvp_raw", "file", "submitter",
+                 "plaintext")
 
     @property
     def kvp(self):
@@ -141,7 +121,7 @@ class Mod:
             The found modfile
         """
         file_json = self._client._get_request(f"/games/{self.game}/mods/{self.id}/files/{id}")
-        return ModFile(**file_json, game_id=self.game, client=self._client)
+        return self._client._model(ModFile, file_json, game_id=self.game, client=self._client)
 
     def get_files(self, *, filter=None):
         """Get all mod files for this mod. Returns a named tuple
@@ -161,7 +141,32 @@ class Mod:
             The results and pagination tuple from this request
         """
         files_json = self._client._get_request(f"/games/{self.game}/mods/{self.id}/files", filter=filter)
-        return Returned([ModFile(**file, game_id=self.game, client=self._client) for file in files_json["data"]], Pagination(**files_json))
+        return self._client._models(ModFile, files_json, game_id=self.game, client=self._client)
+
+    def iter_files(self, *, filter=None, keyset=False):
+        """Iterates over all the mod files of this mod, lazily fetching one page at a 
+        time so that only the current page is kept in memory. Pages are as large as the API 
+        allows unless the filter sets a limit. |filterable|
+
+        |aiter|
+
+        Parameters
+        -----------
+        filter : Optional[Filter]
+            A instance of Filter to be used for filtering and sorting results, its offset 
+            is used as the starting point.
+        keyset : Optional[bool]
+            Walk the results sorted by id with a cursor on the last id seen instead of an 
+            offset. Every result is returned exactly once even if results are added or removed 
+            during the walk and deep pages are as fast as the first ones. Overrides the sorting 
+            and offset of the filter.
+
+        Yields
+        -------
+        ModFile
+            The files of the mod
+        """
+        return _paginate(self.get_files, filter or Filter(), "id" if keyset else None)
 
     def get_events(self, *, filter=None):
         """Get all events for that mod sorted by latest. Returns,
@@ -182,7 +187,32 @@ class Mod:
 
         """
         event_json = self._client._get_request(f"/games/{self.game}/mods/{self.id}/events", filter=filter)
-        return Returned([Event(**event) for event in event_json["data"]], Pagination(**event_json))
+        return self._client._models(Event, event_json)
+
+    def iter_events(self, *, filter=None, keyset=False):
+        """Iterates over all the events of this mod, latest first, lazily fetching one page at a 
+        time so that only the current page is kept in memory. Pages are as large as the API 
+        allows unless the filter sets a limit. |filterable|
+
+        |aiter|
+
+        Parameters
+        -----------
+        filter : Optional[Filter]
+            A instance of Filter to be used for filtering and sorting results, its offset 
+            is used as the starting point.
+        keyset : Optional[bool]
+            Walk the results sorted by id with a cursor on the last id seen instead of an 
+            offset. Every result is returned exactly once even if results are added or removed 
+            during the walk and deep pages are as fast as the first ones. Overrides the sorting 
+            and offset of the filter.
+
+        Yields
+        -------
+        Event
+            The events of the mod
+        """
+        return _paginate(self.get_events, filter or Filter(), "id" if keyset else None)
 
     def get_tags(self, *, filter=None): 
         """Gets all the tags for this mod. Updates the instance's
@@ -203,8 +233,11 @@ class Mod:
 
         """
         tag_json = self._client._get_request(f"/games/{self.game}/mods/{self.id}/tags", filter=filter)
-        self.tags = new_tags = {tag["name"] : _convert_date(tag["date_added"]) for tag in tag_json["data"]}
-        return Returned(new_tags, Pagination(**tag_json))
+        tags = self._client._models(_tag, tag_json, collect=dict)
+        if not self._client.raw and self._client.factory is None:
+            self.tags = tags.results
+
+        return tags
 
     def get_metadata(self):
         """Returns a dict of metakey-metavalue pairs. This will also update the mod's kvp attribute.
@@ -218,7 +251,7 @@ class Mod:
         """
         meta_json = self._client._get_request(f"/games/{self.game}/mods/{self.id}/metadatakvp")
         self._kvp_raw = meta_json["data"]
-        return Returned(self.kvp, Pagination(**meta_json))
+        return self._client._models(_metadata, meta_json, collect=_grouped)
 
     def get_dependencies(self, *, filter=None):
         """Returns a dict of dependency_id-date_added pairs. Returns 
@@ -239,7 +272,7 @@ class Mod:
 
         """
         depen_json = self._client._get_request(f"/games/{self.game}/mods/{self.id}/dependencies", filter=filter)
-        return Returned({dependecy["mod_id"] : _convert_date(dependecy["date_added"]) for dependecy in depen_json["data"]}, Pagination(**depen_json))
+        return self._client._models(_dependency, depen_json, collect=dict)
 
     def get_team(self, *, filter=None):
         """Returns a list of TeamMember object representing the Team in charge of the mod. |filterable|
@@ -259,7 +292,32 @@ class Mod:
 
         """
         team_json = self._client._get_request(f"/games/{self.game}/mods/{self.id}/team", filter=filter)
-        return Returned([TeamMember(**member, client=self._client, mod=self) for member in team_json["data"]], Pagination(**team_json))
+        return self._client._models(TeamMember, team_json, client=self._client, mod=self)
+
+    def iter_team(self, *, filter=None, keyset=False):
+        """Iterates over the members of the team in charge of the mod, lazily fetching one page at a 
+        time so that only the current page is kept in memory. Pages are as large as the API 
+        allows unless the filter sets a limit. |filterable|
+
+        |aiter|
+
+        Parameters
+        -----------
+        filter : Optional[Filter]
+            A instance of Filter to be used for filtering and sorting results, its offset 
+            is used as the starting point.
+        keyset : Optional[bool]
+            Walk the results sorted by id with a cursor on the last id seen instead of an 
+            offset. Every result is returned exactly once even if results are added or removed 
+            during the walk and deep pages are as fast as the first ones. Overrides the sorting 
+            and offset of the filter.
+
+        Yields
+        -------
+        TeamMember
+            The members of the team
+        """
+        return _paginate(self.get_team, filter or Filter(), "id" if keyset else None, "team_id")
 
     def get_comments(self, *, filter=None):
         """Returns a list of all the top level comments for this mod wih comments replying
@@ -280,7 +338,7 @@ class Mod:
             The results and pagination tuple from this request
         """
         comment_json = self._client._get_request(f"/games/{self.game}/mods/{self.id}/comments", filter=filter)
-        return Returned([Comment(**comment, client=self._client, mod=self) for comment in comment_json["data"]], Pagination(**comment_json))
+        return self._client._models(Comment, comment_json, client=self._client, mod=self)
 
         # comments = []
         # for comment_d in comment_json["data"]:
@@ -296,6 +354,31 @@ class Mod:
         #         comments.append(comment)
 
 
+    def iter_comments(self, *, filter=None, keyset=False):
+        """Iterates over all the comments of this mod, lazily fetching one page at a 
+        time so that only the current page is kept in memory. Pages are as large as the API 
+        allows unless the filter sets a limit. |filterable|
+
+        |aiter|
+
+        Parameters
+        -----------
+        filter : Optional[Filter]
+            A instance of Filter to be used for filtering and sorting results, its offset 
+            is used as the starting point.
+        keyset : Optional[bool]
+            Walk the results sorted by id with a cursor on the last id seen instead of an 
+            offset. Every result is returned exactly once even if results are added or removed 
+            during the walk and deep pages are as fast as the first ones. Overrides the sorting 
+            and offset of the filter.
+
+        Yields
+        -------
+        Comment
+            The comments of the mod
+        """
+        return _paginate(self.get_comments, filter or Filter(), "id" if keyset else None)
+
     def get_stats(self):
         """Returns a Stats object, representing a series of stats for the mod.
 
@@ -307,7 +390,10 @@ class Mod:
             The stats summary object for the mod.
         """
         stats_json = self._client._get_request(f"/games/{self.game}/mods/{self.id}/stats")
-        self.stats = stats = Stats(**stats_json)
+        stats = self._client._model(Stats, stats_json)
+        if isinstance(stats, Stats):
+            self.stats = stats
+
         return stats
 
     def get_owner(self):
@@ -321,7 +407,7 @@ class Mod:
             User that submitted the resource
         """
         user_json = self._client._post_request(f"/general/ownership", data={"resource_type" : "mods", "resource_id" : self.id})
-        return User(client=self._client, **user_json)
+        return self._client._model(User, user_json, client=self._client)
 
     def edit(self, **fields):
         """Used to edit the mod details. Sucessful editing will update the mod instance.
@@ -356,7 +442,7 @@ class Mod:
         """
         fields = _clean_and_convert(fields)
         mod_json = self._client._put_request(f'/games/{self.game}/mods/{self.id}', data = fields)
-        return self.__init__(client=self._client, **mod_json)
+        return self._client._model(self.__init__, mod_json, client=self._client)
 
     def delete(self):
         """Delete a mod and set its status to deleted.
@@ -398,7 +484,7 @@ class Mod:
         with open(file_file, "rb") as f:
             file_json = self._client._post_request(f'/games/{self.game}/mods/{self.id}/files', h_type = 1, data = file_d, files={"filedata" : f})
 
-        return ModFile(**file_json, game_id=self.game, client=self._client)
+        return self._client._model(ModFile, file_json, game_id=self.game, client=self._client)
 
     def add_media(self, *, logo = None, images = [], youtube = [], sketchfab = []):
         """Upload new media to the mod.
@@ -454,7 +540,7 @@ class Mod:
                 for image in images_d.values():
                     image.close()
 
-        return Message(**media_json)
+        return self._client._model(Message, media_json)
 
     def delete_media(self, *, images = [], youtube = [], sketchfab = []):
         """Delete media from the mod page. 
@@ -490,7 +576,7 @@ class Mod:
         """
         try:
             mod_json = self._client._post_request(f'/games/{self.game}/mods/{self.id}/subscribe')
-            return Mod(client=self._client, **mod_json)
+            return self._client._model(Mod, mod_json, client=self._client)
         except BadRequest:
             pass
 
@@ -530,7 +616,7 @@ class Mod:
         for tag in tags:
             self.tags[tag] = int(time.time())
 
-        return Message(**message)
+        return self._client._model(Message, message)
 
     def delete_tags(self, *tags):
         """Delete tags from the mod, tags are case insensitive and duplicates will be removed. Providing
@@ -620,7 +706,7 @@ class Mod:
             for item in value:
                 self._kvp_raw.append({"metakey" : key, "metavalue" : item})
 
-        return Message(**checked)
+        return self._client._model(Message, checked)
 
     def delete_metadata(self, **metadata):
         """Deletes metadata from a mod. To do so pass the meta-key as a keyword argument and the
@@ -672,7 +758,7 @@ class Mod:
         """
         dependency = {f"dependencies[{dependencies.index(data)}]" : getattr(data, "id", data) for data in dependencies}
         r = self._client._post_request(f'/games/{self.game}/mods/{self.id}/dependencies', data=dependency)
-        return Message(**r)
+        return self._client._model(Message, r)
 
     def delete_dependencies(self, dependencies : list):
         """Delete mod dependecies required by this mod.
@@ -705,7 +791,7 @@ class Mod:
         """
         data = {"email" : email, "level" : level.value, "position" : position}
         msg = self._client._post_request(f'/games/{self.game}/mods/{self.id}/team', data=data)
-        return Message(**msg)
+        return self._client._model(Message, msg)
 
     def report(self, name, summary, type = Report(0)):
         """Report a this mod, make sure to read mod.io's ToU to understand what is
@@ -738,5 +824,6 @@ class Mod:
         }
 
         msg = self._client._post_request('/report', data = fields)
-        return Message(**msg)
+        return self._client._model(Message, msg)
 
+lazy(Mod)
@@ -1,6 +1,8 @@
 from .errors import modioException, BadRequest
-from .utils import concat_docs, _lib_to_api, _convert_date
+from .utils import concat_docs, _lib_to_api
 from .enums import *
+from .lazy import lazy
+from .schema import model, MESSAGE, IMAGE, EVENT, COMMENT, MODFILE, MODMEDIA, TAG_OPTION, RATING, STATS, USER, TEAM_MEMBER, PAGINATION
 
 import hashlib
 from collections import namedtuple
@@ -21,6 +23,21 @@ class Returned(_Returned):
     """
     pass
 
+_Fetched = namedtuple("Fetched", "results missing")
+class Fetched(_Fetched):
+    """A named tuple returned by the methods which fetch several objects 
+    by their IDs at once.
+
+    Attributes
+    ----------
+    results : Dict[int, Any]
+        The objects found, keyed by their ID
+    missing : List[int]
+        The requested IDs for which no object was returned
+    """
+    pass
+
+@model(MESSAGE)
 class Message:
     """A simple representation of a modio Message, used when modio returns
     a status message for the query that was accomplished.
@@ -33,16 +50,13 @@ class Message:
         The server response to the request
 
     """
-    def __init__(self, **attrs):
-        self.code = attrs.pop("code")
-        self.message = attrs.pop("message")
-
     def __str__(self):
         return f"{self.code} : {self.message}"
 
     def __repr__(self):
         return f"<Message code={self.code}>"
 
+@model(IMAGE)
 class Image:
     """A representation of a modio image, which stand for the Logo, Icon
     and Header of a game/mod or the Avatar of a user.Can also be a regular
@@ -65,17 +79,12 @@ class Image:
         on the object being processed. Can be None.
 
     """
-    def __init__(self, **attrs):
-        self.filename = attrs.pop("filename")
-        self.original = attrs.pop("original")
-
-        self.small = list(attrs.values())[2] if len(attrs) > 2 else None
-        self.medium = list(attrs.values())[3] if len(attrs) > 3 else None
-        self.large = list(attrs.values())[4] if len(attrs) > 4 else None
+    __slots__ = ("filename", "original", "small", "medium", "large")
 
     def __repr__(self):
         return f"<Image filename={self.filename} original={self.original}>"     
 
+@model(EVENT)
 class Event:
     """Represents a mod event. 
 
@@ -109,13 +118,7 @@ class Event:
         a mod event. Filter attribute.
 
     """
-    def __init__(self, **attrs):
-        self.id = attrs.pop("id")
-        self.date = _convert_date(attrs.pop("date_added"))
-        self._raw_type = attrs.pop("event_type")
-        self.mod = attrs.pop("mod_id")
-        self.user = attrs.pop("user_id")
-        self.game = attrs.pop("game_id", None)
+    __slots__ = ("id", "date", "_raw_type", "mod", "user", "game")
 
     @property
     def type(self):
@@ -127,6 +130,7 @@ class Event:
     def __repr__(self):
         return f"<Event id={self.id} type={self.type.name} mod={self.mod}>"
 
+@model(COMMENT)
 class Comment:
     """Represents a comment on a mod page.
 
@@ -161,21 +165,6 @@ class Comment:
         The level of nesting from 1 to 3 where one is top level and three is
         the deepest level
     """
-    def __init__(self, **attrs):
-        self.id = attrs.pop("id")
-        self.mod = attrs.pop("mod_id")
-        self.date = _convert_date(attrs.pop("date_added"))
-        self.parent = attrs.pop("reply_id")
-        self.position = attrs.pop("thread_position")
-        self.level = len(self.position.split("."))
-        self.karma = attrs.pop("karma")
-        self.karma_guest = attrs.pop("karma_guest")
-        self.content = attrs.pop("content")
-        self._client = attrs.pop("client")
-        self.mod = attrs.pop("mod")
-        self.submitter = User(client=self._client, **attrs.pop("user"))
-        self.children = []
-
     def __repr__(self):
         return f"<Comment id={self.id} mod={self.mod.id}>"
 
@@ -186,6 +175,7 @@ class Comment:
         r = self._client._delete_request(f'/games/{self.mod.game}/mods/{self.mod.id}/comments/{self.id}')
         return r
 
+@model(MODFILE)
 class ModFile:
     """A object to represents modfiles. If the modfile has been returned for the me/modfile endpoint
     then edit() and delete() cannot be called as a game is lacking.
@@ -226,25 +216,9 @@ class ModFile:
         ID of the game of the mod this file belongs to. Can be None if this file
         was returned from the me/modfiles endpoint.
     """
-    def __init__(self,**attrs):
-        self.id = attrs.pop("id")
-        self.mod = attrs.pop("mod_id")
-        self.date = attrs.pop("date_added")
-        self.scanned = attrs.pop("date_scanned")
-        self.virus_status = VirusStatus(attrs.pop("virus_status"))
-        self.virus = bool(attrs.pop("virus_positive"))
-        self.virus_hash = attrs.pop("virustotal_hash")
-        self.size = attrs.pop("filesize")
-        self.hash = attrs.pop("filehash")["md5"]
-        self.filename = attrs.pop("filename")
-        self.version = attrs.pop("version")
-        self.changelog = attrs.pop("changelog")
-        self.metadata = attrs.pop("metadata_blob")
-        download = attrs.pop("download")
-        self.url = download["binary_url"]
-        self.expires = _convert_date(download["date_expires"])
-        self.game = attrs.pop("game_id", None)
-        self._client = attrs.pop("client")
+    __slots__ = ("id", "mod", "date", "scanned", "virus_status", "virus", "virus_hash", "size",
+                 "hash", "filename", "version", "changelog", "metadata", "url", "expires", "game",
+                 "_client")
 
     def __repr__(self):
         return f"<ModFile id={self.id} name={self.filename} version={self.version}>"
@@ -260,7 +234,7 @@ class ModFile:
             User that submitted the resource
         """
         user_json = self._client._post_request(f"/general/ownership", data={"resource_type" : "files", "resource_id" : self.id})
-        return User(client=self._client, **user_json)
+        return self._client._model(User, user_json, client=self._client)
 
     def edit(self, **fields):
         """Edit the file's details.
@@ -286,7 +260,7 @@ class ModFile:
         if "code" in file_json:
             return
 
-        self.__init__(client=self._client, game_id=self.game, **file_json)
+        self._client._model(self.__init__, file_json, client=self._client, game_id=self.game)
 
     def delete(self):
         """Deletes the modfile, this will raise an error if the
@@ -315,6 +289,9 @@ class ModFile:
         """
         return self.expires.timestamp() < time.time()
 
+lazy(ModFile)
+
+@model(MODMEDIA)
 class ModMedia:
     """Represents all the media for a mod.
 
@@ -328,11 +305,9 @@ class ModMedia:
         A list of image objects (gallery)
 
     """
-    def __init__(self, **attrs):
-        self.youtube = attrs.pop("youtube")
-        self.sketchfab = attrs.pop("sketchfab")
-        self.images = [Image(**image) for image in attrs.pop("images", [])] 
+    __slots__ = ("youtube", "sketchfab", "images")
 
+@model(TAG_OPTION)
 class TagOption:
     """Represents a game tag gropup, a category of tags from which a 
     mod may pick one or more.
@@ -352,15 +327,10 @@ class TagOption:
         Array of tags for this group
 
     """
-    def __init__(self, **attrs):
-        self.name = attrs.pop("name")
-        self.type = attrs.pop("type", "dropdown")
-        self.hidden = attrs.pop("hidden", False)
-        self.tags = attrs.pop("tags", [])
-
     def __repr__(self):
         return f"<TagOption name={self.name} hidden={self.hidden}>"
 
+@model(RATING)
 class Rating:
     """Represents a rating, objects obtained from the get_my_ratings endpoint
 
@@ -376,13 +346,6 @@ class Rating:
         UNIX timestamp of whe the rating was added
 
     """
-    def __init__(self, **attrs):
-        self.game = attrs.pop("game_id")
-        self.mod = attrs.pop("mod_id")
-        self.rating = RatingType(attrs.pop("rating"))
-        self.date = _convert_date(attrs.pop("date_added"))
-        self._client = attrs.pop("client")
-
     def delete(self):
         """Sets the rating to neutral.
 
@@ -413,6 +376,7 @@ class Rating:
         |coro|"""
         return self._add_rating(RatingType.bad)
 
+@model(STATS)
 class Stats:
     """Represents a summary of stats for a mod
 
@@ -448,19 +412,8 @@ class Stats:
         Unix timestamp until this mods's statistics are considered stale. Endpoint
         should be polled again when this expires.
     """
-    def __init__(self, **attrs):
-        self.id = attrs.pop("mod_id")
-        self.rank = attrs.pop("popularity_rank_position")
-        self.rank_total = attrs.pop("popularity_rank_total_mods")
-        self.downloads = attrs.pop("downloads_total")
-        self.subscribers = attrs.pop("subscribers_total")
-        self.expires = _convert_date(attrs.pop("date_expires"))
-        self.total = attrs.pop("ratings_total")
-        self.positive = attrs.pop("ratings_positive")
-        self.negative = attrs.pop("ratings_negative")
-        self.percentage = attrs.pop("ratings_percentage_positive")
-        self.weighted = attrs.pop("ratings_weighted_aggregate")
-        self.text = attrs.pop("ratings_display_text")
+    __slots__ = ("id", "rank", "rank_total", "downloads", "subscribers", "expires", "total",
+                 "positive", "negative", "percentage", "weighted", "text")
 
     def __repr__(self):
         return f"<Stats id={self.id} expired={self.is_stale()}>"
@@ -510,6 +463,7 @@ class Dependencies:
     """
     pass
 
+@model(USER)
 class User:
     """Represents a modio user.
 
@@ -533,23 +487,8 @@ class User:
         URL to the user's mod.io profile.
 
     """
-    def __init__(self, **attrs):
-        self.id = attrs.pop("id")
-        self.name_id = attrs.pop("name_id")
-        self.username = attrs.pop("username")
-        self.last_online = _convert_date(attrs.pop("date_online"))
-
-        avatar = attrs.pop("avatar")
-
-        if avatar.keys():
-            self.avatar = Image(**avatar)
-        else:
-            self.avatar = None
-
-        self.tz = attrs.pop("timezone")
-        self.lang = attrs.pop("language")
-        self.profile = attrs.pop("profile_url")
-        self._client = attrs.pop("client")
+    __slots__ = ("id", "name_id", "username", "last_online", "tz", "lang", "profile", "_client",
+                 "avatar")
 
     def __repr__(self):
         return f"<User id={self.id} username={self.username}>"
@@ -585,9 +524,12 @@ class User:
         }
 
         msg = self._client._post_request('/report', data = fields)
-        return Message(**msg)
+        return self._client._model(Message, msg)
+
+lazy(User)
 
 @concat_docs
+@model(TEAM_MEMBER)
 class TeamMember(User):
     """Inherits from User. Represents a user as part of a team.
     Filter-Only Attributes
@@ -616,15 +558,6 @@ class TeamMember(User):
         The mod object the team is attached to.
 
     """
-    def __init__(self, **attrs):
-        self._client = attrs.pop("client")
-        super().__init__(**attrs.pop("user"), client=self._client)
-        self.team_id = attrs.pop("id")
-        self.level = attrs.pop("level")
-        self.date = attrs.pop("date_added")
-        self.position = attrs.pop("position")
-        self.mod = attrs.pop("mod")
-
     def __repr__(self):
         return f"<TeamMember team_id={self.team_id} id={self.id} level={self.level}>"
 
@@ -643,7 +576,7 @@ class TeamMember(User):
         """
         data = {"level" : level.value, "position" : position}
         msg = self._client._put_request(f'/games/{self.mod.game}/mods/{self.mod.id}/team/{self.team_id}', data=data)
-        return Message(**msg)
+        return self._client._model(Message, msg)
 
     def delete(self):
         """Remove the user from the team. Fires a MOD_TEAM_CHANGED event.
@@ -960,6 +893,7 @@ class Filter:
         self._offset = offset
         return self
 
+@model(PAGINATION)
 class Pagination:
     """This class is unique to the library and represents the pagination
     data that some of the endpoints return.
@@ -976,12 +910,6 @@ class Pagination:
         Total number of results avalaible for that endpoint with those filters.
     """
 
-    def __init__(self, **attrs):
-        self.count = attrs.pop("result_count")
-        self.limit = attrs.pop("result_limit")
-        self.offset = attrs.pop("result_offset")
-        self.total = attrs.pop("result_total")
-
     def __repr__(self):
         return f"<Pagination count={self.count} limit={self.limit} offset={self.offset} total={self.total}>"
 
@@ -0,0 +1,154 @@
+import asyncio
+import threading
+import time
+
+class RateLimiter:
+    """Paces the requests made with an API key/access token using the values of
+    the X-RateLimit headers returned by mod.io. Used by both :class:`modio.Client`
+    and :class:`async_modio.Client`, a single instance can be passed to several
+    clients (even a mix of sync and async ones) that share the same key so they
+    draw from the same budget.
+
+    Every request reserves one of the remaining requests before being sent. Once
+    the budget is exhausted requests are queued until the API resets it instead of
+    being sent to be rejected with a 429. Waiting is done by sleeping (or awaiting)
+    until the reset or until an in-flight request returns, there is no busy loop.
+
+    Attributes
+    -----------
+    limit : int
+        Number of requests that can be made using the supplied API Key/access token.
+        None until the first response is received.
+    remaining : int
+        Number of requests remaining. None until the first response is received.
+    retry : int
+        Number of seconds until the rate limits are reset, 0 unless the limit has been
+        reached.
+    waited : float
+        Total number of seconds requests spent queued waiting for the rate limit.
+    """
+    def __init__(self):
+        self.limit = None
+        self.remaining = None
+        self.retry = 0
+        self.waited = 0.0
+        self._reset_at = 0.0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._futures = []
+
+    def __repr__(self):
+        return f"<RateLimiter limit={self.limit} remaining={self.remaining} retry={self.retry}>"
+
+    def _reserve(self):
+        """Reserves a request if the budget allows it and returns 0. Otherwise returns the number
+        of seconds until the budget resets or None if the caller must wait for an in-flight
+        request to return. Must be called with the lock held."""
+        now = time.monotonic()
+        if self._reset_at > now:
+            return self._reset_at - now
+
+        if self._reset_at:
+            #the budget has been reset, it will be known again with the next response and
+            #the requests counted as in flight before the reset do not draw from it
+            self._reset_at = 0.0
+            self.remaining = None
+            self.retry = 0
+            self._in_flight = 0
+
+        if self.remaining is not None and self._in_flight and self.remaining - self._in_flight <= 0:
+            return None
+
+        self._in_flight += 1
+        return 0
+
+    def _notify(self):
+        self._cond.notify_all()
+        for loop, future in self._futures:
+            loop.call_soon_threadsafe(_set_done, future)
+
+    def acquire(self):
+        """Blocks until a request can be sent and reserves it. Returns the number of
+        seconds spent waiting."""
+        waited = 0.0
+        with self._cond:
+            while True:
+                delay = self._reserve()
+                if delay == 0:
+                    return waited
+
+                start = time.monotonic()
+                self._cond.wait(delay)
+                elapsed = time.monotonic() - start
+                self.waited += elapsed
+                waited += elapsed
+
+    async def acquire_async(self):
+        """Waits until a request can be sent and reserves it. Returns the number of
+        seconds spent waiting.
+
+        |coro|"""
+        loop = asyncio.get_event_loop()
+        waited = 0.0
+        while True:
+            with self._lock:
+                delay = self._reserve()
+                if delay == 0:
+                    return waited
+
+                future = loop.create_future()
+                self._futures.append((loop, future))
+
+            start = time.monotonic()
+            try:
+                await asyncio.wait_for(future, delay)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                elapsed = time.monotonic() - start
+                waited += elapsed
+                with self._lock:
+                    self._futures.remove((loop, future))
+                    self.waited += elapsed
+
+    def update(self, headers=None, status=None):
+        """Releases a request reserved with :func:`acquire` and updates the budget from the
+        headers of its response. If the request failed without a response, headers can be
+        omitted.
+
+        Parameters
+        -----------
+        headers : Optional[Mapping[str, str]]
+            The headers of the response
+        status : Optional[int]
+            The status code of the response
+        """
+        with self._cond:
+            self._in_flight = max(self._in_flight - 1, 0)
+            if headers is None:
+                self._notify()
+                return
+
+            limit = headers.get("X-RateLimit-Limit")
+            if limit is not None:
+                self.limit = int(limit)
+
+            remaining = headers.get("X-RateLimit-Remaining")
+            if remaining is not None:
+                self.remaining = int(remaining)
+
+            self.retry = int(headers.get("X-Ratelimit-RetryAfter", 0))
+            if status == 429:
+                #always back off on a 429, even if the API did not say for how long
+                self.remaining = 0
+                self.retry = max(self.retry, 1)
+
+            if self.retry:
+                self._reset_at = time.monotonic() + self.retry
+
+            self._notify()
+
+def _set_done(future):
+    if not future.done():
+        future.set_result(None)
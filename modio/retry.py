@@ -0,0 +1,56 @@
+import random
+
+IDEMPOTENT = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE"))
+
+class RetryPolicy:
+    """Decides which failed requests the clients send again and how long they wait
+    before doing so. Used by both :class:`modio.Client` and :class:`async_modio.Client`.
+
+    Requests rejected with a 429 are always safe to send again as the API did not process
+    them, they wait for X-Ratelimit-RetryAfter through the client's :class:`RateLimiter`
+    rather than for a backoff.
+    Other statuses are only retried for idempotent methods unless `idempotent_only` is
+    False. The wait between two attempts is picked at random between 0 and an exponentially
+    growing backoff ("full jitter") so that many clients failing at once do not retry in lockstep.
+
+    Parameters
+    -----------
+    max_attempts : Optional[int]
+        Maximum number of times a request is sent, including the first one. 1 disables
+        retrying. Default is 5.
+    backoff_base : Optional[float]
+        Backoff in seconds of the first retry, doubled for every following attempt. Default
+        is 0.5.
+    backoff_cap : Optional[float]
+        Maximum backoff in seconds. Default is 30.
+    statuses : Optional[Iterable[int]]
+        Status codes which are retried. Default is 429 and the transient 5xx codes.
+    idempotent_only : Optional[bool]
+        Whether to only retry idempotent methods (GET, PUT, DELETE...) on statuses other
+        than 429. Default is True.
+    """
+    def __init__(self, *, max_attempts = 5, backoff_base = 0.5, backoff_cap = 30.0, statuses = (429, 500, 502, 503, 504), idempotent_only = True):
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.statuses = frozenset(statuses)
+        self.idempotent_only = idempotent_only
+
+    def __repr__(self):
+        return f"<RetryPolicy max_attempts={self.max_attempts} backoff_base={self.backoff_base} backoff_cap={self.backoff_cap}>"
+
+    def should_retry(self, method, status, attempt):
+        """Returns True if a request which received `status` on its `attempt`-th attempt
+        should be sent again."""
+        if attempt >= self.max_attempts or status not in self.statuses:
+            return False
+
+        if status == 429 or not self.idempotent_only:
+            return True
+
+        return method in IDEMPOTENT
+
+    def delay(self, attempt):
+        """Returns the number of seconds to wait before sending the request again after its
+        `attempt`-th attempt failed."""
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1)))
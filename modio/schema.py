@@ -0,0 +1,385 @@
+"""The specs of the models built from the JSON of the API, shared by both packages. Each
+model lists the :class:`Field` it is made of and :func:`model` compiles the specs of a
+class into its `__init__` and `to_dict` methods when the class is defined. Nested models
+are named rather than referenced, so that each package builds its own classes.
+"""
+
+import calendar
+import datetime
+import enum
+import sys
+
+from .enums import (Status, Visibility, Maturity, Presentation, Submission, Curation, Community,
+                    Revenue, APIAccess, MaturityOptions, VirusStatus, RatingType)
+from .utils import _convert_date
+
+_REQUIRED = object()
+
+class Nested:
+    """A model built from an object of the JSON.
+
+    Parameters
+    -----------
+    model : str
+        Name of the class of the model, looked up in the module of the model it is part of
+    many : Optional[bool]
+        Whether the JSON value is a list of objects, each built into a model. Default is False
+    optional : Optional[bool]
+        Whether the attribute is None when the object is empty or null. Default is False
+    context : Dict[str, str]
+        Keyword arguments of the nested model taken from the JSON of the model it is part
+        of, by key, e.g. `client="client"`
+    """
+    __slots__ = ("model", "many", "optional", "context")
+
+    def __init__(self, model, *, many=False, optional=False, **context):
+        self.model = model
+        self.many = many
+        self.optional = optional
+        self.context = context
+
+class Field:
+    """The spec of an attribute of a model.
+
+    Parameters
+    -----------
+    key : Union[str, Tuple[str], None]
+        The key of the value in the JSON, a tuple of keys for a value nested in objects of
+        the JSON. None if `convert` makes the attribute from the whole JSON.
+    name : str
+        Name of the attribute
+    convert : Optional[Union[Callable, Nested, str]]
+        The function converting the JSON value into the attribute, the nested model it is
+        built into or the source of an expression of `{value}` inlined in the compiled
+        code. Default is None, the value is kept as is.
+    default : Optional[Any]
+        The value of the attribute when the key is missing from the JSON, passed to
+        `convert`. The key is required if no default is given.
+    serialize : Optional[bool]
+        Whether the attribute is returned by `to_dict`. Default is True, private attributes
+        are never returned.
+    """
+    __slots__ = ("key", "name", "convert", "default", "serialize")
+
+    def __init__(self, key, name, convert=None, *, default=_REQUIRED, serialize=True):
+        self.key = key
+        self.name = name
+        self.convert = convert
+        self.default = default
+        self.serialize = serialize and not name.startswith("_")
+
+    def __repr__(self):
+        return f"<Field key={self.key} name={self.name}>"
+
+    def _under(self, key):
+        """Returns the field read from the object at `key` of the JSON instead."""
+        path = (key,) + (self.key if isinstance(self.key, tuple) else (self.key,))
+        return Field(path, self.name, self.convert, default=self.default, serialize=self.serialize)
+
+def _expression(field, index, env):
+    """Returns the Python expression building the attribute of a field from `attrs`, the
+    JSON, storing the objects it needs in `env`."""
+    if field.key is None:
+        value = "attrs"
+    elif isinstance(field.key, tuple):
+        value = "attrs" + "".join(f"[{key!r}]" for key in field.key)
+    elif field.default is _REQUIRED:
+        value = f"attrs[{field.key!r}]"
+    else:
+        env[f"d{index}"] = field.default
+        value = f"attrs.get({field.key!r}, d{index})"
+
+    convert = field.convert
+    if convert is None:
+        return value
+
+    if isinstance(convert, Nested):
+        context = "".join(f", {name}=attrs[{key!r}]" for name, key in convert.context.items())
+        if convert.many:
+            return f"[{convert.model}(**item{context}) for item in {value}]"
+
+        build = f"{convert.model}(**{value}{context})"
+        return f"({build} if {value} else None)" if convert.optional else build
+
+    if isinstance(convert, str):
+        return f"({convert.format(value=value)})"
+
+    env[f"c{index}"] = convert
+    if isinstance(convert, enum.EnumMeta):
+        #looking the members up skips the slow call of the enum class for known values
+        env[f"m{index}"] = convert._value2member_map_
+        return f"(m{index}[{value}] if {value} in m{index} else c{index}({value}))"
+
+    return f"c{index}({value})"
+
+def _compile(cls, name, args, body, env):
+    """Compiles a function of the class from its source, global names are looked up in
+    the module of the class so that nested models can be defined after it."""
+    names = ", ".join(env)
+    source = f"def make({names}):\n    def {name}({args}):\n" + "".join(f"        {line}\n" for line in body) + f"    return {name}\n"
+    namespace = {}
+    exec(compile(source, f"<{cls.__module__}.{cls.__qualname__}.{name}>", "exec"), vars(sys.modules[cls.__module__]), namespace)
+    func = namespace["make"](**env)
+    func.__module__ = cls.__module__
+    func.__qualname__ = f"{cls.__qualname__}.{name}"
+    return func
+
+def _dump(value):
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime.datetime):
+        return calendar.timegm(value.utctimetuple())
+    if isinstance(value, list):
+        return [_dump(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _dump(item) for key, item in value.items()}
+
+    return value
+
+def model(fields):
+    """Class decorator generating the `__init__` and `to_dict` methods of a model from the
+    specs of its fields, which are kept in its `_fields` attribute."""
+    def decorator(cls):
+        env = {}
+        body = [f"self.{field.name} = {_expression(field, index, env)}" for index, field in enumerate(fields)]
+        cls.__init__ = _compile(cls, "__init__", "self, **attrs", body, env)
+
+        returned = []
+        for field in fields:
+            if not field.serialize:
+                continue
+
+            value = f"self.{field.name}"
+            returned.append(f"{field.name!r}: {value}" if field.convert is None else f"{field.name!r}: _dump({value})")
+
+        cls.to_dict = _compile(cls, "to_dict", "self", [f"return {{{', '.join(returned)}}}"], {"_dump": _dump})
+        cls.to_dict.__doc__ = ("Returns the public attributes of the model as a dict of JSON values keyed by attribute "
+                               "name: nested models as dicts, enums as their value and datetimes as unix timestamps.")
+        cls._fields = fields
+        return cls
+
+    return decorator
+
+def _builders(cls):
+    """Returns the functions building each field of a model from its JSON, taking the JSON
+    and the model, used by the lazy variants of the models."""
+    env = {}
+    expressions = [_expression(field, index, env) for index, field in enumerate(cls._fields)]
+    body = ["return (" + "".join(f"lambda attrs, self: {expression}, " for expression in expressions) + ")"]
+    return dict(zip((field.name for field in cls._fields), _compile(cls, "builders", "", body, env)()))
+
+#converters
+
+#thumbnails are named after their size which differs between kinds of images, they are
+#picked by position after the filename and original, which the API lists first
+_THUMBNAIL = "list({value}.values())[%d] if len({value}) > %d else None"
+
+def _level(position):
+    return len(position.split("."))
+
+def _children(attrs):
+    return []
+
+def _tags(tags):
+    return {tag["name"] : tag["date_added"] for tag in tags}
+
+#builders of the results of the endpoints listing pairs rather than models, see BaseClient._models
+
+def _tag(*, name, date_added, **fields):
+    return name, _convert_date(date_added)
+
+def _dependency(*, mod_id, date_added, **fields):
+    return mod_id, _convert_date(date_added)
+
+def _metadata(*, metakey, metavalue, **fields):
+    return metakey, metavalue
+
+def _grouped(pairs):
+    """Returns the values of the pairs in lists keyed by their key."""
+    grouped = {}
+    for key, value in pairs:
+        grouped.setdefault(key, []).append(value)
+
+    return grouped
+
+#specs
+
+MESSAGE = (
+    Field("code", "code"),
+    Field("message", "message"),
+)
+
+IMAGE = (
+    Field("filename", "filename"),
+    Field("original", "original"),
+    Field(None, "small", _THUMBNAIL % (4, 4)),
+    Field(None, "medium", _THUMBNAIL % (5, 5)),
+    Field(None, "large", _THUMBNAIL % (6, 6)),
+)
+
+EVENT = (
+    Field("id", "id"),
+    Field("date_added", "date", _convert_date),
+    Field("event_type", "_raw_type"),
+    Field("mod_id", "mod"),
+    Field("user_id", "user"),
+    Field("game_id", "game", default=None),
+)
+
+USER = (
+    Field("id", "id"),
+    Field("name_id", "name_id"),
+    Field("username", "username"),
+    Field("date_online", "last_online", _convert_date),
+    Field("avatar", "avatar", Nested("Image", optional=True)),
+    Field("timezone", "tz"),
+    Field("language", "lang"),
+    Field("profile_url", "profile"),
+    Field("client", "_client"),
+)
+
+TEAM_MEMBER = tuple(field._under("user") for field in USER if field.key != "client") + (
+    Field("client", "_client"),
+    Field("id", "team_id"),
+    Field("level", "level"),
+    Field("date_added", "date"),
+    Field("position", "position"),
+    Field("mod", "mod", serialize=False),
+)
+
+COMMENT = (
+    Field("id", "id"),
+    Field("date_added", "date", _convert_date),
+    Field("reply_id", "parent"),
+    Field("thread_position", "position"),
+    Field("thread_position", "level", _level),
+    Field("karma", "karma"),
+    Field("karma_guest", "karma_guest"),
+    Field("content", "content"),
+    Field("client", "_client"),
+    Field("mod", "mod", serialize=False),
+    Field("user", "submitter", Nested("User", client="client")),
+    Field(None, "children", _children),
+)
+
+MODFILE = (
+    Field("id", "id"),
+    Field("mod_id", "mod"),
+    Field("date_added", "date"),
+    Field("date_scanned", "scanned"),
+    Field("virus_status", "virus_status", VirusStatus),
+    Field("virus_positive", "virus", bool),
+    Field("virustotal_hash", "virus_hash"),
+    Field("filesize", "size"),
+    Field(("filehash", "md5"), "hash"),
+    Field("filename", "filename"),
+    Field("version", "version"),
+    Field("changelog", "changelog"),
+    Field("metadata_blob", "metadata"),
+    Field(("download", "binary_url"), "url"),
+    Field(("download", "date_expires"), "expires", _convert_date),
+    Field("game_id", "game", default=None),
+    Field("client", "_client"),
+)
+
+MODMEDIA = (
+    Field("youtube", "youtube"),
+    Field("sketchfab", "sketchfab"),
+    Field("images", "images", Nested("Image", many=True), default=()),
+)
+
+TAG_OPTION = (
+    Field("name", "name"),
+    Field("type", "type", default="dropdown"),
+    Field("hidden", "hidden", default=False),
+    Field("tags", "tags", list, default=()),
+)
+
+RATING = (
+    Field("game_id", "game"),
+    Field("mod_id", "mod"),
+    Field("rating", "rating", RatingType),
+    Field("date_added", "date", _convert_date),
+    Field("client", "_client"),
+)
+
+STATS = (
+    Field("mod_id", "id"),
+    Field("popularity_rank_position", "rank"),
+    Field("popularity_rank_total_mods", "rank_total"),
+    Field("downloads_total", "downloads"),
+    Field("subscribers_total", "subscribers"),
+    Field("date_expires", "expires", _convert_date),
+    Field("ratings_total", "total"),
+    Field("ratings_positive", "positive"),
+    Field("ratings_negative", "negative"),
+    Field("ratings_percentage_positive", "percentage"),
+    Field("ratings_weighted_aggregate", "weighted"),
+    Field("ratings_display_text", "text"),
+)
+
+PAGINATION = (
+    Field("result_count", "count"),
+    Field("result_limit", "limit"),
+    Field("result_offset", "offset"),
+    Field("result_total", "total"),
+)
+
+GAME = (
+    Field("id", "id"),
+    Field("status", "status", Status),
+    Field("date_added", "date", _convert_date),
+    Field("date_updated", "updated", _convert_date),
+    Field("date_live", "live", _convert_date),
+    Field("presentation_option", "presentation", Presentation),
+    Field("submission_option", "submission", Submission),
+    Field("curation_option", "curation", Curation),
+    Field("community_options", "community", Community),
+    Field("revenue_options", "revenue", Revenue),
+    Field("api_access_options", "api", APIAccess),
+    Field("ugc_name", "ugc"),
+    Field("icon", "icon", Nested("Image")),
+    Field("logo", "logo", Nested("Image")),
+    Field("header", "header", Nested("Image")),
+    Field("homepage", "homepage", default=None),
+    Field("name", "name"),
+    Field("name_id", "name_id"),
+    Field("summary", "summary"),
+    Field("instructions", "instructions", default=None),
+    Field("instructions_url", "instructions_url", default=None),
+    Field("profile_url", "profile"),
+    Field("tag_options", "tag_options", Nested("TagOption", many=True), default=()),
+    Field("maturity_options", "maturity_options", MaturityOptions),
+    Field("client", "_client"),
+    Field("submitted_by", "submitter", Nested("User", client="client")),
+)
+
+MOD = (
+    Field("id", "id"),
+    Field("status", "status", Status),
+    Field("visible", "visible", Visibility),
+    Field("game_id", "game"),
+    Field("date_added", "date", _convert_date),
+    Field("date_updated", "updated", _convert_date),
+    Field("date_live", "live", _convert_date),
+    Field("logo", "logo", Nested("Image")),
+    Field("homepage_url", "homepage", default=None),
+    Field("name", "name"),
+    Field("name_id", "name_id"),
+    Field("summary", "summary"),
+    Field("description", "description"),
+    Field("metadata_blob", "metadata"),
+    Field("profile_url", "profile"),
+    Field("media", "media", Nested("ModMedia")),
+    Field("maturity_option", "maturity", Maturity),
+    Field("stats", "stats", Nested("Stats")),
+    Field("tags", "tags", _tags, default=()),
+    Field("client", "_client"),
+    Field("modfile", "_file", default=None),
+    Field("metadata_kvp", "_kvp_raw"),
+    Field("modfile", "file", Nested("ModFile", optional=True, game_id="game_id", client="client"), default=None),
+    Field("submitted_by", "submitter", Nested("User", client="client")),
+    Field("description_plaintext", "plaintext"),
+)
@@ -0,0 +1,219 @@
+"""Transports send the requests built by the clients and return the raw responses, the
+clients never talk to an HTTP library directly. :class:`modio.Client` uses a
+:class:`RequestsTransport` and :class:`async_modio.Client` an :class:`async_modio.AiohttpTransport`
+unless another transport is passed, e.g. a :class:`MemoryTransport` serving canned JSON
+to benchmark the wrapper without a network, or one built on another HTTP stack.
+"""
+
+import abc
+import collections
+import json
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .cache import _template
+
+Response = collections.namedtuple("Response", "status headers body")
+Response.__doc__ = """The raw response to a request.
+
+Attributes
+-----------
+status : int
+    The status code of the response
+headers : Mapping[str, str]
+    The headers of the response
+body : bytes
+    The content of the response
+"""
+
+class Transport(abc.ABC):
+    """Base class of the transports of :class:`modio.Client`. To plug in another HTTP
+    library subclass it and implement :func:`send` and :func:`close`, transports of
+    :class:`async_modio.Client` implement them as coroutines instead."""
+    @abc.abstractmethod
+    def send(self, method, url, *, headers, params = None, data = None, files = None, on_headers = None):
+        """Sends a request and returns its :class:`Response`. Must be safe to call from
+        several threads at once.
+
+        Parameters
+        -----------
+        method : str
+            The HTTP method
+        url : str
+            The full url of the request
+        headers : Dict[str, str]
+            The headers of the request
+        params : Optional[Dict[str, str]]
+            The query parameters
+        data : Optional[Dict[str, str]]
+            The fields of the form sent as the body, None values must be skipped
+        files : Optional[Dict[str, Union[file, Tuple[str, file]]]]
+            The files to send as a multipart form with the data
+        on_headers : Optional[Callable[[int, Mapping[str, str]], None]]
+            Called with the status and headers of the response as soon as they are received,
+            before the body is read. Used by the client to time the latency of the requests.
+        """
+
+    def close(self):
+        """Releases the resources held by the transport."""
+        pass
+
+class RequestsTransport(Transport):
+    """The default transport of :class:`modio.Client`, sends the requests through a
+    pooled `requests.Session` which keeps the connections to the API alive.
+
+    Parameters
+    -----------
+    pool_size : Optional[int]
+        Maximum number of keep-alive connections held open to the mod.io API by each
+        session. Default is 10.
+    session_per_thread : Optional[bool]
+        Whether each thread gets its own session and connection pool instead of sharing one.
+        Default is False.
+
+    Attributes
+    -----------
+    session : requests.Session
+        The session of the thread which created the transport, shared by every thread
+        unless `session_per_thread` is True.
+    """
+    def __init__(self, *, pool_size = 10, session_per_thread = False):
+        self.pool_size = pool_size
+        self.session = self._new_session()
+        self._local = threading.local() if session_per_thread else None
+        self._sessions = []
+        self._lock = threading.Lock()
+        if session_per_thread:
+            self._local.session = self.session
+
+    def _new_session(self):
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _session(self):
+        if self._local is None:
+            return self.session
+
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = self._new_session()
+            with self._lock:
+                self._sessions.append(session)
+
+        return session
+
+    def send(self, method, url, *, headers, params = None, data = None, files = None, on_headers = None):
+        #streamed so the headers are available before the body is downloaded
+        r = self._session().request(method, url, headers=headers, params=params, data=data, files=files, stream=True)
+        if on_headers is not None:
+            on_headers(r.status_code, r.headers)
+
+        return Response(r.status_code, r.headers, r.content)
+
+    def close(self):
+        self.session.close()
+        with self._lock:
+            for session in self._sessions:
+                session.close()
+
+            self._sessions.clear()
+
+class MemoryTransport(Transport):
+    """A transport answering from canned JSON fixtures instead of the network, used to
+    benchmark and test the object construction, pagination and caching of the wrapper
+    in isolation.
+
+    Fixtures are keyed by method and path, with IDs either given or replaced by {id}
+    to answer every ID, e.g. `"GET /games/{id}/mods/{id}"`. A fixture can be:
+
+    - a dict, returned as is with a 200
+    - a list, a collection which is paginated with the `_offset` and `_limit` parameters
+      of the request and returned in the envelope of the API's list endpoints
+    - a callable taking the method, path, params and data of the request and returning
+      either the JSON to return with a 200 or a `(status, json)` tuple, e.g. to fake errors
+
+    Requests matching no fixture receive a 404 like the API's. Every response carries
+    rate limit headers which never run out.
+
+    Parameters
+    -----------
+    fixtures : Optional[Dict[str, Union[dict, list, Callable]]]
+        The fixtures, more can be added with :func:`add`.
+    prefix : Optional[str]
+        Part of the url preceding the path, the base url of the client. Default is
+        everything up to the version, e.g. https://api.mod.io/v1
+
+    Attributes
+    -----------
+    requests : List[Tuple[str, str, dict]]
+        The method, path and params of every request received
+    """
+    def __init__(self, fixtures = None, *, prefix = None):
+        self.fixtures = {}
+        self.prefix = prefix
+        self.requests = []
+        self._lock = threading.Lock()
+        for route, fixture in (fixtures or {}).items():
+            self.add(route, fixture)
+
+    def add(self, route, fixture):
+        """Adds or replaces a fixture. `route` is a method followed by a path, e.g.
+        `"GET /games/{id}"`."""
+        method, path = route.split(" ", 1)
+        self.fixtures[(method.upper(), path)] = fixture
+
+    def _path(self, url):
+        if self.prefix is not None:
+            return url[len(self.prefix):]
+
+        #https://api.mod.io/v1/games/1 -> /games/1
+        return "/" + url.split("://", 1)[-1].split("/", 2)[-1]
+
+    def _find(self, method, path):
+        fixture = self.fixtures.get((method, path))
+        if fixture is None:
+            fixture = self.fixtures.get((method, _template(path)))
+
+        return fixture
+
+    def respond(self, method, url, params = None, data = None):
+        """Returns the :class:`Response` the transport gives to a request."""
+        path = self._path(url).split("?", 1)[0]
+        params = params or {}
+        with self._lock:
+            self.requests.append((method, path, params))
+
+        fixture = self._find(method, path)
+        status = 200
+        if fixture is None:
+            status, payload = 404, {"error": {"code": 404, "message": "The requested resource could not be found."}}
+        elif callable(fixture):
+            payload = fixture(method, path, params, data)
+            if isinstance(payload, tuple):
+                status, payload = payload
+        elif isinstance(fixture, list):
+            offset = int(params.get("_offset", 0))
+            limit = int(params.get("_limit", 100))
+            page = fixture[offset:offset + limit]
+            payload = {"data": page, "result_count": len(page), "result_offset": offset, "result_limit": limit, "result_total": len(fixture)}
+        else:
+            payload = fixture
+
+        headers = {"X-RateLimit-Limit": "1000000", "X-RateLimit-Remaining": "1000000"}
+        if status == 204 or payload is None:
+            return Response(204, headers, b"")
+
+        headers["Content-Type"] = "application/json"
+        return Response(status, headers, json.dumps(payload).encode())
+
+    def send(self, method, url, *, headers, params = None, data = None, files = None, on_headers = None):
+        response = self.respond(method, url, params, data)
+        if on_headers is not None:
+            on_headers(response.status, response.headers)
+
+        return response
@@ -20,6 +20,7 @@ setup(name='async_modio',
       url='https://github.com/ClementJ18/mod.io',
       packages=['async_modio'],
       install_requires=[
+        'modio==0.2.0',
         'aiohttp==3.4.4'
       ]
      )
\ No newline at end of file
@@ -0,0 +1,22 @@
+import io
+import unittest
+
+from benchmarks import suite
+
+class TestSuite(unittest.TestCase):
+    def test_run(self):
+        results = suite.run(["objects.stats", "filter"], mods=10, min_time=0.001, repeat=2, log=io.StringIO())
+        self.assertEqual(set(results["results"]), {"objects.stats", "filter.build"})
+        stats = results["results"]["objects.stats"]
+        self.assertEqual(stats["per_call"], 10)
+        self.assertLessEqual(stats["min"], stats["median"])
+        self.assertEqual(results["meta"]["mods"], 10)
+
+    def test_compare(self):
+        def results(**medians):
+            return {"results": {name: {"median": median} for name, median in medians.items()}}
+
+        baseline = results(a=1.0, b=1.0, c=1.0)
+        current = results(a=1.05, b=1.5, c=0.5, d=9.0)
+        self.assertEqual(suite.compare(baseline, current, log=io.StringIO()), ["b"])
+        self.assertEqual(suite.compare(baseline, current, threshold=0.01, log=io.StringIO()), ["a", "b"])
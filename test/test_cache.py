@@ -0,0 +1,328 @@
+import asyncio
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+
+import modio
+import async_modio
+from modio import MemoryCache, SQLiteCache
+from modio.cache import CacheEntry
+from modio.transport import Response
+from benchmarks.catalogue import user_json, game_json
+from .utils import run, fixtures, CATALOGUE
+
+def _entry(body, ttl=60):
+    return CacheEntry(body, time.time() + ttl)
+
+class TestMemoryCache(unittest.TestCase):
+    def test_key(self):
+        a = MemoryCache.key("GET", "/games", {"_limit": 100, "id-in": "1,2"}, "en")
+        b = MemoryCache.key("GET", "/games", {"id-in": "1,2", "_limit": "100"}, "en")
+        self.assertEqual(a, b)
+        self.assertNotEqual(a, MemoryCache.key("GET", "/games", {"_limit": 100, "id-in": "1,2"}, "fr"))
+
+        #credentials replace the api_key parameter with a fingerprint
+        key = MemoryCache.key("GET", "/games", {"api_key": "secret"}, "en", "secret")
+        self.assertNotIn("secret", key)
+        self.assertEqual(key, MemoryCache.key("GET", "/games", {}, "en", "secret"))
+        self.assertNotEqual(key, MemoryCache.key("GET", "/games", {}, "en", "other"))
+
+    def test_ttl_for(self):
+        cache = MemoryCache(ttl=10, ttls={"/games/{id}/mods/{id}": 300})
+        self.assertEqual(cache.ttl_for("/games/5/mods/1200"), 300)
+        self.assertEqual(cache.ttl_for("/games/5/mods"), 10)
+
+    def test_expiry(self):
+        cache = MemoryCache()
+        cache.set("a", _entry(b"{}", -1))
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+
+    def test_stale(self):
+        cache = MemoryCache(stale_ttl=10)
+        cache.set("a", _entry(b"{}", -5))
+        cache.set("b", _entry(b"{}", -15))
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+
+        cache.delete("a")
+        cache.delete("a")
+        self.assertEqual((len(cache), cache.size), (0, 0))
+
+    def test_max_entries(self):
+        cache = MemoryCache(max_entries=2)
+        cache.set("a", _entry(b"a"))
+        cache.set("b", _entry(b"b"))
+        cache.get("a")
+        cache.set("c", _entry(b"c"))
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+
+    def test_max_bytes(self):
+        cache = MemoryCache(max_bytes=10)
+        cache.set("a", _entry(b"12345"))
+        cache.set("b", _entry(b"123456"))
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.size, 6)
+
+        cache.set("c", _entry(b"x" * 11))
+        self.assertIsNone(cache.get("c"))
+
+    def test_expired_validators(self):
+        cache = MemoryCache()
+        cache.set("a", CacheEntry(b"{}", time.time() - 1, '"v1"'))
+        cache.set("b", CacheEntry(b"{}", time.time() - 1, None, "Wed, 21 Oct 2015 07:28:00 GMT"))
+        self.assertEqual(cache.get("a").etag, '"v1"')
+        self.assertIsNotNone(cache.get("b"))
+
+class TestSQLiteCache(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "cache.db")
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_shared(self):
+        a = SQLiteCache(self.path)
+        b = SQLiteCache(self.path)
+        a.set("GET /games/1?#en", CacheEntry(b"{}", time.time() + 60, '"v1"'))
+        self.assertEqual(b.get("GET /games/1?#en"), a.get("GET /games/1?#en"))
+        self.assertEqual(b.get("GET /games/1?#en").etag, '"v1"')
+
+        a.close()
+        b.close()
+        self.assertEqual(len(SQLiteCache(self.path)), 1)
+
+    def test_expiry(self):
+        cache = SQLiteCache(self.path)
+        cache.set("a", _entry(b"{}", -1))
+        cache.set("b", CacheEntry(b"{}", time.time() - 1, '"v1"'))
+        self.assertIsNone(cache.get("a"))
+        self.assertIsNotNone(cache.get("b"))
+        self.assertEqual(len(cache), 1)
+
+    def test_bounds(self):
+        cache = SQLiteCache(self.path, max_entries=2, max_bytes=10)
+        cache.set("a", _entry(b"12"))
+        cache.set("b", _entry(b"34"))
+        cache.get("a")
+        cache.set("c", _entry(b"56"))
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+
+        cache.set("d", _entry(b"123456789"))
+        self.assertEqual((len(cache), cache.size), (1, 9))
+
+        cache.set("d", _entry(b"1"))
+        cache.clear()
+        self.assertEqual((len(cache), cache.size), (0, 0))
+
+    def test_busy(self):
+        cache = SQLiteCache(self.path, timeout=1)
+        cache.set("a", _entry(b"{}"))
+
+        #another process writing to the database must not stall lookups and stores
+        other = sqlite3.connect(self.path, isolation_level=None)
+        other.execute("BEGIN IMMEDIATE")
+        start = time.monotonic()
+        self.assertIsNotNone(cache.get("a"))
+        cache.set("b", _entry(b"{}"))
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertIsNone(cache.get("b"))
+
+        #invalidations are not skipped, they fail once `timeout` is over
+        with self.assertRaises(sqlite3.OperationalError):
+            cache.invalidate("/games/1")
+
+        other.execute("ROLLBACK")
+        other.close()
+        cache.set("b", _entry(b"{}"))
+        self.assertIsNotNone(cache.get("b"))
+        cache.close()
+
+class TestInvalidate(unittest.TestCase):
+    keys = [
+        "GET /games?#en",
+        "GET /games/5?#en",
+        "GET /games/5/mods?_limit=100#en",
+        "GET /games/5/mods/2?#en",
+        "GET /games/5/mods/2/files?#fr",
+        "GET /games/5/mods/20?#en",
+        "GET /games/5/mods/3?#en",
+        "GET /games/6?#en",
+    ]
+    kept = ["GET /games/5/mods/20?#en", "GET /games/5/mods/3?#en", "GET /games/6?#en"]
+
+    def check(self, cache):
+        for key in self.keys:
+            cache.set(key, _entry(b"{}"))
+
+        self.assertEqual(cache.invalidate("/games/5/mods/2"), len(self.keys) - len(self.kept))
+        self.assertEqual([key for key in self.keys if cache.get(key) is not None], self.kept)
+
+    def check_siblings(self, cache):
+        cache.clear()
+        keys = [
+            "GET /games/5/mods/2/stats?#en",
+            "GET /games/5/mods/2/events?#en",
+            "GET /games/5/mods/stats?_limit=100#en",
+            "GET /games/5/mods/events?#en",
+            "GET /games/5/mods/3/stats?#en",
+            "GET /games/6/mods/stats?#en",
+        ]
+        for key in keys:
+            cache.set(key, _entry(b"{}"))
+
+        #rating a mod outdates its stats and events and those listed for its game
+        self.assertEqual(cache.invalidate("/games/5/mods/2/ratings"), 4)
+        self.assertEqual([key for key in keys if cache.get(key) is not None], keys[4:])
+
+    def test_memory(self):
+        cache = MemoryCache()
+        self.check(cache)
+        self.check_siblings(cache)
+
+    def test_sqlite(self):
+        with tempfile.TemporaryDirectory() as dir:
+            cache = SQLiteCache(os.path.join(dir, "cache.db"))
+            self.check(cache)
+            self.check_siblings(cache)
+            cache.close()
+
+class ETagTransport(modio.MemoryTransport):
+    """Answers with an ETag and with 304 Not Modified to the requests carrying it."""
+    def __init__(self, fixtures):
+        super().__init__(fixtures)
+        self.headers = []
+
+    def send(self, method, url, *, headers, **fields):
+        self.headers.append(headers)
+        if headers.get("If-None-Match") == '"v1"':
+            return Response(304, {"ETag": '"v1"'}, b"")
+
+        response = super().send(method, url, headers=headers, **fields)
+        return response._replace(headers={**response.headers, "ETag": '"v1"'})
+
+class TestClientCache(unittest.TestCase):
+    def client(self, cache, **options):
+        transport = modio.MemoryTransport({"GET /me": user_json(1), **fixtures()})
+        return modio.Client(transport=transport, cache=cache, **options)
+
+    def test_credentials(self):
+        cache = MemoryCache()
+        first = self.client(cache, auth="first")
+        second = self.client(cache, auth="second")
+        key = self.client(cache, api_key="key")
+        cache.misses = 0
+        for client in (first, second, key):
+            client.get_game(1)
+        self.assertEqual((cache.hits, cache.misses), (0, 3))
+
+        first.get_game(1)
+        self.assertEqual(cache.hits, 1)
+        self.assertFalse(any("first" in key for key in cache._entries))
+
+    def test_revalidate(self):
+        transport = ETagTransport(fixtures())
+        client = modio.Client(api_key="key", transport=transport, cache=MemoryCache(ttl=0))
+        first = client.get_game(5)
+        self.assertNotIn("If-None-Match", transport.headers[-1])
+
+        second = client.get_game(5)
+        self.assertEqual(transport.headers[-1]["If-None-Match"], '"v1"')
+        self.assertEqual(second.name, first.name)
+        self.assertEqual(client.cache.revalidated, 1)
+        self.assertEqual(len(transport.headers), 3)
+
+    def versions(self, release=None):
+        """Fixtures whose game is renamed with each request, the requests after the first
+        wait for `release` to be set."""
+        sent = []
+        def game(method, path, params, data):
+            sent.append(path)
+            if len(sent) > 1 and release is not None:
+                release.wait(5)
+
+            return game_json(1, name=f"Game v{len(sent)}")
+
+        return {**fixtures(), "GET /games/1": game}
+
+    def test_stale(self):
+        release = threading.Event()
+        transport = modio.MemoryTransport(self.versions(release))
+        client = modio.Client(api_key="key", transport=transport, cache=MemoryCache(ttl=0.05, stale_ttl=60))
+        self.assertEqual(client.get_game(1).name, "Game v1")
+        time.sleep(0.1)
+
+        #the expired entry is returned while the refresh is held back
+        self.assertEqual(client.get_game(1).name, "Game v1")
+        self.assertEqual((client.cache.stale, len(client._refreshing)), (1, 1))
+
+        release.set()
+        for _ in range(100):
+            if not client._refreshing:
+                break
+            time.sleep(0.01)
+
+        self.assertEqual(client.get_game(1).name, "Game v2")
+        self.assertEqual(client.cache.hits, 1)
+
+    def test_stale_async(self):
+        async def get():
+            transport = async_modio.MemoryTransport(self.versions())
+            client = async_modio.Client(api_key="key", transport=transport, cache=MemoryCache(ttl=0.05, stale_ttl=60), loop=asyncio.get_event_loop())
+            names = [(await client.get_game(1)).name]
+            await asyncio.sleep(0.1)
+            names.append((await client.get_game(1)).name)
+            await asyncio.gather(*client._refreshes.values())
+            names.append((await client.get_game(1)).name)
+            return names
+
+        self.assertEqual(run(get()), ["Game v1", "Game v1", "Game v2"])
+
+    def test_negative(self):
+        transport = modio.MemoryTransport(fixtures())
+        client = modio.Client(api_key="key", transport=transport, cache=MemoryCache(negative_ttl=60))
+        for _ in range(3):
+            self.assertRaises(modio.NotFound, client.get_user, 1)
+
+        self.assertEqual([path for method, path, params in transport.requests].count("/users/1"), 1)
+
+        #without a negative TTL every request is sent
+        client = modio.Client(api_key="key", transport=transport, cache=MemoryCache())
+        for _ in range(2):
+            self.assertRaises(modio.NotFound, client.get_user, 1)
+
+        self.assertEqual([path for method, path, params in transport.requests].count("/users/1"), 3)
+
+    def test_invalidate(self):
+        mod_json = CATALOGUE.game_mods(1)[0]
+        transport = modio.MemoryTransport({
+            **fixtures(),
+            "GET /me": user_json(1),
+            "GET /games/{id}/mods/{id}": mod_json,
+            "GET /games/{id}/mods/{id}/tags": mod_json["tags"],
+            "POST /games/{id}/mods/{id}/tags": {"code": 201, "message": "Tags added"},
+        })
+        client = modio.Client(api_key="key", auth="token", transport=transport, cache=MemoryCache())
+        game = client.get_game(1)
+        mod = game.get_mod(mod_json["id"])
+        game.get_mod(mod_json["id"])
+        self.assertEqual(client.cache.hits, 1)
+
+        key = next(key for key in client.cache._entries if f"/mods/{mod.id}?" in key)
+        client._flights[key] = object()
+        mod.add_tags("Tag")
+        self.assertNotIn(key, client.cache._entries)
+        self.assertEqual(client._flights, {})
+
+        sent = len(transport.requests)
+        game.get_mod(mod_json["id"])
+        self.assertEqual(len(transport.requests), sent + 1)
+        self.assertEqual(client.cache.hits, 1)
@@ -0,0 +1,178 @@
+import io
+import json
+import unittest
+
+import modio
+import async_modio
+from modio import jsonlib
+from modio.core import BaseClient, MISS, form_fields
+from modio.cache import CacheEntry
+from modio.game import Game
+from modio.mod import Mod
+from benchmarks.server import serve
+from .utils import run, CATALOGUE
+
+class Client(BaseClient):
+    """The sans-IO logic of the clients alone, without any request being sent."""
+    def _revalidate(self, key, url, h_type, extra, entry):
+        pass
+
+class TestBaseClient(unittest.TestCase):
+    def test_abstract(self):
+        #incomplete subclasses fail when created rather than in the middle of a request
+        for base in (BaseClient, modio.Cache, modio.Transport, async_modio.Transport):
+            with self.assertRaises(TypeError):
+                type("Incomplete", (base,), {})()
+
+    def test_json_check(self):
+        client = Client(api_key="key")
+        self.assertEqual(client._json_check({"id": 1}), {"id": 1})
+        for code, error in ((400, modio.BadRequest), (404, modio.NotFound), (410, modio.Gone), (429, modio.TooManyRequests), (500, modio.modioException)):
+            with self.assertRaises(error):
+                client._json_check({"error": {"code": code, "message": "error"}})
+
+        with self.assertRaises(modio.UnprocessableEntity) as cm:
+            client._json_check({"error": {"code": 422, "message": "error", "errors": {"name": "is required"}}})
+        self.assertEqual(cm.exception.errors, {"name": "is required"})
+
+    def test_shared_errors(self):
+        self.assertIs(async_modio.NotFound, modio.NotFound)
+        self.assertIs(async_modio.RatingType, modio.RatingType)
+
+    def test_headers(self):
+        client = Client(api_key="key", auth="token")
+        headers = client._define_headers(0)
+        self.assertIs(client._define_headers(0), headers)
+        self.assertEqual(headers["Authorization"], "Bearer token")
+
+        client.access_token = "other"
+        self.assertEqual(client._define_headers(0)["Authorization"], "Bearer other")
+
+        revalidate = client._request_headers(0, CacheEntry(b"{}", 0, '"v1"'))
+        self.assertEqual(revalidate["If-None-Match"], '"v1"')
+        self.assertNotIn("If-None-Match", client._define_headers(0))
+
+    def test_get_params(self):
+        client = Client(api_key="key")
+        h_type, extra = client._get_params(0, {"filter": modio.Filter().equals(id=3)})
+        self.assertEqual(h_type, 2)
+        self.assertEqual(extra, {"id": 3, "api_key": "key"})
+        self.assertEqual(client._lookup("/games/3", h_type, extra, client._start("GET", "/games/3")), (None, None, MISS))
+
+    def test_form_fields(self):
+        logo = io.BytesIO(b"png")
+        fields = form_fields({"name": "Mod", "summary": None, "visible": 1}, {"logo": ("logo.png", logo), "header": None})
+        self.assertEqual(fields, [
+            ("name", "Mod", None, None),
+            ("visible", "1", None, None),
+            ("logo", logo, "logo.png", "multipart/form-data")
+        ])
+
+    def test_decoding(self):
+        decoded = []
+        def loads(body):
+            decoded.append(body)
+            return json.loads(body)
+
+        self.assertIs(Client().json_loads, jsonlib.loads)
+        client = Client(json_loads=loads)
+        info = client._start("GET", "/games/1")
+        self.assertEqual(client._response("/games/1", 200, {"Content-Type": "application/json"}, b'{"id": 1}', info), {"id": 1})
+        self.assertEqual(client._response("/games/1", 200, {}, b'{"id": 2}', info), {"id": 2})
+        self.assertEqual(decoded, [b'{"id": 1}', b'{"id": 2}'])
+
+        #requests without content or whose content is not JSON return None
+        self.assertIsNone(client._response("/games/1", 204, {}, b"", info))
+        self.assertIsNone(client._response("/games/1", 200, {"Content-Type": "text/plain"}, b"ok", info))
+        with self.assertRaises(modio.NotFound):
+            client._response("/games/1", 404, {"Content-Type": "text/html"}, b"<html>Not Found</html>", info)
+        with self.assertRaises(modio.modioException) as cm:
+            client._response("/games/1", 502, {"Content-Type": "text/html"}, b"<html>Bad Gateway</html>", info)
+        self.assertIn("502", str(cm.exception))
+        self.assertEqual(len(decoded), 2)
+
+    def test_backend(self):
+        body = json.dumps({"data": [{"id": 1, "name": "Mod é"}]}).encode()
+        self.assertEqual(jsonlib.loads(body), json.loads(body))
+        self.assertEqual(jsonlib.BACKEND, "json" if jsonlib.orjson is None else "orjson")
+
+class TestResults(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.catalogue = CATALOGUE
+        cls.server = serve(catalogue=cls.catalogue)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+
+    def _client(self, base=modio.Client, **options):
+        return type("Client", (base,), {"_base_path": self.server.base_url})(api_key="key", **options)
+
+    def test_exclusive(self):
+        with self.assertRaises(ValueError):
+            Client(raw=True, factory=dict)
+
+    def test_raw(self):
+        with self._client(raw=True) as client:
+            game = client.get_game(1)
+            self.assertEqual(game, self.catalogue.games[1])
+
+            users = client.get_users()
+            self.assertEqual(users.results, list(self.catalogue.users.values()))
+            self.assertEqual(users.pagination.total, len(self.catalogue.users))
+            self.assertEqual(list(client.iter_users(filter=modio.Filter().limit(20), keyset=True)), users.results)
+
+            fetched = client.get_users_by_ids([3, 1, 10 ** 6])
+            self.assertEqual(fetched.results, {3: self.catalogue.users[3], 1: self.catalogue.users[1]})
+            self.assertEqual(fetched.missing, [10 ** 6])
+
+    def test_raw_pairs(self):
+        mod_json = self.catalogue.game_mods(1)[0]
+        with self._client() as client:
+            mod = client.get_game(1).get_mod(mod_json["id"])
+            tags = mod.get_tags()
+            self.assertEqual(set(tags.results), {tag["name"] for tag in mod_json["tags"]})
+            self.assertIs(mod.tags, tags.results)
+
+        with self._client(raw=True, metrics=modio.Metrics()) as client:
+            mod = Mod(client=client, **mod_json)
+            tags = mod.get_tags()
+            self.assertEqual(tags.results, mod_json["tags"])
+            self.assertEqual(tags.pagination.total, len(mod_json["tags"]))
+            self.assertEqual(mod.get_dependencies().results, self.catalogue.dependencies.get(mod_json["id"], []))
+            self.assertEqual(client.get_game(1)["id"], 1)
+            self.assertEqual(client.metrics.snapshot()["/games/{id}/mods/{id}/tags"]["histograms"]["build"]["count"], 1)
+
+    def test_factory(self):
+        def factory(model, data, **kwargs):
+            return model(**data, **kwargs) if model is Game else (model.__name__, data)
+
+        with self._client(factory=factory) as client:
+            game = client.get_game(1)
+            self.assertIsInstance(game, Game)
+            mods = game.get_mods().results
+            self.assertEqual([(name, mod["id"]) for name, mod in mods], [("Mod", mod["id"]) for mod in self.catalogue.game_mods(1)])
+
+            #the attributes of the models are only replaced by models
+            tag_options = game.tag_options
+            self.assertEqual(len(game.get_tag_options().results), len(tag_options))
+            self.assertIs(game.tag_options, tag_options)
+            mod = Mod(client=client, **self.catalogue.game_mods(1)[0])
+            tags = mod.tags
+            self.assertEqual(len(mod.get_tags().results), len(tags))
+            self.assertIs(mod.tags, tags)
+            self.assertIsInstance(mod.tags, dict)
+
+            #models rebuilt in place are not passed to the factory
+            client._model(game.__init__, {**self.catalogue.games[1], "name": "Renamed"}, client=client)
+            self.assertEqual(game.name, "Renamed")
+
+    def test_async(self):
+        client = self._client(async_modio.Client, raw=True)
+        try:
+            users = run(client.get_users_by_ids([2, 4]))
+            self.assertEqual(users.results, {2: self.catalogue.users[2], 4: self.catalogue.users[4]})
+            self.assertEqual(run(client.get_game(1)), self.catalogue.games[1])
+        finally:
+            run(client.close())
@@ -0,0 +1,70 @@
+import datetime
+import enum
+import unittest
+
+import modio
+import async_modio
+from modio.mod import Mod
+from modio.game import Game
+from modio.objects import User, ModFile, Stats
+from modio.lazy import _variants
+from async_modio.mod import Mod as AsyncMod
+from .utils import run, fixtures, CATALOGUE
+
+class TestLazy(unittest.TestCase):
+    def assertSameModel(self, eager, lazy):
+        self.assertIsInstance(lazy, type(eager))
+        for name in type(eager).__slots__:
+            value = getattr(lazy, name)
+            self.assertIs(type(value), type(getattr(eager, name)), name)
+            if isinstance(value, (int, str, dict, enum.Enum, datetime.datetime, type(None))):
+                self.assertEqual(value, getattr(eager, name), name)
+
+    def test_attributes(self):
+        mod = CATALOGUE.game_mods(1)[0]
+        self.assertSameModel(Mod(client=None, **mod), _variants[Mod](client=None, **mod))
+        self.assertSameModel(Game(client=None, **CATALOGUE.games[1]), _variants[Game](client=None, **CATALOGUE.games[1]))
+        self.assertSameModel(User(client=None, **mod["submitted_by"]), _variants[User](client=None, **mod["submitted_by"]))
+        self.assertSameModel(ModFile(client=None, game_id=1, **mod["modfile"]), _variants[ModFile](client=None, game_id=1, **mod["modfile"]))
+        self.assertNotIn(Stats, _variants)
+
+    def test_first_access(self):
+        mod = _variants[Mod](client=None, **CATALOGUE.game_mods(1)[0])
+        self.assertEqual(vars(mod).keys(), {"_raw"})
+        self.assertEqual(mod.name, CATALOGUE.game_mods(1)[0]["name"])
+        self.assertIs(mod.stats, mod.stats)
+        self.assertEqual(vars(mod).keys(), {"_raw", "name", "stats"})
+        self.assertEqual(mod.kvp, Mod(client=None, **CATALOGUE.game_mods(1)[0]).kvp)
+
+    def test_assign(self):
+        data = CATALOGUE.game_mods(1)[0]
+        mod = _variants[Mod](client=None, **data)
+        mod.name = "Renamed"
+        self.assertEqual(mod.name, "Renamed")
+
+        #rebuilding in place, as edits do, forgets the attributes read or set
+        mod.__init__(client=None, **{**data, "summary": "Edited"})
+        self.assertEqual(mod.name, data["name"])
+        self.assertEqual(mod.summary, "Edited")
+
+    def test_client(self):
+        client = modio.Client(api_key="test", lazy=True, transport=modio.MemoryTransport(fixtures()))
+        game = client.get_game(1)
+        self.assertIs(type(game), _variants[Game])
+        mods = game.get_mods().results
+        self.assertEqual([mod.id for mod in mods], [mod["id"] for mod in CATALOGUE.game_mods(1)])
+        self.assertTrue(all(type(mod) is _variants[Mod] for mod in mods))
+        #nested models are only built when read and are not lazy themselves
+        self.assertIs(type(mods[0].stats), Stats)
+        self.assertIs(type(mods[0].submitter), User)
+
+        eager = modio.Client(api_key="test", transport=modio.MemoryTransport(fixtures()))
+        self.assertIs(type(eager.get_game(1)), Game)
+
+    def test_async_client(self):
+        client = async_modio.Client(api_key="test", lazy=True, transport=async_modio.MemoryTransport(fixtures()))
+        game = run(client.get_game(1))
+        mods = run(game.get_mods()).results
+        self.assertIsInstance(mods[0], AsyncMod)
+        self.assertIs(type(mods[0]), _variants[AsyncMod])
+        self.assertEqual(mods[0].name, CATALOGUE.game_mods(1)[0]["name"])
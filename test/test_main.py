@@ -8,6 +8,18 @@ import test.test_async_client
 import test.test_async_game
 import test.test_async_mod
 import test.test_async_objects
+import test.test_ratelimit
+import test.test_retry
+import test.test_utils
+import test.test_cache
+import test.test_threads
+import test.test_core
+import test.test_transport
+import test.test_server
+import test.test_benchmarks
+import test.test_metrics
+import test.test_lazy
+import test.test_schema
 
 loader = unittest.TestLoader()
 suite  = unittest.TestSuite()
@@ -20,6 +32,18 @@ suite.addTests(loader.loadTestsFromModule(test.test_async_client))
 suite.addTests(loader.loadTestsFromModule(test.test_async_game))
 suite.addTests(loader.loadTestsFromModule(test.test_async_mod))
 suite.addTests(loader.loadTestsFromModule(test.test_async_objects))
+suite.addTests(loader.loadTestsFromModule(test.test_ratelimit))
+suite.addTests(loader.loadTestsFromModule(test.test_retry))
+suite.addTests(loader.loadTestsFromModule(test.test_utils))
+suite.addTests(loader.loadTestsFromModule(test.test_cache))
+suite.addTests(loader.loadTestsFromModule(test.test_threads))
+suite.addTests(loader.loadTestsFromModule(test.test_core))
+suite.addTests(loader.loadTestsFromModule(test.test_transport))
+suite.addTests(loader.loadTestsFromModule(test.test_server))
+suite.addTests(loader.loadTestsFromModule(test.test_benchmarks))
+suite.addTests(loader.loadTestsFromModule(test.test_metrics))
+suite.addTests(loader.loadTestsFromModule(test.test_lazy))
+suite.addTests(loader.loadTestsFromModule(test.test_schema))
 
 runner = unittest.TextTestRunner(verbosity=3)
 result = runner.run(suite)
@@ -0,0 +1,123 @@
+import asyncio
+import unittest
+
+import modio
+import async_modio
+from modio.metrics import Histogram
+from benchmarks.catalogue import user_json
+from .utils import run, fixtures
+
+class TestHistogram(unittest.TestCase):
+    def test_observe(self):
+        histogram = Histogram((0.1, 1))
+        for value in (0.05, 0.1, 0.5, 3):
+            histogram.observe(value)
+
+        snapshot = histogram.snapshot()
+        self.assertEqual(snapshot["buckets"], {0.1: 2, 1: 3, float("inf"): 4})
+        self.assertEqual(snapshot["count"], 4)
+        self.assertAlmostEqual(snapshot["sum"], 3.65)
+
+class TestMetrics(unittest.TestCase):
+    def setUp(self):
+        self.stages = []
+        self.metrics = modio.Metrics()
+        self.metrics.add_hook(lambda stage, info: self.stages.append((stage, info.endpoint, info.status)))
+
+    def client(self, **options):
+        return modio.Client(api_key="key", transport=modio.MemoryTransport(fixtures()), metrics=self.metrics, retry=modio.RetryPolicy(backoff_base=0.001), **options)
+
+    def test_stages(self):
+        client = self.client()
+        self.stages.clear()
+        game = client.get_game(3)
+
+        self.assertEqual(game.id, 3)
+        self.assertEqual(self.stages, [
+            ("send", "/games/{id}", None),
+            ("headers", "/games/{id}", 200),
+            ("body", "/games/{id}", 200),
+            ("model", "/games/{id}", 200),
+        ])
+
+    def test_counters(self):
+        client = self.client()
+        client.get_games()
+        self.assertRaises(modio.NotFound, client.get_user, 1)
+        client.get_game(7)
+
+        snapshot = self.metrics.snapshot()
+        self.assertEqual(set(snapshot), {"/games", "/users/{id}", "/games/{id}"})
+        games = snapshot["/games"]
+        self.assertEqual(games["requests"], 2)
+        self.assertEqual(games["statuses"], {200: 2})
+        self.assertGreater(games["bytes_received"], 0)
+        for name in ("latency", "duration", "decode", "build"):
+            self.assertEqual(games["histograms"][name]["count"], 2)
+
+        users = snapshot["/users/{id}"]
+        self.assertEqual((users["requests"], users["errors"]), (1, 1))
+        self.assertEqual(users["statuses"], {404: 1})
+        self.assertEqual(users["histograms"]["build"]["count"], 0)
+
+        game = snapshot["/games/{id}"]
+        self.assertEqual((game["requests"], game["sent"], game["retries"]), (1, 2, 1))
+        self.assertEqual(game["statuses"], {503: 1, 200: 1})
+
+    def test_cache(self):
+        client = self.client(cache=modio.MemoryCache())
+        client.get_game(1)
+        self.stages.clear()
+        client.get_game(1)
+
+        self.assertEqual(self.stages, [("model", "/games/{id}", None)])
+        game = self.metrics.snapshot()["/games/{id}"]
+        self.assertEqual((game["requests"], game["sent"]), (2, 1))
+        self.assertEqual((game["cache_hits"], game["cache_misses"]), (1, 1))
+
+    def test_write(self):
+        client = modio.Client(api_key="key", auth="token", transport=modio.MemoryTransport({"GET /me": user_json(1), **fixtures()}), metrics=self.metrics)
+        client._post_request("/report", data={"name": "Report", "summary": None})
+        self.assertEqual(self.metrics.snapshot()["/report"]["bytes_sent"], len("name=Report"))
+
+    def test_prometheus(self):
+        client = self.client()
+        client.get_game(3)
+        text = self.metrics.prometheus()
+
+        self.assertIn('# TYPE modio_requests_total counter', text)
+        self.assertIn('modio_requests_total{endpoint="/games/{id}"} 1', text)
+        self.assertIn('modio_responses_total{endpoint="/games/{id}",status="200"} 1', text)
+        self.assertIn('# TYPE modio_request_latency_seconds histogram', text)
+        self.assertIn('modio_request_build_seconds_bucket{endpoint="/games/{id}",le="+Inf"} 1', text)
+        self.assertIn('modio_request_duration_seconds_count{endpoint="/games/{id}"} 1', text)
+        self.assertTrue(text.endswith("\n"))
+
+    def test_hooks(self):
+        self.assertRaises(ValueError, self.metrics.add_hook, print, ["sent"])
+        seen = []
+        hook = lambda stage, info: seen.append(stage)
+        self.metrics.add_hook(hook, "model")
+        client = self.client()
+        self.assertEqual(seen, ["model"])
+
+        self.metrics.remove_hook(hook)
+        client.get_game(1)
+        self.assertEqual(seen, ["model"])
+
+    def test_async(self):
+        async def get():
+            transport = async_modio.MemoryTransport(fixtures())
+            client = async_modio.Client(api_key="key", transport=transport, metrics=self.metrics, loop=asyncio.get_event_loop())
+            games = await asyncio.gather(client.get_game(2), client.get_game(2), client.get_games())
+            await client.close()
+            return games
+
+        games = run(get())
+        self.assertEqual(games[0].id, games[1].id)
+
+        snapshot = self.metrics.snapshot()
+        self.assertEqual((snapshot["/games/{id}"]["requests"], snapshot["/games/{id}"]["sent"]), (2, 1))
+        self.assertEqual(snapshot["/games/{id}"]["coalesced"], 1)
+        self.assertEqual(snapshot["/games/{id}"]["histograms"]["build"]["count"], 2)
+        self.assertEqual(self.stages.count(("model", "/games", 200)), 1)
@@ -0,0 +1,76 @@
+import asyncio
+import threading
+import time
+import unittest
+
+import async_modio
+from modio import RateLimiter
+from .utils import run, fixtures
+
+class OneLeft(async_modio.MemoryTransport):
+    """Always leaves a single request in the budget, writes take a second to answer."""
+    async def send(self, method, url, **fields):
+        if method != "GET":
+            await asyncio.sleep(1)
+
+        response = await super().send(method, url, **fields)
+        return response._replace(headers={**response.headers, "X-RateLimit-Remaining": "1"})
+
+class TestRateLimiter(unittest.TestCase):
+    def test_update(self):
+        limiter = RateLimiter()
+        limiter.acquire()
+        limiter.update({"X-RateLimit-Limit": "60", "X-RateLimit-Remaining": "59"}, 200)
+
+        self.assertEqual(limiter.limit, 60)
+        self.assertEqual(limiter.remaining, 59)
+        self.assertEqual(limiter.retry, 0)
+
+    def test_wait_for_reset(self):
+        limiter = RateLimiter()
+        limiter.acquire()
+        limiter.update({"X-RateLimit-Remaining": "0", "X-Ratelimit-RetryAfter": "1"}, 200)
+
+        start = time.monotonic()
+        waited = limiter.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.9)
+        self.assertGreater(waited, 0.9)
+        self.assertGreater(limiter.waited, 0.9)
+        self.assertEqual(limiter.acquire(), 0)
+
+    def test_wait_for_in_flight(self):
+        limiter = RateLimiter()
+        limiter.acquire()
+        limiter.update({"X-RateLimit-Remaining": "1"}, 200)
+        limiter.acquire()
+
+        timer = threading.Timer(0.2, limiter.update, args=({"X-RateLimit-Remaining": "5"}, 200))
+        timer.start()
+        start = time.monotonic()
+        limiter.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.15)
+
+    def test_async_wait_for_reset(self):
+        limiter = RateLimiter()
+        limiter.acquire()
+        limiter.update({}, 429)
+
+        start = time.monotonic()
+        waited = run(limiter.acquire_async())
+        self.assertGreaterEqual(time.monotonic() - start, 0.9)
+        self.assertGreater(waited, 0.9)
+
+    def test_cancelled_write(self):
+        async def get():
+            client = async_modio.Client(api_key="key", auth="token", transport=OneLeft(fixtures()), loop=asyncio.get_event_loop())
+            await client.get_game(1)
+            write = asyncio.ensure_future(client._post_request("/report"))
+            await asyncio.sleep(0.05)
+            write.cancel()
+            await asyncio.gather(write, return_exceptions=True)
+
+            #the cancelled write gave its reservation back
+            game = await asyncio.wait_for(client.get_game(2), 2)
+            return game.id, client.ratelimit._in_flight
+
+        self.assertEqual(run(get()), (2, 0))
@@ -0,0 +1,63 @@
+import time
+import unittest
+
+import modio
+import async_modio
+from modio import RetryPolicy
+from benchmarks.catalogue import game_json
+from .utils import run
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_should_retry(self):
+        policy = RetryPolicy(max_attempts=3)
+
+        self.assertTrue(policy.should_retry("GET", 503, 1))
+        self.assertTrue(policy.should_retry("POST", 429, 2))
+        self.assertFalse(policy.should_retry("POST", 503, 1))
+        self.assertFalse(policy.should_retry("GET", 404, 1))
+        self.assertFalse(policy.should_retry("GET", 503, 3))
+
+    def test_non_idempotent(self):
+        policy = RetryPolicy(idempotent_only=False)
+        self.assertTrue(policy.should_retry("POST", 502, 1))
+
+    def test_delay(self):
+        policy = RetryPolicy(backoff_base=1, backoff_cap=4)
+        for attempt in range(1, 10):
+            delay = policy.delay(attempt)
+            self.assertGreaterEqual(delay, 0)
+            self.assertLessEqual(delay, min(4, 2 ** (attempt - 1)))
+
+class TestClientRetry(unittest.TestCase):
+    def fixtures(self):
+        responses = [(429, {"error": {"code": 429, "message": "Too many requests"}}), game_json(1)]
+        return {"GET /games": [], "GET /games/1": lambda method, path, params, data: responses.pop(0)}
+
+    def policy(self):
+        #a backoff longer than the rate limiter's wait, which must not be added to it
+        policy = RetryPolicy()
+        policy.delay = lambda attempt: 5
+        return policy
+
+    def test_429(self):
+        client = modio.Client(api_key="key", transport=modio.MemoryTransport(self.fixtures()), retry=self.policy())
+        start = time.monotonic()
+        self.assertEqual(client.get_game(1).id, 1)
+        elapsed = time.monotonic() - start
+
+        #a 429 without X-Ratelimit-RetryAfter is held back for a second by the rate limiter
+        self.assertGreaterEqual(elapsed, 0.9)
+        self.assertLess(elapsed, 3)
+        self.assertEqual(client.retries, 1)
+
+    def test_429_async(self):
+        async def get():
+            client = async_modio.Client(api_key="key", transport=async_modio.MemoryTransport(self.fixtures()), retry=self.policy())
+            start = time.monotonic()
+            game = await client.get_game(1)
+            return game.id, time.monotonic() - start
+
+        id, elapsed = run(get())
+        self.assertEqual(id, 1)
+        self.assertGreaterEqual(elapsed, 0.9)
+        self.assertLess(elapsed, 3)
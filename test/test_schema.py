@@ -0,0 +1,65 @@
+import json
+import unittest
+
+from modio.mod import Mod
+from modio.game import Game
+from modio.objects import User, Image, TagOption, Comment, TeamMember, Pagination, Message
+from modio.schema import Field, Nested, model
+from async_modio.mod import Mod as AsyncMod
+from async_modio.objects import User as AsyncUser
+from .utils import CATALOGUE
+
+class TestSchema(unittest.TestCase):
+    def setUp(self):
+        self.json = CATALOGUE.game_mods(1)[0]
+        self.mod = Mod(client=None, **self.json)
+
+    def test_compiled(self):
+        for cls in (Mod, Game, User, Image, TagOption, Comment, TeamMember, Pagination, Message):
+            self.assertEqual(cls.__init__.__qualname__, f"{cls.__name__}.__init__")
+            self.assertTrue(cls._fields)
+
+    def test_nested(self):
+        #nested models are looked up in the package of the model
+        self.assertIs(type(self.mod.submitter), User)
+        self.assertIs(type(AsyncMod(client=None, **self.json).submitter), AsyncUser)
+        self.assertEqual(self.mod.file.game, self.json["game_id"])
+        self.assertIsNone(Mod(client=None, **{**self.json, "modfile": None}).file)
+        self.assertIsNone(User(client=None, **{**self.json["submitted_by"], "avatar": {}}).avatar)
+
+    def test_defaults(self):
+        first, second = TagOption(name="Theme"), TagOption(name="Type")
+        self.assertEqual((first.type, first.hidden, first.tags), ("dropdown", False, []))
+        self.assertIsNot(first.tags, second.tags)
+
+        with self.assertRaises(KeyError):
+            Pagination(result_count=1)
+
+    def test_images(self):
+        image = Image(filename="a.png", original="o", thumb_1="1", thumb_2="2", thumb_3="3")
+        self.assertEqual((image.small, image.medium, image.large), ("3", None, None))
+        self.assertIsNone(Image(filename="a.png", original="o").small)
+
+    def test_to_dict(self):
+        data = self.mod.to_dict()
+        self.assertEqual(data["id"], self.json["id"])
+        self.assertEqual(data["status"], self.json["status"])
+        self.assertEqual(data["date"], self.json["date_added"])
+        self.assertEqual(data["submitter"]["username"], self.json["submitted_by"]["username"])
+        self.assertEqual(data["stats"]["downloads"], self.json["stats"]["downloads_total"])
+        self.assertEqual(data["file"]["hash"], self.json["modfile"]["filehash"]["md5"])
+        self.assertNotIn("_client", data)
+        self.assertNotIn("_kvp_raw", data)
+        json.dumps(data)
+
+        comment = CATALOGUE.comments[1][0]
+        self.assertNotIn("mod", Comment(client=None, mod=self.mod, **comment).to_dict())
+
+    def test_model(self):
+        @model((Field("id", "id"), Field(("meta", "size"), "size", int), Field("names", "names", "[name.upper() for name in {value}]", default=())))
+        class Thing:
+            __slots__ = ("id", "size", "names")
+
+        thing = Thing(id=1, meta={"size": "12"})
+        self.assertEqual((thing.id, thing.size, thing.names), (1, 12, []))
+        self.assertEqual(Thing(id=2, meta={"size": 1}, names=["a"]).to_dict(), {"id": 2, "size": 1, "names": ["A"]})
@@ -0,0 +1,109 @@
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+
+import requests
+
+import modio
+import async_modio
+from benchmarks.catalogue import Catalogue
+from benchmarks.server import serve
+
+def _client(server, base=modio.Client):
+    return type("Client", (base,), {"_base_path": server.base_url})
+
+class TestStandIn(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = serve(catalogue=Catalogue(mods=150, files=1))
+        cls.client = _client(cls.server)(api_key="key")
+        cls.user = _client(cls.server)(api_key="key", auth="token")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.client.close()
+        cls.user.close()
+        cls.server.shutdown()
+
+    def test_catalogue(self):
+        self.assertEqual(Catalogue(seed=3).mods, Catalogue(seed=3).mods)
+        self.assertNotEqual(Catalogue(seed=3).mods, Catalogue(seed=4).mods)
+
+    def test_pagination(self):
+        game = self.client.get_game(1)
+        self.assertEqual([mod.id for mod in game.iter_mods()], list(range(1, 151)))
+
+        page = game.get_mods(filter=modio.Filter().offset(140))
+        self.assertEqual(len(page.results), 10)
+        self.assertEqual(page.pagination.total, 150)
+
+    def test_filters(self):
+        game = self.client.get_game(2)
+        mods = game.get_mods(filter=modio.Filter().values_in(id=[151, 152, 3]).sort("id", reverse=True)).results
+        self.assertEqual([mod.id for mod in mods], [152, 151])
+        mods = game.get_mods(filter=modio.Filter().max(id=160).min(id=155)).results
+        self.assertEqual([mod.id for mod in mods], list(range(155, 161)))
+
+    def test_download(self):
+        mod = self.client.get_game(1).get_mod(1)
+        r = requests.get(mod.file.url)
+        self.assertEqual(len(r.content), mod.file.size)
+        self.assertEqual(requests.get(mod.file.url.replace("signature=", "signature=0")).status_code, 403)
+
+        standin = self.server.standin
+        standin.url_ttl = -1
+        try:
+            expired = self.client.get_game(1).get_mod(1).file.url
+        finally:
+            standin.url_ttl = 300
+
+        self.assertEqual(requests.get(expired).status_code, 410)
+
+    def test_upload(self):
+        path = os.path.join(tempfile.mkdtemp(), "mod.zip")
+        with open(path, "wb") as f:
+            f.write(b"mod" * 1000)
+
+        mod = self.user.get_game(1).get_mod(2)
+        new = modio.NewModFile(version="2.0", changelog="Changes")
+        new.add_file(path)
+        file = mod.add_file(new)
+        self.assertEqual(file.size, 3000)
+        self.assertEqual(file.hash, new.filehash)
+        self.assertEqual(requests.get(file.url).content, b"mod" * 1000)
+        self.assertEqual(self.user.get_game(1).get_mod(2).file.id, file.id)
+
+        async def run():
+            client = _client(self.server, async_modio.Client)(api_key="key", auth="token", loop=asyncio.get_running_loop())
+            new = async_modio.NewModFile(version="3.0", changelog="Changes")
+            new.add_file(path)
+            mod = await (await client.get_game(1)).get_mod(2)
+            file = await mod.add_file(new)
+            await client.close()
+            return file
+
+        #a private loop, asyncio.run would unset the loop other tests get from get_event_loop
+        loop = asyncio.new_event_loop()
+        try:
+            self.assertEqual(loop.run_until_complete(run()).size, 3000)
+        finally:
+            loop.close()
+
+    def test_errors(self):
+        self.assertRaises(modio.NotFound, self.client.get_game, 3)
+        self.assertRaises(modio.Unauthorized, self.client.get_my_subs)
+
+    def test_rate_limit(self):
+        server = serve(catalogue=Catalogue(mods=1), rate_limit=2, rate_window=1)
+        try:
+            client = _client(server)(api_key="key")
+            start = time.monotonic()
+            client.get_game(1)
+            client.get_game(1)
+            self.assertGreaterEqual(time.monotonic() - start, 0.9)
+            self.assertEqual(server.standin.limited, 1)
+            self.assertEqual(client.retries, 1)
+        finally:
+            server.shutdown()
@@ -0,0 +1,176 @@
+import asyncio
+import json
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import modio
+import async_modio
+from modio import MemoryCache
+from modio.cache import CacheEntry
+from .utils import run, fixtures
+
+GAME = {"id": 1, "name": "Game 1", "name_id": "game-1"}
+
+class Response:
+    status_code = 200
+
+    def __init__(self, payload):
+        self.content = json.dumps(payload).encode()
+        self.headers = {"X-RateLimit-Limit": "1000", "X-RateLimit-Remaining": "1000"}
+
+    def json(self):
+        return json.loads(self.content)
+
+class Session:
+    """Stands in for requests.Session, answers every request after a short delay."""
+    def __init__(self):
+        self.sent = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def mount(self, prefix, adapter):
+        pass
+
+    def request(self, method, url, **fields):
+        self.sent.append((method, url))
+        self.release.wait()
+        time.sleep(0.01)
+        if url.endswith("/games"):
+            return Response({"data": [], "result_count": 0, "result_offset": 0, "result_limit": 100, "result_total": 0})
+
+        return Response({"error": {"code": 404, "message": "Not found"}} if url.endswith("/0") else {"id": int(url.rsplit("/", 1)[1])})
+
+    def close(self):
+        pass
+
+def _client(**kwargs):
+    with mock.patch("modio.transport.requests.Session", Session):
+        return modio.Client(api_key="key", **kwargs)
+
+class TestThreadSafety(unittest.TestCase):
+    def test_coalesce(self):
+        client = _client()
+        client.transport.session.release.clear()
+        with ThreadPoolExecutor(16) as executor:
+            futures = [executor.submit(client._get_request, "/games/5") for _ in range(16)]
+            time.sleep(0.1)
+            client.transport.session.release.set()
+            results = [future.result() for future in futures]
+
+        self.assertEqual(len(client.transport.session.sent), 2)
+        self.assertEqual(client.coalesced, 15)
+        self.assertTrue(all(result == {"id": 5} for result in results))
+        self.assertEqual(len({id(result) for result in results}), 16)
+
+    def test_coalesce_error(self):
+        client = _client()
+        client.transport.session.release.clear()
+        with ThreadPoolExecutor(4) as executor:
+            futures = [executor.submit(client._get_request, "/games/0") for _ in range(4)]
+            time.sleep(0.1)
+            client.transport.session.release.set()
+            for future in futures:
+                self.assertRaises(modio.NotFound, future.result)
+
+        self.assertEqual(len(client.transport.session.sent), 2)
+        self.assertEqual(client._flights, {})
+
+    def test_cache(self):
+        client = _client(cache=MemoryCache(max_entries=8))
+        client.cache.misses = 0
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(lambda i: client._get_request(f"/games/{i % 20 + 1}"), range(400)))
+
+        self.assertEqual(results, [{"id": i % 20 + 1} for i in range(400)])
+        self.assertEqual(client.cache.hits + client.cache.misses, 400)
+        self.assertLessEqual(len(client.cache), 8)
+        self.assertEqual(client.rate_limit, 1000)
+
+    def test_session_per_thread(self):
+        client = _client(session_per_thread=True)
+        sessions = set()
+        with mock.patch("modio.transport.requests.Session", Session):
+            with ThreadPoolExecutor(4) as executor:
+                list(executor.map(lambda i: sessions.add(id(client.transport._session())), range(40)))
+
+        self.assertLessEqual(len(sessions), 4)
+        self.assertEqual(len(client.transport._sessions), len(sessions))
+        client.close()
+        self.assertEqual(client.transport._sessions, [])
+
+class SlowTransport(async_modio.MemoryTransport):
+    async def send(self, method, url, **fields):
+        await asyncio.sleep(0.05)
+        return await super().send(method, url, **fields)
+
+class TestAsyncCoalesce(unittest.TestCase):
+    def gather(self, path, n):
+        async def get():
+            client = async_modio.Client(api_key="key", transport=SlowTransport(fixtures()), loop=asyncio.get_event_loop())
+            results = await asyncio.gather(*(client._get_request(path) for _ in range(n)), return_exceptions=True)
+            return client, results
+
+        return run(get())
+
+    def test_coalesce(self):
+        client, results = self.gather("/games/5", 16)
+        self.assertEqual([path for method, path, params in client.transport.requests], ["/games/5"])
+        self.assertEqual(client.coalesced, 15)
+        self.assertTrue(all(result["id"] == 5 for result in results))
+        self.assertEqual(len({id(result) for result in results}), 16)
+        self.assertEqual(client._flights, {})
+
+    def test_coalesce_error(self):
+        client, results = self.gather("/games/13", 4)
+        self.assertEqual(len(client.transport.requests), 1)
+        self.assertEqual(client.coalesced, 3)
+        self.assertIsInstance(results[0], modio.Gone)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(client._flights, {})
+
+class TestBatch(unittest.TestCase):
+    def test_batch(self):
+        client = _client(workers=4)
+        results = client.batch([(client._get_request, f"/games/{i}") for i in range(1, 21)])
+        self.assertEqual(results, [{"id": i} for i in range(1, 21)])
+
+        results = client.batch([lambda: client._get_request("/games/1"), (client._get_request, "/games/0")], return_exceptions=True)
+        self.assertEqual(results[0], {"id": 1})
+        self.assertIsInstance(results[1], modio.NotFound)
+        with self.assertRaises(modio.NotFound):
+            client.batch([(client._get_request, "/games/0")])
+
+    def test_nested(self):
+        client = _client(workers=2)
+        inner = lambda: client.batch([(client._get_request, f"/games/{i}") for i in range(1, 4)])
+        self.assertEqual(client.batch([inner, inner, inner]), [[{"id": i} for i in range(1, 4)]] * 3)
+
+    def test_close(self):
+        client = _client(workers=1)
+        client.transport.session.release.clear()
+        futures = [client.submit(client._get_request, f"/games/{i}") for i in range(1, 4)]
+        threading.Timer(0.05, client.transport.session.release.set).start()
+        client.close()
+
+        self.assertEqual(futures[0].result(), {"id": 1})
+        self.assertTrue(futures[2].cancelled())
+
+class TestMemoryCacheThreads(unittest.TestCase):
+    def test_concurrent(self):
+        cache = MemoryCache(max_entries=50, max_bytes=400)
+
+        def work(i):
+            key = str(i % 100)
+            cache.set(key, CacheEntry(b"x" * (i % 10), time.time() + 60))
+            cache.get(str((i * 7) % 100))
+            if i % 13 == 0:
+                cache.invalidate("/games")
+
+        with ThreadPoolExecutor(8) as executor:
+            list(executor.map(work, range(5000)))
+
+        self.assertLessEqual(len(cache), 50)
+        self.assertEqual(cache.size, sum(len(entry.body) for entry in cache._entries.values()))
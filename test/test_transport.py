@@ -0,0 +1,53 @@
+import asyncio
+import unittest
+
+import modio
+import async_modio
+from modio.mod import Mod
+from benchmarks.catalogue import user_json
+from .utils import run, fixtures, CATALOGUE
+
+class TestMemoryTransport(unittest.TestCase):
+    def test_client(self):
+        transport = modio.MemoryTransport(fixtures())
+        with modio.Client(api_key="key", transport=transport) as client:
+            self.assertEqual(client.get_game(5).name, "Game 5")
+            self.assertRaises(modio.Gone, client.get_game, 13)
+            self.assertRaises(modio.NotFound, client.get_user, 1)
+            self.assertEqual([game.id for game in client.iter_games()], list(range(1, 251)))
+
+        self.assertEqual(transport.requests[-3:], [
+            ("GET", "/games", {"_offset": 0, "_limit": 100, "api_key": "key"}),
+            ("GET", "/games", {"_offset": 100, "_limit": 100, "api_key": "key"}),
+            ("GET", "/games", {"_offset": 200, "_limit": 100, "api_key": "key"}),
+        ])
+        self.assertEqual(client.rate_remain, 1000000)
+
+    def test_cache(self):
+        transport = modio.MemoryTransport(fixtures())
+        client = modio.Client(api_key="key", transport=transport, cache=modio.MemoryCache())
+        client.get_game(1)
+        client.get_game(1)
+        self.assertEqual(len(transport.requests), 2)
+
+    def test_no_content(self):
+        transport = modio.MemoryTransport({"GET /me": user_json(1), "DELETE /games/{id}/mods/{id}": lambda method, path, params, data: (204, None)})
+        client = modio.Client(auth="token", transport=transport)
+        mod = Mod(client=client, **CATALOGUE.game_mods(1)[0])
+        self.assertIsNone(mod.delete())
+        self.assertEqual(transport.requests[-1][:2], ("DELETE", f"/games/1/mods/{mod.id}"))
+
+    def test_async_client(self):
+        async def get():
+            transport = async_modio.MemoryTransport(fixtures())
+            client = async_modio.Client(api_key="key", transport=transport, loop=asyncio.get_running_loop())
+            game = await client.get_game(5)
+            self.assertIsNone(client.session)
+            games = [game.id async for game in client.iter_games(filter=async_modio.Filter().limit(50))]
+            await client.close()
+            return game, games, len(transport.requests)
+
+        game, games, sent = run(get())
+        self.assertEqual(game.name, "Game 5")
+        self.assertEqual(games, list(range(1, 251)))
+        self.assertEqual(sent, 6)
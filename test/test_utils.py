@@ -0,0 +1,133 @@
+import asyncio
+import unittest
+import modio
+import async_modio
+
+from modio.objects import Returned, Pagination
+from modio.utils import _paginate, _chunk_ids, find, get
+from modio.mod import Mod
+from async_modio.mod import Mod as AsyncMod
+from async_modio.utils import _paginate as _async_paginate
+from .utils import run, CATALOGUE
+
+class _Result:
+    def __init__(self, id):
+        self.id = id
+
+TOTAL = 250
+
+def _page(filter):
+    offset, limit = filter._offset, filter._limit
+    results = list(range(offset, min(offset + limit, TOTAL)))
+    pagination = Pagination(result_count=len(results), result_limit=limit, result_offset=offset, result_total=TOTAL)
+    return Returned(results, pagination)
+
+class TestPaginate(unittest.TestCase):
+    def setUp(self):
+        self.filters = []
+
+    def get(self, *, filter=None):
+        self.filters.append((filter._offset, filter._limit))
+        return _page(filter)
+
+    async def get_async(self, *, filter=None):
+        #later pages answer first to check results are still yielded in order
+        await asyncio.sleep((TOTAL - filter._offset) / 10000)
+        return self.get(filter=filter)
+
+    def test_paginate(self):
+        self.assertEqual(list(_paginate(self.get, modio.Filter())), list(range(TOTAL)))
+        self.assertEqual(self.filters, [(0, 100), (100, 100), (200, 100)])
+
+    def test_paginate_offset(self):
+        filter = modio.Filter().limit(60).offset(200)
+        self.assertEqual(list(_paginate(self.get, filter)), list(range(200, TOTAL)))
+        self.assertEqual(filter._offset, 200)
+
+    def test_paginate_async(self):
+        async def collect():
+            return [x async for x in _async_paginate(self.get_async, async_modio.Filter())]
+
+        self.assertEqual(run(collect()), list(range(TOTAL)))
+
+    def test_paginate_concurrent(self):
+        async def collect():
+            return [x async for x in _async_paginate(self.get_async, async_modio.Filter().limit(20), 4)]
+
+        self.assertEqual(run(collect()), list(range(TOTAL)))
+        self.assertEqual(sorted(self.filters), [(offset, 20) for offset in range(0, TOTAL, 20)])
+
+    def test_paginate_concurrency(self):
+        #no page past the first one would ever be requested
+        for concurrency in (0, -1):
+            with self.assertRaises(ValueError):
+                _async_paginate(self.get_async, async_modio.Filter(), concurrency)
+
+        self.assertEqual(self.filters, [])
+        with self.assertRaises(ValueError):
+            AsyncMod(client=None, **CATALOGUE.game_mods(1)[0]).iter_files(concurrency=0)
+
+    def get_keyset(self, *, filter=None):
+        self.filters.append(dict(filter.__dict__))
+        cursor = getattr(filter, "id-gt", -1)
+        results = [_Result(x) for x in self.catalogue if x > cursor][:filter._limit]
+        #a result is inserted at the start of the catalogue while walking it
+        self.catalogue.insert(0, -len(self.filters))
+        pagination = Pagination(result_count=len(results), result_limit=filter._limit, result_offset=0, result_total=len(self.catalogue))
+        return Returned(results, pagination)
+
+    def test_paginate_keyset(self):
+        self.catalogue = list(range(TOTAL))
+        results = [x.id for x in _paginate(self.get_keyset, modio.Filter().limit(100).offset(20), "id")]
+
+        self.assertEqual(results, list(range(TOTAL)))
+        self.assertEqual(self.filters[0]["_sort"], "id")
+        self.assertEqual(self.filters[0]["_offset"], 0)
+        self.assertEqual(self.filters[-1]["id-gt"], 199)
+
+    def test_paginate_keyset_async(self):
+        async def get(*, filter=None):
+            return self.get_keyset(filter=filter)
+
+        async def collect():
+            return [x.id async for x in _async_paginate(get, async_modio.Filter().limit(30), 4, "id")]
+
+        self.catalogue = list(range(TOTAL))
+        self.assertEqual(run(collect()), list(range(TOTAL)))
+
+class TestChunkIds(unittest.TestCase):
+    def test_size(self):
+        chunks = list(_chunk_ids(range(250)))
+        self.assertEqual([len(chunk) for chunk in chunks], [100, 100, 50])
+
+    def test_length(self):
+        ids = list(range(10 ** 9, 10 ** 9 + 100))
+        for chunk in _chunk_ids(ids, length=200):
+            self.assertLessEqual(len(",".join(str(x) for x in chunk)), 200)
+
+        self.assertEqual(sum(_chunk_ids(ids, length=200), []), ids)
+
+    def test_duplicates(self):
+        self.assertEqual(list(_chunk_ids([3, 1, 3, 2, 1])), [[3, 1, 2]])
+
+class TestFind(unittest.TestCase):
+    def setUp(self):
+        self.mods = [Mod(client=None, **mod) for mod in CATALOGUE.game_mods(1)]
+
+    def test_slots(self):
+        for mod in (self.mods[0], AsyncMod(client=None, **CATALOGUE.game_mods(1)[0])):
+            self.assertFalse(hasattr(mod, "__dict__"))
+            for nested in (mod.submitter, mod.stats, mod.media, mod.logo, mod.file):
+                self.assertFalse(hasattr(nested, "__dict__"))
+
+    def test_find(self):
+        mod = self.mods[2]
+        self.assertIs(find(self.mods, id=mod.id), mod)
+        self.assertIs(find(self.mods, name=mod.name, game=1), mod)
+        self.assertIsNone(find(self.mods, id=mod.id, game=2))
+        self.assertIsNone(find(self.mods, missing=None))
+
+    def test_get(self):
+        self.assertEqual(get(self.mods, game=1), self.mods)
+        self.assertEqual(get(self.mods, id=self.mods[0].id), self.mods[:1])
+        self.assertEqual(get(self.mods, missing=1), [])
@@ -1,4 +1,31 @@
 import asyncio
 
+from benchmarks.catalogue import Catalogue, game_json
+
+#a small catalogue shared by the tests building models or serving them
+CATALOGUE = Catalogue(games=1, mods=5, files=1, file_size=(16, 16))
+GAMES = [game_json(id) for id in range(1, 251)]
+
 def run(coro):
-    return asyncio.get_event_loop().run_until_complete(coro)
\ No newline at end of file
+    return asyncio.get_event_loop().run_until_complete(coro)
+
+def fixtures():
+    """Returns new MemoryTransport fixtures: 250 games, the mods of the first game of CATALOGUE,
+    a game which is Gone (13) and one failing every other request with a 503 (7)."""
+    failures = []
+
+    def flaky(method, path, params, data):
+        failures.append(path)
+        if len(failures) % 2:
+            return 503, {"error": {"code": 503, "message": "Unavailable"}}
+
+        return game_json(7)
+
+    return {
+        "GET /games": GAMES,
+        "GET /games/{id}": lambda method, path, params, data: game_json(int(path.rsplit("/", 1)[1])),
+        "GET /games/{id}/mods": CATALOGUE.game_mods(1),
+        "GET /games/7": flaky,
+        "GET /games/13": lambda method, path, params, data: (410, {"error": {"code": 410, "message": "Gone"}}),
+        "POST /report": {"code": 201, "message": "Reported"},
+    }